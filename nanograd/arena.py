@@ -0,0 +1,258 @@
+"""
+Definition of the Arena object: a computational graph stored column-wise.
+
+The nodes of an arena are rows of flat typed arrays: the data, the gradient, the
+`requires_grad` flag and the opcode, i.e. the index of the operation in `Operation`.
+The operands of the node `i` are the rows `operands[offsets[i]:offsets[i + 1]]`, in the
+compressed sparse row layout. An ArenaScalar object is only a handle on a row.
+
+Since a node is always appended after its operands, the rows are in topological order:
+the backward pass is a single sweep over the rows, from the root down to the first
+row, without any sort. The gradients can be exported without copy with
+`numpy.frombuffer(arena.grad)`, and reset in bulk with `Arena.zero_grad`.
+"""
+
+from array import array
+from typing import Union
+from .enums import Operation
+from .grad_mode import GradMode
+from .rules import FORWARD_RULES, LOCAL_GRADIENTS
+
+OPERATIONS = list(Operation)
+NONE = OPERATIONS.index(Operation.NONE)
+SUM = OPERATIONS.index(Operation.SUM)
+
+# Local gradient rules indexed by opcode.
+_RULES = [LOCAL_GRADIENTS.get(op) for op in OPERATIONS]
+
+
+class Arena:
+    """Column-wise storage of the nodes of computational graphs."""
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.data = array("d")
+        self.grad = array("d")
+        self.requires_grad = array("b")
+        self.ops = array("b")
+        self.offsets = array("q", [0])
+        self.operands = array("q")
+
+    def __len__(self) -> int:
+        """Number of nodes of the arena."""
+        return len(self.data)
+
+    def scalar(
+        self, data: int | float, requires_grad: bool = False
+    ) -> "ArenaScalar":
+        """Append a leaf holding `data` and return its handle."""
+        return ArenaScalar(self, self._append(data, requires_grad, NONE, ()))
+
+    def _append(
+        self, data: float, requires_grad: bool, op: int, operands: tuple[int, ...]
+    ) -> int:
+        """Append a node and return its row."""
+        self.data.append(data)
+        self.grad.append(0.0)
+        self.requires_grad.append(requires_grad)
+        self.ops.append(op)
+        self.operands.extend(operands)
+        self.offsets.append(len(self.operands))
+        return len(self.data) - 1
+
+    def _row(self, x: Union[int, float, "ArenaScalar"]) -> int:
+        """Row of the operand `x`, a number being appended as a constant leaf."""
+        if isinstance(x, ArenaScalar):
+            if x.arena is not self:
+                raise ValueError("The operands belong to different arenas.")
+            return x.index
+        if not isinstance(x, (int, float)):
+            raise TypeError(f"The following type {type(x)} is not supported.")
+        return self._append(x, False, NONE, ())
+
+    def apply(
+        self, op: Operation, *operands: Union[int, float, "ArenaScalar"]
+    ) -> "ArenaScalar":
+        """Append the node of the operation `op` applied to `operands`."""
+        rows = tuple(self._row(x) for x in operands)
+        data = self.data
+        value = FORWARD_RULES[op](*[data[i] for i in rows])
+        # Without gradient, only the data of the output is stored.
+        if not GradMode.enabled:
+            return ArenaScalar(self, self._append(value, False, NONE, ()))
+        requires_grad = any(self.requires_grad[i] for i in rows)
+        return ArenaScalar(
+            self, self._append(value, requires_grad, OPERATIONS.index(op), rows)
+        )
+
+    def sum(
+        self, items: list[Union[int, float, "ArenaScalar"]]
+    ) -> "ArenaScalar":
+        """Sum operator, a single node whatever the number of operands."""
+        return self.apply(Operation.SUM, *items)
+
+    def dot(
+        self,
+        ws: list[Union[int, float, "ArenaScalar"]],
+        xs: list[Union[int, float, "ArenaScalar"]],
+        bias: Union[int, float, "ArenaScalar", None] = None,
+    ) -> "ArenaScalar":
+        """Affine operator computing the dot product of `ws` and `xs` plus `bias`."""
+        if len(ws) != len(xs):
+            raise ValueError(
+                f"The operands have different lengths: {len(ws)} and {len(xs)}."
+            )
+        items = [*ws, *xs] if bias is None else [*ws, *xs, bias]
+        return self.apply(Operation.LINEAR, *items)
+
+    def zero_grad(self) -> None:
+        """Reset the gradient of all the nodes, in place."""
+        self.grad[:] = array("d", bytes(8 * len(self.grad)))
+
+    def backward(self, root: int) -> None:
+        """
+        Backward pass from the row `root`. The gradients of the intermediate nodes
+        are reset first, while the leaves accumulate theirs.
+        """
+        data, grad, ops = self.data, self.grad, self.ops
+        requires_grad, offsets, operands = (
+            self.requires_grad,
+            self.offsets,
+            self.operands,
+        )
+        for i in range(root + 1):
+            if ops[i] != NONE:
+                grad[i] = 0.0
+        grad[root] = 1.0
+        for i in range(root, -1, -1):
+            op, g = ops[i], grad[i]
+            # The nodes that are not reached from the root have a zero gradient.
+            if op == NONE or g == 0.0 or not requires_grad[i]:
+                continue
+            rows = operands[offsets[i] : offsets[i + 1]]
+            if op == SUM:
+                for j in rows:
+                    if requires_grad[j]:
+                        grad[j] += g
+                continue
+            rule, out = _RULES[op], data[i]
+            args = [data[j] for j in rows]
+            for k, j in enumerate(rows):
+                if requires_grad[j]:
+                    grad[j] += rule(out, args, k) * g
+
+    def clear(self) -> None:
+        """Remove all the nodes, the handles on them becoming invalid."""
+        self.__init__()
+
+
+class ArenaScalar:
+    """Handle on a node of an arena, supporting the operators of the Scalar object."""
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: Arena, index: int) -> None:
+        """Constructor."""
+        self.arena = arena
+        self.index = index
+
+    @property
+    def data(self) -> float:
+        """Data of the node."""
+        return self.arena.data[self.index]
+
+    @data.setter
+    def data(self, value: float) -> None:
+        """Set the data of the node."""
+        self.arena.data[self.index] = value
+
+    @property
+    def grad(self) -> float:
+        """Gradient of the node."""
+        return self.arena.grad[self.index]
+
+    @property
+    def requires_grad(self) -> bool:
+        """Whether the gradient of the node is computed."""
+        return bool(self.arena.requires_grad[self.index])
+
+    @property
+    def op(self) -> Operation:
+        """Operation of the node."""
+        return OPERATIONS[self.arena.ops[self.index]]
+
+    def backward(self) -> None:
+        """Backward pass."""
+        self.arena.backward(self.index)
+
+    def exp(self) -> "ArenaScalar":
+        """Exponential operator."""
+        return self.arena.apply(Operation.EXPONENTIAL, self)
+
+    def tanh(self) -> "ArenaScalar":
+        """Hyperbolic tangent operator."""
+        return self.arena.apply(Operation.HYPERBOLIC_TANGENT, self)
+
+    def relu(self) -> "ArenaScalar":
+        """ReLU operator."""
+        return self.arena.apply(Operation.RELU, self)
+
+    def __add__(self, other: Union[int, float, "ArenaScalar"]) -> "ArenaScalar":
+        """Addition operator."""
+        return self.arena.apply(Operation.ADDITION, self, other)
+
+    def __radd__(self, other: int | float) -> "ArenaScalar":
+        """Right addition operator."""
+        return self.arena.apply(Operation.ADDITION, other, self)
+
+    def __neg__(self) -> "ArenaScalar":
+        """Negation operator."""
+        return self.arena.apply(Operation.NEGATION, self)
+
+    def __sub__(self, other: Union[int, float, "ArenaScalar"]) -> "ArenaScalar":
+        """Subtraction operator."""
+        return self.arena.apply(Operation.SUBTRACTION, self, other)
+
+    def __rsub__(self, other: int | float) -> "ArenaScalar":
+        """Right subtraction operator."""
+        return self.arena.apply(Operation.SUBTRACTION, other, self)
+
+    def __mul__(self, other: Union[int, float, "ArenaScalar"]) -> "ArenaScalar":
+        """Multiplication operator."""
+        return self.arena.apply(Operation.MULTIPLICATION, self, other)
+
+    def __rmul__(self, other: int | float) -> "ArenaScalar":
+        """Right multiplication operator."""
+        return self.arena.apply(Operation.MULTIPLICATION, other, self)
+
+    def __truediv__(self, other: Union[int, float, "ArenaScalar"]) -> "ArenaScalar":
+        """True division operator."""
+        return self.arena.apply(Operation.DIVISION, self, other)
+
+    def __rtruediv__(self, other: int | float) -> "ArenaScalar":
+        """Right true division operator."""
+        return self.arena.apply(Operation.DIVISION, other, self)
+
+    def __floordiv__(self, other: Union[int, float, "ArenaScalar"]) -> "ArenaScalar":
+        """Floor division operator."""
+        return self.arena.apply(Operation.FLOOR_DIVISION, self, other)
+
+    def __rfloordiv__(self, other: int | float) -> "ArenaScalar":
+        """Right floor division operator."""
+        return self.arena.apply(Operation.FLOOR_DIVISION, other, self)
+
+    def __invert__(self) -> "ArenaScalar":
+        """Inverse operator."""
+        return self.arena.apply(Operation.INVERTION, self)
+
+    def __pow__(self, other: Union[int, float, "ArenaScalar"]) -> "ArenaScalar":
+        """Exponentiation operator."""
+        return self.arena.apply(Operation.EXPONENTIATION, self, other)
+
+    def __rpow__(self, other: int | float) -> "ArenaScalar":
+        """Right exponentiation operator."""
+        return self.arena.apply(Operation.EXPONENTIATION, other, self)
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object."""
+        return f"ArenaScalar(index={self.index}, data={self.data:.6f})"
@@ -0,0 +1 @@
+"""Benchmarks of the nanograd autograd engine."""
@@ -0,0 +1,54 @@
+"""
+Command line interface of the benchmark suite.
+
+Run all the benchmarks, or the ones given as arguments, and print their records as
+JSON. The results can be saved with `--output` and compared with a saved baseline with
+`--baseline`, the command failing if a metric regresses by more than `--threshold`:
+
+    python -m nanograd.bench --output baseline.json
+    python -m nanograd.bench --baseline baseline.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+from nanograd.bench.suite import BENCHMARKS, compare, run
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command and return its exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m nanograd.bench", description="Benchmarks of nanograd."
+    )
+    parser.add_argument(
+        "names", nargs="*", metavar="name",
+        help=f"benchmarks to run, among {', '.join(BENCHMARKS)}, all by default",
+    )
+    parser.add_argument("--output", help="file to write the results to, as JSON")
+    parser.add_argument("--baseline", help="JSON file of results to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="relative worsening of a metric reported as a regression (default 0.1)",
+    )
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    results = run(tuple(args.names) or BENCHMARKS)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            f.write(text)
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
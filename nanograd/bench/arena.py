@@ -0,0 +1,71 @@
+"""Benchmark of the memory footprint and backward pass of the Arena object."""
+
+import gc
+import tracemalloc
+from time import perf_counter
+from nanograd.arena import Arena
+from nanograd.scalar import Scalar
+
+
+def chain(x, steps: int):
+    """
+    Build a chain of `steps` multiply-add steps from `x`, along which the gradient
+    does not vanish.
+    """
+    y = x
+    for _ in range(steps):
+        y = y + x * x
+    return y
+
+
+def measure(make_leaf, steps: int) -> dict:
+    """
+    Return the number of bytes per node of the graph of a chain and the time of its
+    backward pass, the graph being retained so that both engines do the same work.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        x, keep = make_leaf()
+        y = chain(x, steps)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    start = perf_counter()
+    if isinstance(y, Scalar):
+        y.backward(retain_graph=True)
+    else:
+        y.backward()
+    elapsed = perf_counter() - start
+    del keep
+    return {"node_bytes": (after - before) / (2 * steps), "backward_seconds": elapsed}
+
+
+def run(steps: int = 200_000) -> list[dict]:
+    """Run the benchmark and return one record per engine."""
+
+    def _scalar():
+        return Scalar(0.5, requires_grad=True), None
+
+    def _arena():
+        arena = Arena()
+        return arena.scalar(0.5, requires_grad=True), arena
+
+    return [
+        {"engine": name, **measure(make_leaf, steps)}
+        for name, make_leaf in (("scalar", _scalar), ("arena", _arena))
+    ]
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    for record in run():
+        print(
+            f"{record['engine']:6}  {record['node_bytes']:8.1f} B/node  "
+            f"backward {record['backward_seconds'] * 1e3:10.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
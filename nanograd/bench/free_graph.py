@@ -0,0 +1,55 @@
+"""Benchmark of the memory retained by the graph of a Scalar MLP after backward."""
+
+import gc
+import random
+import tracemalloc
+from nanograd.bench.no_grad import forward, make_weights
+from nanograd.scalar import Scalar
+
+
+def retained_bytes(retain_graph: bool, sizes: tuple[int, ...], steps: int) -> dict:
+    """
+    Run `steps` training steps of an MLP, the loss of a step being kept alive until the
+    next one replaces it, and return the memory traced after the last backward pass
+    and the peak over the steps, relative to the memory of the parameters.
+    """
+    weights = make_weights(sizes)
+    params = [[[Scalar(w, requires_grad=True) for w in row] for row in layer]
+              for layer in weights]
+    rng = random.Random(1)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        loss = None
+        for _ in range(steps):
+            xs = [Scalar(rng.uniform(-1.0, 1.0)) for _ in range(sizes[0])]
+            loss = sum(forward(params, xs), Scalar(0.0))
+            loss.backward(retain_graph=retain_graph)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del loss
+    return {"retained_bytes": current - base, "peak_bytes": peak - base}
+
+
+def run(sizes: tuple[int, ...] = (32, 64, 64, 10), steps: int = 3) -> list[dict]:
+    """Run the benchmark and return one record per mode."""
+    return [
+        {"retain_graph": retain_graph, **retained_bytes(retain_graph, sizes, steps)}
+        for retain_graph in (True, False)
+    ]
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    for record in run():
+        print(
+            f"retain_graph={str(record['retain_graph']):5}  "
+            f"retained {record['retained_bytes'] / 1024:10.1f} KiB  "
+            f"peak {record['peak_bytes'] / 1024:10.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
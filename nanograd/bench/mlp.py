@@ -0,0 +1,66 @@
+"""Benchmark of a training step of an MLP built from Scalar objects."""
+
+import gc
+import random
+import tracemalloc
+from time import perf_counter
+from nanograd.nn import MLP
+from nanograd.scalar import Scalar
+
+
+def step(model: MLP, xs: list[list[float]]) -> Scalar:
+    """Forward pass of the summed outputs of `model` on the batch `xs`."""
+    return Scalar.sum([y for x in xs for y in model(x)])
+
+
+def run(
+    sizes: tuple[int, ...] = (16, 32, 32, 4), batch: int = 16, repeat: int = 3
+) -> list[dict]:
+    """
+    Run the benchmark and return the best times in seconds of the forward and backward
+    passes of a step, and the peak memory in bytes of a whole step.
+    """
+    random.seed(0)
+    model = MLP(sizes[0], sizes[1:])
+    rng = random.Random(1)
+    xs = [[rng.uniform(-1.0, 1.0) for _ in range(sizes[0])] for _ in range(batch)]
+    forward, backward = float("inf"), float("inf")
+    for _ in range(repeat):
+        model.zero_grad()
+        start = perf_counter()
+        loss = step(model, xs)
+        middle = perf_counter()
+        loss.backward()
+        forward = min(forward, middle - start)
+        backward = min(backward, perf_counter() - middle)
+    del loss
+    gc.collect()
+    tracemalloc.start()
+    try:
+        step(model, xs).backward()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return [
+        {
+            "sizes": list(sizes),
+            "batch": batch,
+            "forward_seconds": forward,
+            "backward_seconds": backward,
+            "peak_bytes": peak,
+        }
+    ]
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    for record in run():
+        print(
+            f"forward {record['forward_seconds'] * 1e3:10.3f} ms  "
+            f"backward {record['backward_seconds'] * 1e3:10.3f} ms  "
+            f"peak {record['peak_bytes'] / 1024:10.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
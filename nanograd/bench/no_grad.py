@@ -0,0 +1,99 @@
+"""Benchmark of the forward pass of a Scalar MLP with and without gradient."""
+
+import random
+import tracemalloc
+from math import tanh
+from time import perf_counter
+from nanograd.grad_mode import no_grad
+from nanograd.scalar import Scalar
+
+
+def make_weights(sizes: tuple[int, ...], seed: int = 0) -> list[list[list[float]]]:
+    """Draw the weights of an MLP, one list of rows per layer, bias last."""
+    rng = random.Random(seed)
+    return [
+        [[rng.uniform(-1.0, 1.0) for _ in range(n_in + 1)] for _ in range(n_out)]
+        for n_in, n_out in zip(sizes[:-1], sizes[1:])
+    ]
+
+
+def forward(weights, xs):
+    """
+    Forward pass of an MLP with hyperbolic tangent activations. It works on floats as
+    well as on Scalar objects.
+    """
+    for layer in weights:
+        xs = [
+            (sum((w * x for w, x in zip(row, xs)), row[-1])).tanh()
+            if isinstance(row[-1], Scalar)
+            else tanh(sum((w * x for w, x in zip(row, xs)), row[-1]))
+            for row in layer
+        ]
+    return xs
+
+
+def measure(fn, repeat: int = 5) -> tuple[float, int]:
+    """Return the best time in seconds and the peak memory in bytes of `fn()`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes: tuple[int, ...] = (64, 128, 128, 10)) -> list[dict]:
+    """
+    Run the benchmark and return one record per mode of nanograd, each one also holding
+    the time and memory of the reference forward pass on floats.
+    """
+    weights = make_weights(sizes)
+    params = [[[Scalar(w, requires_grad=True) for w in row] for row in layer]
+              for layer in weights]
+    xs = [random.Random(1).uniform(-1.0, 1.0) for _ in range(sizes[0])]
+
+    def _graph():
+        return forward(params, [Scalar(x) for x in xs])
+
+    @no_grad()
+    def _no_grad():
+        return forward(params, [Scalar(x) for x in xs])
+
+    reference_seconds, reference_peak = measure(lambda: forward(weights, xs))
+    records = []
+    for mode, fn in (("graph", _graph), ("no_grad", _no_grad)):
+        seconds, peak = measure(fn)
+        records.append(
+            {
+                "mode": mode,
+                "forward_seconds": seconds,
+                "peak_bytes": peak,
+                "reference_forward_seconds": reference_seconds,
+                "reference_peak_bytes": reference_peak,
+            }
+        )
+    return records
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    records = run()
+    for record in records:
+        print(
+            f"{record['mode']:8} {record['forward_seconds'] * 1e3:9.3f} ms  "
+            f"peak {record['peak_bytes'] / 1024:10.1f} KiB"
+        )
+    print(
+        f"{'float':8} {records[0]['reference_forward_seconds'] * 1e3:9.3f} ms  "
+        f"peak {records[0]['reference_peak_bytes'] / 1024:10.1f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
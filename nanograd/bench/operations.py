@@ -0,0 +1,52 @@
+"""Benchmark of the construction of the nodes of every operation of Scalar objects."""
+
+from typing import Callable
+from nanograd.bench.scalar_memory import bytes_per_node, nodes_per_second
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+
+
+def builders() -> dict[Operation, Callable[[], Scalar]]:
+    """Functions building one node of each operation from leaves requiring gradient."""
+    x, y = Scalar(0.5, requires_grad=True), Scalar(2.0, requires_grad=True)
+    ws = [Scalar(0.1 * i, requires_grad=True) for i in range(8)]
+    return {
+        Operation.ADDITION: lambda: x + y,
+        Operation.NEGATION: lambda: -x,
+        Operation.SUBTRACTION: lambda: x - y,
+        Operation.MULTIPLICATION: lambda: x * y,
+        Operation.DIVISION: lambda: x / y,
+        Operation.FLOOR_DIVISION: lambda: x // y,
+        Operation.INVERTION: lambda: ~x,
+        Operation.EXPONENTIATION: lambda: x**y,
+        Operation.EXPONENTIAL: lambda: x.exp(),
+        Operation.HYPERBOLIC_TANGENT: lambda: x.tanh(),
+        Operation.RELU: lambda: x.relu(),
+        Operation.SUM: lambda: Scalar.sum(ws),
+        Operation.LINEAR: lambda: Scalar.dot(ws[:4], ws[4:], x),
+    }
+
+
+def run(n: int = 20_000) -> list[dict]:
+    """Run the benchmark and return one record per operation."""
+    return [
+        {
+            "op": op.value,
+            "node_bytes": bytes_per_node(build, n=n // 4),
+            "nodes_per_second": nodes_per_second(build, n=n),
+        }
+        for op, build in builders().items()
+    ]
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    for record in run():
+        print(
+            f"{record['op']:9} {record['node_bytes']:8.1f} B/node  "
+            f"{record['nodes_per_second']:12,.0f} nodes/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of the memory footprint and construction throughput of Scalar nodes."""
+
+import tracemalloc
+from time import perf_counter
+from ordered_set import OrderedSet
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+
+
+class DictNode:
+    """
+    Reference node mirroring the former layout of Scalar: a per-instance `__dict__`,
+    an OrderedSet of children and a fresh closure as backward function.
+    """
+
+    def __init__(self, data, requires_grad=False, _prev=None, _op=Operation.NONE):
+        """Constructor."""
+        self.data = data
+        self.label = None
+        self.requires_grad = requires_grad
+        self._grad = 0.0
+        self._prev = OrderedSet() if _prev is None else _prev
+        self._op = _op
+        self._backward_fn = lambda: None
+        self._backward = 1.0 if requires_grad else 0.0
+
+    def __mul__(self, other):
+        """Multiplication operator."""
+        out = DictNode(
+            self.data * other.data,
+            requires_grad=True,
+            _prev=OrderedSet([self, other]),
+            _op=Operation.MULTIPLICATION,
+        )
+
+        def _backward_fn() -> None:
+            self._grad += self._backward * other.data * out._grad
+            other._grad += other._backward * self.data * out._grad
+
+        out._backward_fn = _backward_fn
+        return out
+
+
+def bytes_per_node(build, n: int = 10_000) -> float:
+    """Return the average number of bytes allocated by `n` calls of `build`."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        nodes = [build() for _ in range(n)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del nodes
+    return (after - before) / n
+
+
+def nodes_per_second(build, n: int = 100_000) -> float:
+    """Return the number of calls of `build` performed per second."""
+    start = perf_counter()
+    for _ in range(n):
+        build()
+    return n / (perf_counter() - start)
+
+
+def run() -> list[dict]:
+    """Run the benchmark and return one record per kind of node."""
+    x, y = Scalar(2.0, requires_grad=True), Scalar(3.0)
+    dx, dy = DictNode(2.0, requires_grad=True), DictNode(3.0)
+    cases = (
+        ("leaf", lambda: Scalar(1.0), lambda: DictNode(1.0)),
+        ("mul", lambda: x * y, lambda: dx * dy),
+    )
+    records = []
+    for name, build, reference in cases:
+        records.append(
+            {
+                "node": name,
+                "node_bytes": bytes_per_node(build),
+                "reference_node_bytes": bytes_per_node(reference),
+                "nodes_per_second": nodes_per_second(build),
+                "reference_nodes_per_second": nodes_per_second(reference),
+            }
+        )
+    return records
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    for record in run():
+        print(
+            f"{record['node']:5} "
+            f"{record['node_bytes']:8.1f} B/node "
+            f"(reference {record['reference_node_bytes']:8.1f})  "
+            f"{record['nodes_per_second']:12,.0f} nodes/s "
+            f"(reference {record['reference_nodes_per_second']:12,.0f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
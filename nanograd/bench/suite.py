@@ -0,0 +1,105 @@
+"""Suite gathering the benchmarks, and comparison of its results with a baseline."""
+
+import json
+from importlib import import_module
+
+# Modules of the benchmarks, each one exposing a `run` function returning records.
+BENCHMARKS = (
+    "operations",
+    "topological_sort",
+    "mlp",
+    "no_grad",
+    "free_graph",
+    "scalar_memory",
+    "arena",
+    "vectorized",
+)
+
+# Fields identifying the records of each benchmark, matched with the baseline, and
+# metrics of nanograd compared with it. The metrics are named after what they measure
+# and their unit, e.g. `backward_seconds`. The fields of the reference implementations,
+# e.g. the recursive topological sort, are prefixed with `reference_` and are neither.
+KEYS: dict[str, tuple[str, ...]] = {
+    "operations": ("op",),
+    "topological_sort": ("graph", "size"),
+    "mlp": ("sizes", "batch"),
+    "no_grad": ("mode",),
+    "free_graph": ("retain_graph",),
+    "scalar_memory": ("node",),
+    "arena": ("engine",),
+    "vectorized": ("vectorized",),
+}
+METRICS: dict[str, tuple[str, ...]] = {
+    "operations": ("node_bytes", "nodes_per_second"),
+    "topological_sort": ("sort_seconds",),
+    "mlp": ("forward_seconds", "backward_seconds", "peak_bytes"),
+    "no_grad": ("forward_seconds", "peak_bytes"),
+    "free_graph": ("retained_bytes", "peak_bytes"),
+    "scalar_memory": ("node_bytes", "nodes_per_second"),
+    "arena": ("node_bytes", "backward_seconds"),
+    "vectorized": ("backward_seconds",),
+}
+
+
+def run(names: tuple[str, ...] = BENCHMARKS) -> dict[str, list[dict]]:
+    """Run the benchmarks `names` and return their records by name."""
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark: {name}.")
+    return {
+        name: import_module(f"nanograd.bench.{name}").run() for name in names
+    }
+
+
+def higher_is_better(metric: str) -> bool:
+    """Whether a larger value of `metric` is an improvement, e.g. a throughput."""
+    return metric.endswith("_per_second")
+
+
+def record_key(name: str, record: dict) -> str:
+    """Description of the fields identifying `record` among the ones of `name`."""
+    return ", ".join(
+        f"{field}={json.dumps(record.get(field))}" for field in KEYS[name]
+    )
+
+
+def compare(
+    results: dict[str, list[dict]],
+    baseline: dict[str, list[dict]],
+    threshold: float = 0.1,
+) -> list[str]:
+    """
+    Compare `results` with `baseline` and return the description of the regressions,
+    i.e. the metrics that are worse by more than the relative `threshold`.
+
+    The records of a benchmark are matched on the fields identifying them, e.g. a graph
+    and its size, and only the metrics of the benchmark are compared. The benchmarks,
+    records and metrics missing from the baseline are not compared.
+    """
+    regressions = []
+    for name, records in results.items():
+        if name not in METRICS:
+            continue
+        bases = {record_key(name, base): base for base in baseline.get(name, [])}
+        for record in records:
+            key = record_key(name, record)
+            base = bases.get(key)
+            if base is None:
+                continue
+            for metric in METRICS[name]:
+                value, ref = record.get(metric), base.get(metric)
+                if (
+                    not isinstance(value, (int, float))
+                    or not isinstance(ref, (int, float))
+                    or ref == 0
+                ):
+                    continue
+                change = (value - ref) / abs(ref)
+                if higher_is_better(metric):
+                    change = -change
+                if change > threshold:
+                    regressions.append(
+                        f"{name}[{key}].{metric}: {ref:.6g} -> {value:.6g} "
+                        f"({change:+.1%} worse)"
+                    )
+    return regressions
@@ -0,0 +1,95 @@
+"""Benchmark of the topological sort on deep and wide computational graphs."""
+
+import sys
+from time import perf_counter
+from ordered_set import OrderedSet
+from nanograd.scalar import Scalar
+from nanograd.utils import topological_sort
+
+
+def recursive_topological_sort(root) -> OrderedSet:
+    """Reference recursive implementation of the topological sort."""
+    topo, visited = OrderedSet(), set()
+
+    def _topological_sort(node) -> None:
+        if node not in visited:
+            visited.add(node)
+            for prev in node._prev:
+                _topological_sort(prev)
+            topo.append(node)
+
+    _topological_sort(root)
+    return topo
+
+
+def deep_chain(depth: int) -> Scalar:
+    """Build a chain of `depth` unary operations and return its root."""
+    out = Scalar(0.5, requires_grad=True)
+    for _ in range(depth):
+        out = out.tanh()
+    return out
+
+
+def wide_fan_in(width: int) -> Scalar:
+    """Build a graph summing `width` products of leaves and return its root."""
+    out = Scalar(0.0)
+    for i in range(width):
+        out = out + Scalar(float(i), requires_grad=True) * Scalar(0.5)
+    return out
+
+
+def time_it(fn, *args, repeat: int = 5) -> float:
+    """Return the best wall-clock time in seconds of `repeat` calls of `fn(*args)`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        fn(*args)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def run(sizes: tuple[int, ...] = (1_000, 10_000, 100_000)) -> list[dict]:
+    """
+    Run the benchmark for every graph size and return one record per graph.
+
+    The recursive reference is only timed when the recursion limit allows it, the
+    limit being raised temporarily for that purpose.
+    """
+    records = []
+    for size in sizes:
+        for name, build in (("deep_chain", deep_chain), ("wide_fan_in", wide_fan_in)):
+            root = build(size)
+            record = {
+                "graph": name,
+                "size": size,
+                "sort_seconds": time_it(topological_sort, root),
+                "reference_sort_seconds": None,
+            }
+            limit = sys.getrecursionlimit()
+            try:
+                sys.setrecursionlimit(max(limit, 4 * size + 1_000))
+                record["reference_sort_seconds"] = time_it(
+                    recursive_topological_sort, root
+                )
+            except RecursionError:
+                pass
+            finally:
+                sys.setrecursionlimit(limit)
+            records.append(record)
+    return records
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    for record in run():
+        recursive = record["reference_sort_seconds"]
+        recursive_str = "n/a" if recursive is None else f"{recursive * 1e3:10.3f} ms"
+        print(
+            f"{record['graph']:12} {record['size']:>9,d} nodes  "
+            f"iterative {record['sort_seconds'] * 1e3:10.3f} ms  "
+            f"recursive {recursive_str}"
+        )
+
+
+if __name__ == "__main__":
+    main()
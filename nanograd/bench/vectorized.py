@@ -0,0 +1,53 @@
+"""Benchmark of the level-scheduled backward pass against the reference one."""
+
+import random
+from time import perf_counter
+from nanograd.bench.no_grad import forward, make_weights
+from nanograd.scalar import Scalar
+from nanograd.vectorized import vectorized_backward
+
+
+def backward_time(
+    vectorized: bool, sizes: tuple[int, ...], batch: int, repeat: int = 3
+) -> float:
+    """
+    Return the best time in seconds of the backward pass of the summed outputs of an
+    MLP evaluated on a batch of inputs, the graph being built again for each run.
+    """
+    weights = make_weights(sizes)
+    params = [[[Scalar(w, requires_grad=True) for w in row] for row in layer]
+              for layer in weights]
+    rng = random.Random(1)
+    xs = [[rng.uniform(-1.0, 1.0) for _ in range(sizes[0])] for _ in range(batch)]
+    best = float("inf")
+    for _ in range(repeat):
+        loss = Scalar.sum([y for x in xs for y in forward(params, x)])
+        start = perf_counter()
+        if vectorized:
+            vectorized_backward(loss)
+        else:
+            loss.backward()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def run(sizes: tuple[int, ...] = (16, 32, 32, 4), batch: int = 32) -> list[dict]:
+    """Run the benchmark and return one record per engine."""
+    return [
+        {
+            "vectorized": vectorized,
+            "backward_seconds": backward_time(vectorized, sizes, batch),
+        }
+        for vectorized in (False, True)
+    ]
+
+
+def main() -> None:
+    """Print the results of the benchmark."""
+    for record in run():
+        engine = "vectorized" if record["vectorized"] else "reference"
+        print(f"{engine:10}  {record['backward_seconds'] * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
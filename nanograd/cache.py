@@ -0,0 +1,142 @@
+"""
+Cache of the code compiled from tapes, keyed by the structure of their graph.
+
+The fingerprint of a tape is a hash of its instructions, inputs, output and gradient
+mask, but not of its values: two traces of the same model on different data, or of
+models with different weights, share it. Since the generated code takes the values as
+arguments, the compiled code of a fingerprint can be reused by all of them.
+
+Only the generation and the compilation of the code are cached. The key is computed
+from a tape, so a function is still traced, and its tape fingerprinted, before each
+lookup. To call a function repeatedly without tracing it again, keep the compiled tape
+and call its functions with the new inputs.
+
+The cache keeps the most recently used code objects in memory, up to a maximum number.
+It can also persist them in a directory, marshalled for the running interpreter, so that
+another process skips the generation and the compilation of the code. The directory is
+trusted: the code loaded from it is executed as is.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from collections import OrderedDict
+from types import CodeType
+from typing import TYPE_CHECKING
+from .codegen import CompiledTape, compile_source, generate_source
+
+if TYPE_CHECKING:
+    from .tape import Tape
+
+
+def fingerprint(tape: "Tape") -> str:
+    """
+    Structural fingerprint of a tape: the hash of the operations and operand slots of
+    its instructions, of the slots of its inputs and output, and of its gradient mask.
+    The slots being numbered by the topological order, equal graphs get equal slots.
+    """
+    parts = [
+        f"{len(tape.values)}",
+        ",".join(map(str, tape.inputs)),
+        f"{tape.output}",
+        "".join("1" if x else "0" for x in tape.backward_mask),
+        *(
+            f"{ins.op.value}({','.join(map(str, ins.operands))})>{ins.out}"
+            for ins in tape.instructions
+        ),
+    ]
+    return hashlib.sha256(";".join(parts).encode()).hexdigest()
+
+
+class CompileCache:
+    """
+    Bounded LRU cache of the code compiled from tapes, optionally persisted in
+    `directory`.
+
+    The statistics count the lookups found in memory (hits), the ones that were not
+    (misses), among which the ones found on disk (loads), and the entries removed from
+    memory to respect `maxsize` (evictions).
+    """
+
+    def __init__(self, maxsize: int = 128, directory: str | None = None) -> None:
+        """Constructor."""
+        if maxsize < 1:
+            raise ValueError(f"The maximum size must be positive, got {maxsize}.")
+        self.maxsize = maxsize
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: OrderedDict[str, CodeType] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        """Number of entries in memory."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether the fingerprint `key` is in memory."""
+        return key in self._entries
+
+    def _path(self, key: str) -> str:
+        """File of the fingerprint `key`, specific to the running interpreter."""
+        return os.path.join(
+            self.directory, f"{key}.{sys.implementation.cache_tag}.marshal"
+        )
+
+    def get(self, key: str) -> CodeType | None:
+        """Code of the fingerprint `key`, from memory or else from disk, if any."""
+        code = self._entries.get(key)
+        if code is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return code
+        self.stats["misses"] += 1
+        if self.directory is None or not os.path.exists(self._path(key)):
+            return None
+        with open(self._path(key), "rb") as f:
+            code = marshal.load(f)
+        self.stats["loads"] += 1
+        self._insert(key, code)
+        return code
+
+    def put(self, key: str, code: CodeType) -> None:
+        """Store the code of the fingerprint `key`, on disk as well if persisted."""
+        self._insert(key, code)
+        if self.directory is not None:
+            # The file is written under a temporary name then renamed, so that another
+            # process never reads it partially written.
+            path = self._path(key)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(tmp, path)
+
+    def _insert(self, key: str, code: CodeType) -> None:
+        """Insert an entry in memory, evicting the least recently used ones."""
+        self._entries[key] = code
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def compile(self, tape: "Tape") -> CompiledTape:
+        """
+        Compile `tape`, reusing the code of the tapes of the same structure. The tape is
+        fingerprinted on each call, only the generation of the code being skipped.
+        """
+        key = fingerprint(tape)
+        code = self.get(key)
+        if code is None:
+            code = compile_source(generate_source(tape))
+            self.put(key, code)
+        return CompiledTape(tape, code)
+
+    def clear(self) -> None:
+        """Remove the entries from memory and reset the statistics."""
+        self._entries.clear()
+        self.stats = dict.fromkeys(self.stats, 0)
+
+
+# Cache used by `Tape.compile`.
+COMPILE_CACHE = CompileCache()
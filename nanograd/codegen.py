@@ -0,0 +1,197 @@
+"""
+Generation of straight-line Python source for the forward and backward passes of a tape.
+
+Each slot of the tape becomes a local variable: `v<slot>` for a value and `g<slot>` for
+a gradient. The instructions are unrolled into one statement each, with the forward rule
+and the local gradients of the operation written inline, so that a pass neither
+dispatches on the operations nor calls the rules. The values of the constants and of
+the leaves that are not inputs are passed to the functions as a tuple, so that the
+source only depends on the structure of the graph.
+
+The expressions evaluate in the same order as the rules, so that the generated code
+computes exactly the values and gradients of the eager engine.
+"""
+
+from functools import partial
+from math import exp, log, tanh
+from types import CodeType
+from typing import TYPE_CHECKING, Callable
+from .enums import Operation
+
+if TYPE_CHECKING:
+    from .tape import Tape
+
+
+def _tuple(items: list[str]) -> str:
+    """Literal of a tuple of the expressions `items`."""
+    return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+
+
+def _forward_expression(op: Operation, args: list[str]) -> str:
+    """Expression of the output of the operation `op` applied to `args`."""
+    if op is Operation.IDENTITY:
+        return args[0]
+    if op is Operation.ADDITION:
+        return f"{args[0]} + {args[1]}"
+    if op is Operation.NEGATION:
+        return f"-{args[0]}"
+    if op is Operation.SUBTRACTION:
+        return f"{args[0]} - {args[1]}"
+    if op is Operation.MULTIPLICATION:
+        return f"{args[0]} * {args[1]}"
+    if op is Operation.DIVISION:
+        return f"{args[0]} / {args[1]}"
+    if op is Operation.FLOOR_DIVISION:
+        return f"{args[0]} // {args[1]}"
+    if op is Operation.INVERTION:
+        return f"{args[0]} ** (-1.0)"
+    if op is Operation.EXPONENTIATION:
+        return f"{args[0]} ** {args[1]}"
+    if op is Operation.EXPONENTIAL:
+        return f"exp({args[0]})"
+    if op is Operation.HYPERBOLIC_TANGENT:
+        return f"tanh({args[0]})"
+    if op is Operation.RELU:
+        return f"max(0.0, {args[0]})"
+    # The sums are left to `sum`, which rounds as the rules do.
+    if op is Operation.SUM:
+        return f"sum({_tuple(args)})"
+    if op is Operation.LINEAR:
+        n = len(args) // 2
+        products = [f"{w} * {x}" for w, x in zip(args[:n], args[n : 2 * n])]
+        out = f"sum({_tuple(products)})"
+        return f"{out} + {args[-1]}" if len(args) % 2 else out
+    raise ValueError(f"The operation {op.value!r} cannot be compiled.")
+
+
+def _gradient_expression(
+    op: Operation, args: list[str], out: str, grad: str, i: int
+) -> str | None:
+    """
+    Expression of the gradient propagated by the output of the operation `op`, of
+    value `out` and gradient `grad`, to its operand `i`, None if it is always zero.
+    """
+    if op in (Operation.IDENTITY, Operation.ADDITION, Operation.SUM):
+        return grad
+    if op is Operation.NEGATION:
+        return f"-{grad}"
+    if op is Operation.SUBTRACTION:
+        return grad if i == 0 else f"-{grad}"
+    if op is Operation.MULTIPLICATION:
+        return f"{args[1 - i]} * {grad}"
+    if op is Operation.DIVISION:
+        x, y = args
+        return f"(1.0 / {y}) * {grad}" if i == 0 else f"(-{x} / ({y} ** 2)) * {grad}"
+    if op is Operation.FLOOR_DIVISION:
+        return None
+    if op is Operation.INVERTION:
+        return f"((-1.0) / ({args[0]} ** 2)) * {grad}"
+    if op is Operation.EXPONENTIATION:
+        x, y = args
+        if i == 0:
+            return f"({y} * ({x} ** ({y} - 1.0))) * {grad}"
+        return f"(log({x}) * ({x} ** {y})) * {grad}"
+    if op is Operation.EXPONENTIAL:
+        return f"{out} * {grad}"
+    if op is Operation.HYPERBOLIC_TANGENT:
+        return f"(1.0 - {out} ** 2) * {grad}"
+    if op is Operation.RELU:
+        return f"(1.0 if {args[0]} > 0.0 else 0.0) * {grad}"
+    if op is Operation.LINEAR:
+        n = len(args) // 2
+        if i < n:
+            return f"{args[n + i]} * {grad}"
+        return f"{args[i - n]} * {grad}" if i < 2 * n else grad
+    raise ValueError(f"The operation {op.value!r} cannot be compiled.")
+
+
+def constant_slots(tape: "Tape") -> list[int]:
+    """Slots of the constants and of the leaves that are not inputs, in order."""
+    computed = {ins.out for ins in tape.instructions}
+    inputs = set(tape.inputs)
+    return [
+        slot
+        for slot in range(len(tape.values))
+        if slot not in computed and slot not in inputs
+    ]
+
+
+def generate_source(tape: "Tape") -> str:
+    """
+    Source of the functions `forward` and `value_and_grad` of `tape`. Their first
+    parameter is the tuple of the values of the constant slots, the other ones are the
+    inputs. The source only depends on the structure of the tape, not on its values.
+    """
+    mask = tape.backward_mask
+    constants = constant_slots(tape)
+    variable = set(range(len(tape.values))).difference(constants)
+    params = ", ".join(["constants", *(f"x{k}" for k in range(len(tape.inputs)))])
+    prologue = [f"    v{slot} = x{k}" for k, slot in enumerate(tape.inputs)]
+    if constants:
+        names = "".join(f"v{slot}, " for slot in constants)
+        prologue.insert(0, f"    {names}= constants")
+    forward = []
+    for ins in tape.instructions:
+        args = [f"v{slot}" for slot in ins.operands]
+        forward.append(f"    v{ins.out} = {_forward_expression(ins.op, args)}")
+    # The gradients are assigned by their first contribution, the slots that never
+    # receive one do not propagate anything.
+    assigned = {tape.output}
+    backward = [f"    g{tape.output} = 1.0"]
+    for ins in reversed(tape.instructions):
+        if ins.out not in assigned:
+            continue
+        args = [f"v{slot}" for slot in ins.operands]
+        for i, slot in enumerate(ins.operands):
+            # Only the inputs and the computed slots requiring gradient are
+            # differentiated.
+            if not mask[slot] or slot not in variable:
+                continue
+            expr = _gradient_expression(
+                ins.op, args, f"v{ins.out}", f"g{ins.out}", i
+            )
+            if expr is None:
+                continue
+            backward.append(
+                f"    g{slot} {'+=' if slot in assigned else '='} {expr}"
+            )
+            assigned.add(slot)
+    grads = ", ".join(
+        f"g{slot}" if slot in assigned else "0.0" for slot in tape.inputs
+    )
+    body = "\n".join([*prologue, *forward])
+    return (
+        f"def forward({params}):\n{body}\n    return v{tape.output}\n\n\n"
+        f"def value_and_grad({params}):\n{body}\n"
+        + "\n".join(backward)
+        + f"\n    return v{tape.output}, [{grads}]\n"
+    )
+
+
+def compile_source(source: str) -> CodeType:
+    """Compile the source generated for a tape."""
+    return compile(source, "<nanograd.codegen>", "exec")
+
+
+class CompiledTape:
+    """
+    Functions generated from a tape: `forward` returns the value of the output, and
+    `value_and_grad` also returns the gradients of the inputs. The constant slots keep
+    the values they had when the tape was compiled.
+
+    The code compiled from the source of the tape can be given, e.g. by a cache of the
+    code of the tapes of the same structure.
+    """
+
+    def __init__(self, tape: "Tape", code: CodeType | None = None) -> None:
+        """Constructor."""
+        if code is None:
+            code = compile_source(generate_source(tape))
+        self.code = code
+        namespace = {"exp": exp, "log": log, "tanh": tanh}
+        exec(code, namespace)
+        constants = tuple(tape.values[slot] for slot in constant_slots(tape))
+        self.forward: Callable[..., float] = partial(namespace["forward"], constants)
+        self.value_and_grad: Callable[..., tuple[float, list[float]]] = partial(
+            namespace["value_and_grad"], constants
+        )
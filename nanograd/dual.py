@@ -0,0 +1,141 @@
+"""
+Definition of the Dual object: a dual number for forward-mode differentiation.
+
+A dual number carries a primal value and a tangent, the derivative of the value along
+a direction of the inputs. The tangent of the output of an operation is the sum of the
+local gradients of its operands times their tangents, the local gradients being the
+ones of the backward pass. No graph is recorded: each value only holds two floats.
+"""
+
+from typing import Union
+from .enums import Operation
+from .rules import FORWARD_RULES, LOCAL_GRADIENTS
+from collections.abc import Iterable, Sequence
+
+
+class Dual:
+    """A Dual object holds a primal value and its tangent."""
+
+    __slots__ = ("primal", "tangent")
+
+    def __init__(self, primal: int | float, tangent: int | float = 0.0) -> None:
+        """Constructor."""
+        self.primal = primal
+        self.tangent = tangent
+
+    @staticmethod
+    def apply(op: Operation, *operands: Union[int, float, "Dual"]) -> "Dual":
+        """
+        Apply the operation `op` to `operands`, the numbers being constants whose
+        tangent is zero.
+        """
+        primals, tangents = [], []
+        for x in operands:
+            if isinstance(x, Dual):
+                primals.append(x.primal)
+                tangents.append(x.tangent)
+            elif isinstance(x, (int, float)):
+                primals.append(x)
+                tangents.append(0.0)
+            else:
+                raise TypeError(f"The following type {type(x)} is not supported.")
+        out = FORWARD_RULES[op](*primals)
+        local_grad = LOCAL_GRADIENTS[op]
+        tangent = 0.0
+        for i, t in enumerate(tangents):
+            # The local gradient of an operand with a zero tangent is not even
+            # computed, e.g. the one of a constant exponent.
+            if t != 0.0:
+                tangent += local_grad(out, primals, i) * t
+        return Dual(out, tangent)
+
+    @staticmethod
+    def sum(items: Iterable[Union[int, float, "Dual"]]) -> "Dual":
+        """Sum operator."""
+        return Dual.apply(Operation.SUM, *items)
+
+    @staticmethod
+    def dot(
+        ws: Sequence[Union[int, float, "Dual"]],
+        xs: Sequence[Union[int, float, "Dual"]],
+        bias: Union[int, float, "Dual", None] = None,
+    ) -> "Dual":
+        """Affine operator computing the dot product of `ws` and `xs` plus `bias`."""
+        if len(ws) != len(xs):
+            raise ValueError(
+                f"The operands have different lengths: {len(ws)} and {len(xs)}."
+            )
+        items = [*ws, *xs] if bias is None else [*ws, *xs, bias]
+        return Dual.apply(Operation.LINEAR, *items)
+
+    def exp(self) -> "Dual":
+        """Exponential operator."""
+        return Dual.apply(Operation.EXPONENTIAL, self)
+
+    def tanh(self) -> "Dual":
+        """Hyperbolic tangent operator."""
+        return Dual.apply(Operation.HYPERBOLIC_TANGENT, self)
+
+    def relu(self) -> "Dual":
+        """ReLU operator."""
+        return Dual.apply(Operation.RELU, self)
+
+    def __add__(self, other: Union[int, float, "Dual"]) -> "Dual":
+        """Addition operator."""
+        return Dual.apply(Operation.ADDITION, self, other)
+
+    def __radd__(self, other: int | float) -> "Dual":
+        """Right addition operator."""
+        return Dual.apply(Operation.ADDITION, other, self)
+
+    def __neg__(self) -> "Dual":
+        """Negation operator."""
+        return Dual.apply(Operation.NEGATION, self)
+
+    def __sub__(self, other: Union[int, float, "Dual"]) -> "Dual":
+        """Subtraction operator."""
+        return Dual.apply(Operation.SUBTRACTION, self, other)
+
+    def __rsub__(self, other: int | float) -> "Dual":
+        """Right subtraction operator."""
+        return Dual.apply(Operation.SUBTRACTION, other, self)
+
+    def __mul__(self, other: Union[int, float, "Dual"]) -> "Dual":
+        """Multiplication operator."""
+        return Dual.apply(Operation.MULTIPLICATION, self, other)
+
+    def __rmul__(self, other: int | float) -> "Dual":
+        """Right multiplication operator."""
+        return Dual.apply(Operation.MULTIPLICATION, other, self)
+
+    def __truediv__(self, other: Union[int, float, "Dual"]) -> "Dual":
+        """True division operator."""
+        return Dual.apply(Operation.DIVISION, self, other)
+
+    def __rtruediv__(self, other: int | float) -> "Dual":
+        """Right true division operator."""
+        return Dual.apply(Operation.DIVISION, other, self)
+
+    def __floordiv__(self, other: Union[int, float, "Dual"]) -> "Dual":
+        """Floor division operator."""
+        return Dual.apply(Operation.FLOOR_DIVISION, self, other)
+
+    def __rfloordiv__(self, other: int | float) -> "Dual":
+        """Right floor division operator."""
+        return Dual.apply(Operation.FLOOR_DIVISION, other, self)
+
+    def __invert__(self) -> "Dual":
+        """Inverse operator."""
+        return Dual.apply(Operation.INVERTION, self)
+
+    def __pow__(self, other: Union[int, float, "Dual"]) -> "Dual":
+        """Exponentiation operator."""
+        return Dual.apply(Operation.EXPONENTIATION, self, other)
+
+    def __rpow__(self, other: int | float) -> "Dual":
+        """Right exponentiation operator."""
+        return Dual.apply(Operation.EXPONENTIATION, other, self)
+
+    def __repr__(self) -> str:
+        """Provide a string representation of the object."""
+        return f"Dual(primal={self.primal:.6f}, tangent={self.tangent:.6f})"
@@ -21,3 +21,7 @@ class Operation(Enum):
     EXPONENTIAL = 'exp'
     HYPERBOLIC_TANGENT = 'tanh'
     RELU = 'relu'
+    MATRIX_MULTIPLICATION = 'matmul'
+    SUM = 'sum'
+    MEAN = 'mean'
+    LINEAR = 'linear'
@@ -0,0 +1,223 @@
+"""Functional interface of the automatic differentiation of nanograd."""
+
+from math import log
+from typing import Callable, Union
+import numpy as np
+from .dual import Dual
+from .enums import Operation
+from .rules import LOCAL_GRADIENT_TANGENTS, LOCAL_GRADIENTS
+from .scalar import Scalar
+from .utils import topological_order
+from collections.abc import Sequence
+
+Output = Union[int, float, Dual]
+
+
+def _primal_tangent(x: Output) -> tuple[float, float]:
+    """Primal and tangent of an output, a number being a constant."""
+    if isinstance(x, Dual):
+        return x.primal, x.tangent
+    if isinstance(x, (int, float)):
+        return x, 0.0
+    raise TypeError(f"The following type {type(x)} is not supported.")
+
+
+def jvp(
+    fn: Callable[..., Output | Sequence[Output]],
+    inputs: Sequence[int | float],
+    tangents: Sequence[int | float],
+) -> tuple[float, float] | tuple[list[float], list[float]]:
+    """
+    Jacobian-vector product of `fn` at `inputs` along `tangents`, in forward mode.
+
+    The function is called once on Dual objects and returns either one value or a
+    sequence of values. The result is the pair of the value and its tangent in the
+    first case, of the list of the values and the list of their tangents in the
+    second one.
+    """
+    if len(inputs) != len(tangents):
+        raise ValueError(
+            f"The inputs and the tangents have different lengths: {len(inputs)} and "
+            f"{len(tangents)}."
+        )
+    out = fn(*[Dual(x, t) for x, t in zip(inputs, tangents)])
+    if isinstance(out, Sequence):
+        pairs = [_primal_tangent(x) for x in out]
+        return [p for p, _ in pairs], [t for _, t in pairs]
+    return _primal_tangent(out)
+
+
+def _local_gradients(node: Scalar) -> list[tuple[int, Scalar, float]]:
+    """
+    Position, object and local gradient of the children of `node` requiring
+    gradient.
+    """
+    if not node._prev:
+        if node._op is not Operation.NONE:
+            raise RuntimeError(
+                "Trying to backward through a graph that has already been freed, "
+                "call backward with retain_graph=True to keep it."
+            )
+        return []
+    operands = node._prev if node._operands is None else node._operands
+    if node._op is Operation.SUM:
+        return [
+            (i, x, x._backward)
+            for i, x in enumerate(operands)
+            if isinstance(x, Scalar) and x.requires_grad
+        ]
+    args = [x.data if isinstance(x, Scalar) else x for x in operands]
+    local_grad = LOCAL_GRADIENTS[node._op]
+    return [
+        (i, x, x._backward * local_grad(node.data, args, i))
+        for i, x in enumerate(operands)
+        if isinstance(x, Scalar) and x.requires_grad
+    ]
+
+
+def jacobian(outputs: Sequence[Scalar], inputs: Sequence[Scalar]) -> np.ndarray:
+    """
+    Jacobian of `outputs` with respect to `inputs`, in reverse mode.
+
+    The K outputs are seeded at once: each node carries a row of K gradients, and the
+    graph is traversed once whatever the number of outputs. The entry (k, j) of the
+    result is the derivative of the output k with respect to the input j, zero if the
+    input is not part of the graph of the output. The graph is kept and the
+    gradients of the nodes are not modified.
+    """
+    for x in (*outputs, *inputs):
+        if not isinstance(x, Scalar):
+            raise TypeError(f"The following type {type(x)} is not supported.")
+    order = topological_order(*outputs, requires_grad_only=True)
+    index = {node: k for k, node in enumerate(order)}
+    grads = np.zeros((len(order), len(outputs)))
+    for k, out in enumerate(outputs):
+        grads[index[out], k] += 1.0
+    for node in reversed(order):
+        row = grads[index[node]]
+        # The nodes that no output depends on are skipped.
+        if not row.any():
+            continue
+        children = _local_gradients(node)
+        if len(children) == 1:
+            _, child, local = children[0]
+            grads[index[child]] += local * row
+        elif children:
+            # The rows of the children are updated at once, a child possibly
+            # appearing several times.
+            rows = [index[child] for _, child, _ in children]
+            locals_ = np.array([local for _, _, local in children])
+            np.add.at(grads, rows, np.outer(locals_, row))
+    res = np.zeros((len(outputs), len(inputs)))
+    for j, x in enumerate(inputs):
+        if x in index:
+            res[:, j] = grads[index[x]]
+    return res
+
+
+def hvp(
+    fn: Callable[..., Scalar],
+    inputs: Sequence[int | float],
+    vector: Sequence[int | float],
+) -> list[float]:
+    """
+    Hessian-vector product of the scalar function `fn` at `inputs` along `vector`,
+    computed forward-over-reverse without building the Hessian.
+
+    The graph of `fn` is built once. A forward sweep computes the tangents of the
+    nodes along `vector`, then a reverse sweep propagates the gradients along with
+    their tangents: the tangent of the gradient of a child is the local gradient times
+    the tangent of the gradient of the node, plus the tangent of the local gradient
+    times the gradient of the node. The tangents of the gradients of the inputs form
+    the product.
+    """
+    if len(inputs) != len(vector):
+        raise ValueError(
+            f"The inputs and the vector have different lengths: {len(inputs)} and "
+            f"{len(vector)}."
+        )
+    leaves = [Scalar(x, requires_grad=True) for x in inputs]
+    out = fn(*leaves)
+    if not isinstance(out, Scalar):
+        raise TypeError(f"The function must return a Scalar, got {type(out)}.")
+    order = topological_order(out, requires_grad_only=True)
+    # Forward sweep: tangents of the nodes, the constants having a zero tangent.
+    tangents = dict(zip(leaves, vector))
+    sweeps = []
+    for node in order:
+        children = _local_gradients(node)
+        if not children:
+            continue
+        operands = node._prev if node._operands is None else node._operands
+        args = [x.data if isinstance(x, Scalar) else x for x in operands]
+        dargs = [
+            tangents.get(x, 0.0) if isinstance(x, Scalar) else 0.0 for x in operands
+        ]
+        tangents[node] = sum(local * dargs[i] for i, _, local in children)
+        sweeps.append((node, children, args, dargs))
+    # Reverse sweep: gradients and their tangents.
+    grads, dgrads = {out: 1.0}, {out: 0.0}
+    for node, children, args, dargs in reversed(sweeps):
+        g, dg = grads.get(node, 0.0), dgrads.get(node, 0.0)
+        if g == 0.0 and dg == 0.0:
+            continue
+        tangent_rule, dout = LOCAL_GRADIENT_TANGENTS[node._op], tangents[node]
+        for i, child, local in children:
+            dlocal = tangent_rule(node.data, args, i, dout, dargs)
+            grads[child] = grads.get(child, 0.0) + local * g
+            dgrads[child] = dgrads.get(child, 0.0) + local * dg + dlocal * g
+    return [dgrads.get(leaf, 0.0) for leaf in leaves]
+
+
+def grad(
+    output: Scalar, inputs: Sequence[Scalar], create_graph: bool = False
+) -> list[float] | list[Scalar]:
+    """
+    Gradients of `output` with respect to `inputs`, zero for an input that is not part
+    of the graph. The graph is kept and the gradients of the nodes are not modified.
+
+    If `create_graph` is True, the gradients are Scalar objects computed by a graph
+    built from the one of `output`, so that they can be differentiated again, e.g. by
+    calling `backward` on a function of them.
+    """
+    if not create_graph:
+        return jacobian([output], inputs)[0].tolist()
+    for x in (output, *inputs):
+        if not isinstance(x, Scalar):
+            raise TypeError(f"The following type {type(x)} is not supported.")
+    order = topological_order(output, requires_grad_only=True)
+    grads: dict[Scalar, Scalar] = {output: Scalar(1.0)}
+    for node in reversed(order):
+        g = grads.get(node)
+        if g is None or not node._prev:
+            continue
+        for i, child, local in _local_gradients(node):
+            contrib = g * _graph_local_gradient(node, i, local)
+            grads[child] = contrib if child not in grads else grads[child] + contrib
+    return [grads.get(x, Scalar(0.0)) for x in inputs]
+
+
+def _graph_local_gradient(node: Scalar, i: int, local: float) -> Scalar | float:
+    """
+    Local gradient of the operand `i` of `node` as an expression of the graph, so
+    that it can be differentiated.
+    """
+    op = node._op
+    # The local gradients that are piecewise constant are numbers.
+    if op in (Operation.FLOOR_DIVISION, Operation.RELU, Operation.SUM):
+        return local
+    operands = node._prev if node._operands is None else node._operands
+    if op is Operation.EXPONENTIATION and i == 1:
+        # The local gradient `log(x) * out` is an expression of the graph as long as
+        # the logarithm of the base is a number, the logarithm not being an operation
+        # of the Scalar object.
+        x = operands[0]
+        if isinstance(x, Scalar) and x.requires_grad:
+            raise ValueError(
+                "The gradient with respect to an exponent cannot be differentiated "
+                "when the base requires gradient, the logarithm is not an operation "
+                "of the Scalar object."
+            )
+        return log(x.data if isinstance(x, Scalar) else x) * node
+    # The other rules are made of arithmetic operators, they apply to Scalar objects.
+    return LOCAL_GRADIENTS[op](node, operands, i)
@@ -0,0 +1,39 @@
+"""Module controlling whether the operations record the computational graph."""
+
+from contextlib import ContextDecorator
+
+
+class GradMode:
+    """Global state telling whether the operations record the computational graph."""
+
+    enabled: bool = True
+
+
+def is_grad_enabled() -> bool:
+    """Return True if the operations record the computational graph."""
+    return GradMode.enabled
+
+
+class no_grad(ContextDecorator):
+    """
+    Context manager, also usable as a decorator, disabling the recording of the
+    computational graph. Within it, the operations only compute the data of their
+    output, which is a leaf that does not require gradient.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        # A stack of the previous states, the same object being re-entered when it
+        # decorates a recursive function.
+        self._prev = []
+
+    def __enter__(self) -> "no_grad":
+        """Disable the recording of the computational graph."""
+        self._prev.append(GradMode.enabled)
+        GradMode.enabled = False
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        """Restore the previous state."""
+        GradMode.enabled = self._prev.pop()
+        return False
@@ -0,0 +1,257 @@
+"""
+Opt-in hash-consing of the nodes of the Scalar object.
+
+Within a `hash_consing` context, the operators of the Scalar object are replaced by
+versions that intern their output: the node of an operation applied to the same
+operands, i.e. the same Scalar objects holding the same data and the same constants,
+is returned again instead of being computed and created anew. A shared node has
+several parents, and its gradient is accumulated over them by the backward pass as
+for any other node. The operators are restored on exit, so that the engine does not
+pay anything outside of the context. They are installed through `patching`, so that
+the context can be combined with the other contexts patching the Scalar object.
+
+The named methods given a label, e.g. `x.add(y, label='z')`, create a node of their
+own, so that the label of a shared node is never changed.
+
+The expressions built separately do not share a graph in the eager engine, each one can
+be differentiated once without `retain_graph`. The nodes returned again are therefore
+registered as shared, and the backward pass does not release them nor their subgraphs,
+even after the exit of the context. A node released by the backward pass of its graph
+is not returned again.
+
+The nodes are interned through weak references, so that the interning does not keep any
+graph alive. The keys also hold the version of the graphs, so that the nodes created
+before a change of the `requires_grad` flag of a leaf are not shared with the nodes
+created after it.
+"""
+
+from collections.abc import Sequence
+from functools import wraps
+from inspect import signature
+from math import copysign
+from typing import Callable
+from weakref import KeyedRef
+from .grad_mode import GradMode
+from .patching import Factory, PatchingContext, Target, named_method
+from .scalar import Scalar
+
+# Operators whose output is interned, by number of operands, the sum and the affine
+# operator taking sequences.
+UNARY_METHODS = ("__neg__", "__invert__", "exp", "tanh", "relu")
+BINARY_METHODS = (
+    "__add__",
+    "__radd__",
+    "__sub__",
+    "__rsub__",
+    "__mul__",
+    "__rmul__",
+    "__truediv__",
+    "__rtruediv__",
+    "__floordiv__",
+    "__rfloordiv__",
+    "__pow__",
+    "__rpow__",
+)
+NARY_METHODS = ("sum", "dot")
+
+# Named methods and the operators they call.
+NAMED_METHODS = {
+    "add": "__add__",
+    "sub": "__sub__",
+    "mul": "__mul__",
+    "div": "__truediv__",
+    "floordiv": "__floordiv__",
+    "pow": "__pow__",
+    "neg": "__neg__",
+    "invert": "__invert__",
+}
+
+
+def _operand_key(x) -> tuple:
+    """
+    Key of an operand of the sum or the affine operator: the type and the value of a
+    number, the sign of a zero included since it may change the result, along with the
+    object for a Scalar, and the keys of the items of a sequence.
+    """
+    if isinstance(x, Scalar):
+        d = x.data
+        return (x, type(d), d, d or copysign(1.0, d))
+    if isinstance(x, Sequence) and not isinstance(x, str):
+        return (len(x), *(_operand_key(item) for item in x))
+    if isinstance(x, (int, float)):
+        return (type(x), x, x or copysign(1.0, x))
+    return (type(x), x)
+
+
+class hash_consing(PatchingContext):
+    """
+    Context manager, also usable as a decorator, interning the nodes created by the
+    operators of the Scalar object. The operators given a label, or called without
+    gradient, are not interned.
+
+    The statistics count the nodes returned again (hits) and the nodes created and
+    interned (misses).
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        super().__init__()
+        self.stats = {"hits": 0, "misses": 0}
+        # Weak references to the interned nodes, removed with the nodes. A plain
+        # dictionary of references is faster to query than a WeakValueDictionary.
+        self._nodes: dict[tuple, KeyedRef] = {}
+
+    def __len__(self) -> int:
+        """Number of interned nodes still alive."""
+        return len(self._nodes)
+
+    def _wrappers(self) -> dict[Target, Factory]:
+        """Interning versions of the operators and labelling named methods."""
+        factories: dict[Target, Factory] = {}
+        for names, make_wrapper in (
+            (UNARY_METHODS, self._unary_wrapper),
+            (BINARY_METHODS, self._binary_wrapper),
+            (NARY_METHODS, self._nary_wrapper),
+        ):
+            for name in names:
+                factories[(Scalar, name)] = (
+                    lambda method, _, make_wrapper=make_wrapper, name=name: (
+                        make_wrapper(method, name)
+                    )
+                )
+        for name, operator in NAMED_METHODS.items():
+            factories[(Scalar, name)] = named_method(Scalar, operator)
+        return factories
+
+    def _stop(self) -> None:
+        """Forget the interned nodes."""
+        self._nodes.clear()
+
+    def _remover(self) -> Callable[[KeyedRef], None]:
+        """Callback removing the reference to a node once it is garbage collected."""
+        nodes = self._nodes
+
+        def remove(ref: KeyedRef) -> None:
+            # The key may have been given to a newer node in the meantime.
+            if nodes.get(ref.key) is ref:
+                del nodes[ref.key]
+
+        return remove
+
+    # The lookup is written out in each wrapper, the operators being on the hot path.
+    # The data of the Scalar operands is keyed as the constants, see `_operand_key`.
+
+    def _unary_wrapper(self, method: Callable, name: str) -> Callable:
+        """Version of the unary operator `method` interning its output."""
+        nodes, stats, remove = self._nodes, self.stats, self._remover()
+        shared = Scalar._shared
+
+        @wraps(method)
+        def wrapper(x: Scalar, *args, **kwargs) -> Scalar:
+            if args or kwargs or not GradMode.enabled:
+                return method(x, *args, **kwargs)
+            d = x.data
+            key = (name, Scalar._graph_version, x, type(d), d, d or copysign(1.0, d))
+            ref = nodes.get(key)
+            if ref is not None:
+                out = ref()
+                # The released nodes are replaced.
+                if out is not None and out._prev:
+                    stats["hits"] += 1
+                    shared.add(out)
+                    return out
+            out = method(x)
+            nodes[key] = KeyedRef(out, remove, key)
+            stats["misses"] += 1
+            return out
+
+        return wrapper
+
+    def _binary_wrapper(self, method: Callable, name: str) -> Callable:
+        """Version of the binary operator `method` interning its output."""
+        nodes, stats, remove = self._nodes, self.stats, self._remover()
+        shared = Scalar._shared
+
+        @wraps(method)
+        def wrapper(x: Scalar, y) -> Scalar:
+            if not GradMode.enabled:
+                return method(x, y)
+            if isinstance(y, Scalar):
+                other, e = y, y.data
+            elif isinstance(y, (int, float)):
+                other, e = None, y
+            else:
+                # The unsupported operands are rejected by the operator itself.
+                return method(x, y)
+            d = x.data
+            key = (
+                name,
+                Scalar._graph_version,
+                x,
+                type(d),
+                d,
+                d or copysign(1.0, d),
+                other,
+                type(e),
+                e,
+                e or copysign(1.0, e),
+            )
+            ref = nodes.get(key)
+            if ref is not None:
+                out = ref()
+                if out is not None and out._prev:
+                    stats["hits"] += 1
+                    shared.add(out)
+                    return out
+            out = method(x, y)
+            nodes[key] = KeyedRef(out, remove, key)
+            stats["misses"] += 1
+            return out
+
+        return wrapper
+
+    def _nary_wrapper(self, method: Callable, name: str) -> Callable:
+        """Version of the sum or the affine operator `method` interning its output."""
+        nodes, stats, remove = self._nodes, self.stats, self._remover()
+        shared, bind = Scalar._shared, signature(method).bind
+
+        @wraps(method)
+        def wrapper(*args, **kwargs) -> Scalar:
+            # The operands may be given by keyword or left to their default, they are
+            # keyed by parameter.
+            bound = bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            if arguments["label"] is not None or not GradMode.enabled:
+                return method(*args, **kwargs)
+            # The operands of the sum are read twice, an iterator is consumed first.
+            if name == "sum" and not isinstance(arguments["items"], (list, tuple)):
+                arguments["items"] = tuple(arguments["items"])
+            key = (
+                name,
+                Scalar._graph_version,
+                *(
+                    (parameter, _operand_key(value))
+                    for parameter, value in arguments.items()
+                    if parameter != "label"
+                ),
+            )
+            try:
+                ref = nodes.get(key)
+            except TypeError:
+                # The operands that are not sequences, e.g. arrays, may be unhashable.
+                return method(*bound.args, **bound.kwargs)
+            if ref is not None:
+                out = ref()
+                if out is not None and out._prev:
+                    stats["hits"] += 1
+                    shared.add(out)
+                    return out
+            out = method(*bound.args, **bound.kwargs)
+            # The leaves, e.g. the sum of constants, are never shared.
+            if out._prev:
+                nodes[key] = KeyedRef(out, remove, key)
+                stats["misses"] += 1
+            return out
+
+        return wrapper
@@ -0,0 +1,140 @@
+"""Definition of the neural network building blocks of nanograd."""
+
+import random
+from collections.abc import Sequence
+from .scalar import Scalar
+
+
+class Parameter(Scalar):
+    """A Parameter object is a leaf Scalar holding a trainable value."""
+
+    __slots__ = ()
+
+    def __init__(self, data: int | float, label: str | None = None) -> None:
+        """Constructor."""
+        super().__init__(data, label=label, requires_grad=True)
+
+
+class Module:
+    """
+    Base class of the models. The Parameter and Module objects assigned as attributes,
+    alone or in a list or a tuple, are registered so that the parameters of the model
+    can be gathered in a flat list without traversing any computational graph.
+
+    A list is registered itself rather than its items, so that the items appended to it
+    later, e.g. to a list assigned empty, are registered as well.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        object.__setattr__(self, "_parameters", {})
+        object.__setattr__(self, "_modules", {})
+
+    def __setattr__(self, name: str, value) -> None:
+        """Set an attribute, registering the parameters and sub-modules it holds."""
+        self._parameters.pop(name, None)
+        self._modules.pop(name, None)
+        if isinstance(value, (list, tuple)):
+            # The list may be filled later with parameters or with modules, it is
+            # registered as a group of both.
+            if all(isinstance(item, (Parameter, Module)) for item in value):
+                self._parameters[name] = value
+                self._modules[name] = value
+        elif isinstance(value, Parameter):
+            self._parameters[name] = [value]
+        elif isinstance(value, Module):
+            self._modules[name] = [value]
+        object.__setattr__(self, name, value)
+
+    def parameters(self) -> list[Parameter]:
+        """
+        Return the flat list of the parameters of the module and its sub-modules. A
+        parameter shared by several of them, e.g. tied weights, is listed once.
+        """
+        params, seen = [], set()
+        for p in self._gather():
+            if id(p) not in seen:
+                seen.add(id(p))
+                params.append(p)
+        return params
+
+    def _gather(self) -> list[Parameter]:
+        """Parameters of the module and its sub-modules, with repetitions."""
+        # The items of the registered lists are checked again, they may have changed.
+        params = [
+            p
+            for group in self._parameters.values()
+            for p in group
+            if isinstance(p, Parameter)
+        ]
+        for group in self._modules.values():
+            for module in group:
+                if isinstance(module, Module):
+                    params.extend(module._gather())
+        return params
+
+    def zero_grad(self) -> None:
+        """Reset the gradient of all the parameters."""
+        for p in self.parameters():
+            p._grad = 0.0
+
+    def step(self, lr: float) -> None:
+        """Perform one step of gradient descent with the learning rate `lr`."""
+        for p in self.parameters():
+            p.data -= lr * p._grad
+
+    def __call__(self, *args, **kwargs):
+        """Forward pass."""
+        return self.forward(*args, **kwargs)
+
+    def forward(self, *args, **kwargs):
+        """Forward pass, to be defined by the sub-classes."""
+        raise NotImplementedError
+
+
+class Neuron(Module):
+    """Neuron computing an affine function of its inputs, optionally followed by tanh."""
+
+    def __init__(self, n_in: int, nonlin: bool = True) -> None:
+        """Constructor."""
+        super().__init__()
+        self.w = [Parameter(random.uniform(-1.0, 1.0)) for _ in range(n_in)]
+        self.b = Parameter(0.0)
+        self.nonlin = nonlin
+
+    def forward(self, xs: Sequence[int | float | Scalar]) -> Scalar:
+        """Forward pass."""
+        out = Scalar.dot(self.w, xs, self.b)
+        return out.tanh() if self.nonlin else out
+
+
+class Layer(Module):
+    """Layer of neurons sharing the same inputs."""
+
+    def __init__(self, n_in: int, n_out: int, nonlin: bool = True) -> None:
+        """Constructor."""
+        super().__init__()
+        self.neurons = [Neuron(n_in, nonlin=nonlin) for _ in range(n_out)]
+
+    def forward(self, xs: Sequence[int | float | Scalar]) -> list[Scalar]:
+        """Forward pass."""
+        return [neuron(xs) for neuron in self.neurons]
+
+
+class MLP(Module):
+    """Multi-layer perceptron, the last layer being linear."""
+
+    def __init__(self, n_in: int, n_outs: Sequence[int]) -> None:
+        """Constructor."""
+        super().__init__()
+        sizes = [n_in, *n_outs]
+        self.layers = [
+            Layer(sizes[i], sizes[i + 1], nonlin=i != len(n_outs) - 1)
+            for i in range(len(n_outs))
+        ]
+
+    def forward(self, xs: Sequence[int | float | Scalar]) -> list[Scalar]:
+        """Forward pass."""
+        for layer in self.layers:
+            xs = layer(xs)
+        return xs
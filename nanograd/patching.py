@@ -0,0 +1,132 @@
+"""
+Installation of the wrappers of the opt-in contexts replacing methods of the Scalar
+object, e.g. `profile`, `hash_consing` and `simplify`.
+
+Each active context is a layer of wrappers, the layers being stacked in the order the
+contexts were entered. An attribute is the composition of the wrappers of the active
+layers over its original value, rebuilt whenever a context is entered or exited: the
+contexts can be combined and exited in any order. A context entered again while it is
+active, e.g. by a recursive function it decorates, is a no-op.
+"""
+
+from contextlib import ContextDecorator
+from functools import wraps
+from typing import Callable
+
+# Attribute patched by a context: its owner, a class or a module, and its name.
+Target = tuple[object, str]
+
+# Function building the wrapper of an attribute from its value below the layer and the
+# values of all the patched attributes below the layer.
+Factory = Callable[[Callable, dict[Target, Callable]], Callable]
+
+# Original values of the patched attributes, as found in the namespace of their owner.
+_ORIGINALS: dict[Target, object] = {}
+
+# Active contexts, in the order they were entered.
+_LAYERS: list["PatchingContext"] = []
+
+
+def _unwrap(value: object) -> Callable:
+    """Function of an attribute, a static method being unwrapped."""
+    return value.__func__ if isinstance(value, staticmethod) else value
+
+
+def _rebuild() -> None:
+    """Install the composition of the wrappers of the active layers."""
+    for layer in _LAYERS:
+        for target in layer._factories:
+            if target not in _ORIGINALS:
+                owner, name = target
+                _ORIGINALS[target] = vars(owner)[name]
+    current = {target: _unwrap(value) for target, value in _ORIGINALS.items()}
+    patched = set()
+    for layer in _LAYERS:
+        below = dict(current)
+        for target, factory in layer._factories.items():
+            current[target] = factory(below[target], below)
+            patched.add(target)
+    for target, original in _ORIGINALS.items():
+        owner, name = target
+        if target not in patched:
+            value = original
+        elif isinstance(original, staticmethod):
+            value = staticmethod(current[target])
+        else:
+            value = current[target]
+        setattr(owner, name, value)
+    # The attributes are read again by the next context, they may have been replaced.
+    if not _LAYERS:
+        _ORIGINALS.clear()
+
+
+def named_method(owner: type, operator: str) -> Factory:
+    """
+    Factory of the wrapper of a named method, e.g. `Scalar.add`, calling the operator
+    `operator` of `owner`, e.g. `__add__`, and labelling its output. Without label, the
+    operator of all the layers is called. With a label, the operator below the layer is
+    called instead, so that the layer neither returns nor relabels an existing node.
+    """
+    # Number of operands of the operator besides the object, the label may follow them.
+    arity = 0 if operator in ("__neg__", "__invert__") else 1
+
+    def factory(method: Callable, below: dict[Target, Callable]) -> Callable:
+        operator_below = below[(owner, operator)]
+
+        @wraps(method)
+        def wrapper(x, *args, label: str | None = None):
+            if len(args) > arity:
+                *args, label = args
+            if label is None:
+                return getattr(x, operator)(*args)
+            out = operator_below(x, *args)
+            out.label = label
+            return out
+
+        return wrapper
+
+    return factory
+
+
+class PatchingContext(ContextDecorator):
+    """
+    Context manager, also usable as a decorator, installing the wrappers given by
+    `_wrappers` while it is active. The sub-classes may also define `_start` and
+    `_stop`, called when the wrappers are installed and removed.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        # Number of nested entries of the object, only the outermost one patching.
+        self._depth = 0
+        self._factories: dict[Target, Factory] = {}
+
+    def _wrappers(self) -> dict[Target, Factory]:
+        """Factories of the wrappers of the patched attributes."""
+        raise NotImplementedError
+
+    def _start(self) -> None:
+        """Called once the wrappers are installed."""
+
+    def _stop(self) -> None:
+        """Called once the wrappers are removed."""
+
+    def __enter__(self):
+        """Install the wrappers, unless the object is already active."""
+        self._depth += 1
+        if self._depth == 1:
+            self._factories = self._wrappers()
+            _LAYERS.append(self)
+            _rebuild()
+            self._start()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        """Remove the wrappers when the outermost entry of the object is exited."""
+        self._depth -= 1
+        if self._depth == 0:
+            _LAYERS.remove(self)
+            _rebuild()
+            self._factories = {}
+            self._stop()
+        return False
@@ -0,0 +1,187 @@
+"""
+Opt-in profiler of the forward and backward passes of the Scalar object.
+
+Within a `profile` context, the operators of the Scalar object, its backward rule and
+the topological sort of the backward pass are replaced by timed wrappers, which are
+removed on exit: outside of the context, the engine runs its own methods and the
+profiler costs nothing. The statistics are recorded per Operation. The wrappers are
+installed through `patching`, so that the profiler can be combined with the other
+contexts patching the Scalar object.
+"""
+
+import json
+import tracemalloc
+from functools import wraps
+from time import perf_counter
+from typing import Callable
+from . import scalar as scalar_module
+from .enums import Operation
+from .patching import Factory, PatchingContext, Target
+from .scalar import Scalar
+
+# Entry points of the forward pass and the operation of the nodes they create. The
+# named methods, e.g. `Scalar.add`, call the operators and are timed through them.
+FORWARD_METHODS: dict[str, Operation] = {
+    "__add__": Operation.ADDITION,
+    "__radd__": Operation.ADDITION,
+    "__neg__": Operation.NEGATION,
+    "__sub__": Operation.SUBTRACTION,
+    "__rsub__": Operation.SUBTRACTION,
+    "__mul__": Operation.MULTIPLICATION,
+    "__rmul__": Operation.MULTIPLICATION,
+    "__truediv__": Operation.DIVISION,
+    "__rtruediv__": Operation.DIVISION,
+    "__floordiv__": Operation.FLOOR_DIVISION,
+    "__rfloordiv__": Operation.FLOOR_DIVISION,
+    "__invert__": Operation.INVERTION,
+    "__pow__": Operation.EXPONENTIATION,
+    "__rpow__": Operation.EXPONENTIATION,
+    "exp": Operation.EXPONENTIAL,
+    "tanh": Operation.HYPERBOLIC_TANGENT,
+    "relu": Operation.RELU,
+    "sum": Operation.SUM,
+    "dot": Operation.LINEAR,
+}
+
+FIELDS = ("calls", "nodes", "forward", "backward", "bytes")
+
+
+class profile(PatchingContext):
+    """
+    Context manager, also usable as a decorator, recording per Operation the number of
+    calls of the operators, the number of nodes they create, the time spent in them
+    and in the backward rule of their nodes, and the time spent in the topological
+    sort of the backward pass.
+
+    If `memory` is True, the bytes allocated by the operators and still held when they
+    return, i.e. mostly their output nodes, are recorded with `tracemalloc`, which
+    slows down the whole program while it traces.
+    """
+
+    def __init__(self, memory: bool = False) -> None:
+        """Constructor."""
+        super().__init__()
+        self.memory = memory
+        self.stats: dict[Operation, dict[str, int | float]] = {
+            op: dict.fromkeys(FIELDS, 0) for op in Operation
+        }
+        self.topological_sort = {"calls": 0, "time": 0.0}
+        self._started_tracing = False
+
+    def _wrappers(self) -> dict[Target, Factory]:
+        """Timed wrappers of the operators, the backward rule and the sort."""
+        forward, backward, sort = (
+            self._forward_wrapper,
+            self._backward_wrapper,
+            self._sort_wrapper,
+        )
+        factories: dict[Target, Factory] = {
+            (Scalar, name): lambda method, _, op=op: forward(method, op)
+            for name, op in FORWARD_METHODS.items()
+        }
+        factories[(Scalar, "_backward_fn")] = lambda method, _: backward(method)
+        factories[(scalar_module, "topological_sort")] = lambda fn, _: sort(fn)
+        return factories
+
+    def _start(self) -> None:
+        """Start tracing the memory if requested."""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def _stop(self) -> None:
+        """Stop tracing the memory if it was started by the profiler."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _forward_wrapper(self, method: Callable, op: Operation) -> Callable:
+        """Timed version of the operator `method`, creating nodes of operation `op`."""
+        record, memory = self.stats[op], self.memory
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            before = tracemalloc.get_traced_memory()[0] if memory else 0
+            start = perf_counter()
+            out = method(*args, **kwargs)
+            record["forward"] += perf_counter() - start
+            if memory:
+                record["bytes"] += tracemalloc.get_traced_memory()[0] - before
+            record["calls"] += 1
+            # Without gradient, or with constants only, the output is a leaf.
+            if out._op is op:
+                record["nodes"] += 1
+            return out
+
+        return wrapper
+
+    def _backward_wrapper(self, method: Callable) -> Callable:
+        """Timed version of the backward rule `method`."""
+        stats = self.stats
+
+        @wraps(method)
+        def wrapper(node: Scalar) -> None:
+            # The leaves have nothing to propagate.
+            if node._op is Operation.NONE:
+                return method(node)
+            start = perf_counter()
+            method(node)
+            stats[node._op]["backward"] += perf_counter() - start
+
+        return wrapper
+
+    def _sort_wrapper(self, function: Callable) -> Callable:
+        """Timed version of the topological sort `function`."""
+        record = self.topological_sort
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            out = function(*args, **kwargs)
+            record["time"] += perf_counter() - start
+            record["calls"] += 1
+            return out
+
+        return wrapper
+
+    def to_dict(self) -> dict:
+        """Statistics of the operations that were used, and of the topological sort."""
+        return {
+            "operations": {
+                op.value: dict(record)
+                for op, record in self.stats.items()
+                if record["calls"] or record["backward"]
+            },
+            "topological_sort": dict(self.topological_sort),
+        }
+
+    def to_json(self, path: str | None = None) -> str:
+        """JSON of the statistics, also written to the file `path` if given."""
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def report(self) -> str:
+        """Table of the statistics, the most time-consuming operations first."""
+        records = sorted(
+            self.to_dict()["operations"].items(),
+            key=lambda item: item[1]["forward"] + item[1]["backward"],
+            reverse=True,
+        )
+        lines = [
+            f"{'operation':12}{'calls':>10}{'nodes':>10}{'forward ms':>14}"
+            f"{'backward ms':>14}{'bytes':>12}"
+        ]
+        for name, record in records:
+            lines.append(
+                f"{name:12}{record['calls']:>10}{record['nodes']:>10}"
+                f"{record['forward'] * 1e3:>14.3f}{record['backward'] * 1e3:>14.3f}"
+                f"{record['bytes']:>12}"
+            )
+        sort = self.topological_sort
+        lines.append(
+            f"topological sort: {sort['calls']} calls, {sort['time'] * 1e3:.3f} ms"
+        )
+        return "\n".join(lines)
@@ -0,0 +1,257 @@
+"""
+Module containing the numerical rules of the operations supported by nanograd.
+
+A forward rule computes the value of the output of an operation from the values of
+its operands.
+
+A local gradient rule computes the partial derivative of the output of an operation
+with respect to one of its operands. Its arguments are the value of the output, the
+values of all the operands and the index of the operand of interest.
+
+A local gradient tangent rule computes the directional derivative of a local gradient,
+given the tangents of the output and of the operands along the direction. It is the
+second-order information used by the Hessian-vector products.
+"""
+
+import operator
+from math import exp, log, tanh
+from typing import Callable
+from .enums import Operation
+
+
+def _identity(x: float) -> float:
+    """Identity."""
+    return x
+
+
+def _inv(x: float) -> float:
+    """Invertion."""
+    return x ** (-1.0)
+
+
+def _relu(x: float) -> float:
+    """ReLU."""
+    return max(0.0, x)
+
+
+def _sum(*args: float) -> float:
+    """Sum of any number of operands."""
+    return sum(args)
+
+
+def _linear(*args: float) -> float:
+    """
+    Affine function. The operands are the weights, followed by the inputs and by the
+    bias if their number is odd.
+    """
+    n = len(args) // 2
+    out = sum(map(operator.mul, args[:n], args[n : 2 * n]))
+    return out + args[-1] if len(args) % 2 else out
+
+
+FORWARD_RULES: dict[Operation, Callable[..., float]] = {
+    Operation.IDENTITY: _identity,
+    Operation.ADDITION: operator.add,
+    Operation.NEGATION: operator.neg,
+    Operation.SUBTRACTION: operator.sub,
+    Operation.MULTIPLICATION: operator.mul,
+    Operation.DIVISION: operator.truediv,
+    Operation.FLOOR_DIVISION: operator.floordiv,
+    Operation.INVERTION: _inv,
+    Operation.EXPONENTIATION: operator.pow,
+    Operation.EXPONENTIAL: exp,
+    Operation.HYPERBOLIC_TANGENT: tanh,
+    Operation.RELU: _relu,
+    Operation.SUM: _sum,
+    Operation.LINEAR: _linear,
+}
+
+
+def _identity_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the identity."""
+    return 1.0
+
+
+def _add_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the addition."""
+    return 1.0
+
+
+def _neg_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the negation."""
+    return -1.0
+
+
+def _sub_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the subtraction."""
+    return 1.0 if i == 0 else -1.0
+
+
+def _mul_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the multiplication."""
+    return args[1] if i == 0 else args[0]
+
+
+def _div_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the division."""
+    x, y = args
+    return 1.0 / y if i == 0 else -x / (y**2)
+
+
+def _floordiv_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """
+    Local gradient of the floor division.
+
+    Floor division is somewhat similar to the step function, its gradient is zero
+    everywhere except at the integer values where it is undefined. For simplicity, we
+    assume that the gradient is zero everywhere.
+    """
+    return 0.0
+
+
+def _inv_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the invertion."""
+    return (-1.0) / (args[0] ** 2)
+
+
+def _pow_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the exponentiation."""
+    x, y = args
+    return y * (x ** (y - 1.0)) if i == 0 else log(x) * (x**y)
+
+
+def _exp_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the exponential."""
+    return out
+
+
+def _tanh_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the hyperbolic tangent."""
+    return 1.0 - out**2
+
+
+def _relu_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the ReLU."""
+    return 1.0 if args[0] > 0.0 else 0.0
+
+
+def _sum_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the sum."""
+    return 1.0
+
+
+def _linear_grad(out: float, args: tuple[float, ...], i: int) -> float:
+    """Local gradient of the affine function."""
+    n = len(args) // 2
+    if i < n:
+        return args[n + i]
+    return args[i - n] if i < 2 * n else 1.0
+
+
+LOCAL_GRADIENTS: dict[Operation, Callable[[float, tuple[float, ...], int], float]] = {
+    Operation.IDENTITY: _identity_grad,
+    Operation.ADDITION: _add_grad,
+    Operation.NEGATION: _neg_grad,
+    Operation.SUBTRACTION: _sub_grad,
+    Operation.MULTIPLICATION: _mul_grad,
+    Operation.DIVISION: _div_grad,
+    Operation.FLOOR_DIVISION: _floordiv_grad,
+    Operation.INVERTION: _inv_grad,
+    Operation.EXPONENTIATION: _pow_grad,
+    Operation.EXPONENTIAL: _exp_grad,
+    Operation.HYPERBOLIC_TANGENT: _tanh_grad,
+    Operation.RELU: _relu_grad,
+    Operation.SUM: _sum_grad,
+    Operation.LINEAR: _linear_grad,
+}
+
+
+def _zero_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """Tangent of a constant local gradient."""
+    return 0.0
+
+
+def _mul_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """Tangent of the local gradient of the multiplication."""
+    return dargs[1 - i]
+
+
+def _div_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """Tangent of the local gradient of the division."""
+    x, y = args
+    dx, dy = dargs
+    if i == 0:
+        return -dy / (y**2)
+    return -dx / (y**2) + 2.0 * x * dy / (y**3)
+
+
+def _inv_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """Tangent of the local gradient of the invertion."""
+    return 2.0 * dargs[0] / (args[0] ** 3)
+
+
+def _pow_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """
+    Tangent of the local gradient of the exponentiation. The logarithm of the base is
+    only evaluated when the exponent moves along the direction.
+    """
+    x, y = args
+    dx, dy = dargs
+    if i == 0:
+        res = y * (y - 1.0) * (x ** (y - 2.0)) * dx
+        if dy != 0.0:
+            res += (x ** (y - 1.0)) * (1.0 + y * log(x)) * dy
+        return res
+    return out * dx / x + log(x) * dout
+
+
+def _exp_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """Tangent of the local gradient of the exponential."""
+    return dout
+
+
+def _tanh_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """Tangent of the local gradient of the hyperbolic tangent."""
+    return -2.0 * out * dout
+
+
+def _linear_grad_tangent(
+    out: float, args: tuple[float, ...], i: int, dout: float, dargs: tuple[float, ...]
+) -> float:
+    """Tangent of the local gradient of the affine function."""
+    n = len(args) // 2
+    if i < n:
+        return dargs[n + i]
+    return dargs[i - n] if i < 2 * n else 0.0
+
+
+LOCAL_GRADIENT_TANGENTS: dict[Operation, Callable[..., float]] = {
+    Operation.IDENTITY: _zero_grad_tangent,
+    Operation.ADDITION: _zero_grad_tangent,
+    Operation.NEGATION: _zero_grad_tangent,
+    Operation.SUBTRACTION: _zero_grad_tangent,
+    Operation.MULTIPLICATION: _mul_grad_tangent,
+    Operation.DIVISION: _div_grad_tangent,
+    Operation.FLOOR_DIVISION: _zero_grad_tangent,
+    Operation.INVERTION: _inv_grad_tangent,
+    Operation.EXPONENTIATION: _pow_grad_tangent,
+    Operation.EXPONENTIAL: _exp_grad_tangent,
+    Operation.HYPERBOLIC_TANGENT: _tanh_grad_tangent,
+    Operation.RELU: _zero_grad_tangent,
+    Operation.SUM: _zero_grad_tangent,
+    Operation.LINEAR: _linear_grad_tangent,
+}
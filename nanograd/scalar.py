@@ -1,10 +1,14 @@
 """Definition of the Scalar object."""
 
-from math import exp, log, tanh
+from itertools import islice
+from math import exp, tanh
 from typing import Union
 from .enums import Operation
+from .grad_mode import GradMode
+from .rules import FORWARD_RULES, LOCAL_GRADIENTS
 from .utils import topological_sort
-from ordered_set import OrderedSet
+from collections.abc import Iterable, Sequence
+from weakref import WeakSet
 
 
 class Scalar:
@@ -14,12 +18,39 @@ class Scalar:
     backward phase.
     """
 
+    # Slots remove the per-instance `__dict__`, the graph usually holding a large
+    # number of Scalar objects.
+    __slots__ = (
+        "data",
+        "label",
+        "requires_grad",
+        "_grad",
+        "_prev",
+        "_op",
+        "_backward",
+        "_topo",
+        "_operands",
+        # Lets the nodes be interned in weak dictionaries, see `hash_consing`.
+        "__weakref__",
+    )
+
+    # Version of the `requires_grad` flags, increased by every change of one of them.
+    # A topological order cached by the backward pass at an older version is checked
+    # against the flags of its own nodes, so that the change of another graph does not
+    # invalidate it.
+    _graph_version = 0
+
+    # Nodes shared by expressions built separately, see `hash_consing`. The backward
+    # pass does not release them, nor their subgraphs, which the other expressions
+    # still use.
+    _shared: WeakSet = WeakSet()
+
     def __init__(
         self,
         data: int | float,
         label: str | None = None,
         requires_grad: bool = False,
-        _prev: OrderedSet["Scalar"] = None,
+        _prev: Iterable["Scalar"] = (),
         _op: Operation = Operation.NONE,
     ) -> None:
         """Constructor."""
@@ -27,11 +58,14 @@ class Scalar:
         self.label = label
         self.requires_grad = requires_grad
         self._grad = 0.0
-        self._prev = OrderedSet() if _prev is None else _prev
+        self._prev = _prev if type(_prev) is tuple else tuple(_prev)
         self._op = _op
-        self._backward_fn = lambda: None
-        self._backward = 0.0
-        self.requires_grad_(requires_grad)
+        # Same as `requires_grad_`, inlined since the constructor is on the hot path.
+        self._backward = 1.0 if requires_grad else 0.0
+        self._topo = None
+        # Operands of the node in the order of the operation, set only when some of
+        # them are constants kept inline instead of being wrapped in Scalar leaves.
+        self._operands = None
 
     @staticmethod
     def supported_type(x: Union[int, float, "Scalar"]) -> None:
@@ -44,11 +78,11 @@ class Scalar:
         x: int | float, label: str | None = None, requires_grad: bool = False
     ) -> "Scalar":
         """Return the argument `x` as a Scalar if it is possible."""
-        Scalar.supported_type(x)
+        # Scalar operands are the most common case, they are returned right away.
         if isinstance(x, Scalar):
             return x
-        elif isinstance(x, (int, float)):
-            return Scalar(x, label=label, requires_grad=requires_grad)
+        Scalar.supported_type(x)
+        return Scalar(x, label=label, requires_grad=requires_grad)
 
     def requires_grad_(self, requires_grad: bool) -> None:
         """Set the `requires_grad` attribute of the object."""
@@ -57,6 +91,10 @@ class Scalar:
         # 1.0 so that the gradient is computed during the backward phase.
         # Otherwise, we set it to 0.0 so that the gradient is not computed.
         self._backward = 1.0 if requires_grad else 0.0
+        # The nodes visited by the backward pass of the graphs containing the object
+        # may change, the cached topological orders have to be checked again. Note that
+        # the nodes already built from the object keep their own `requires_grad`.
+        Scalar._graph_version += 1
 
     def add(
         self, other: Union[int, float, "Scalar"], label: str | None = None
@@ -120,282 +158,447 @@ class Scalar:
 
     def exp(self, label: str | None = None) -> "Scalar":
         """Exponential operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(exp(self.data), label=label)
         # Perform the exponential.
         out = Scalar(
             exp(self.data),
             label=label,
-            requires_grad=True,
-            _prev=OrderedSet([self]),
+            requires_grad=self.requires_grad,
+            _prev=(self,),
             _op=Operation.EXPONENTIAL,
         )
-
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += self._backward * (out.data) * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def tanh(self, label: str | None = None) -> "Scalar":
         """Hyperbolic tangent operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(tanh(self.data), label=label)
         # Perform the hyperbolic tangent.
         out = Scalar(
             tanh(self.data),
             label=label,
-            requires_grad=True,
-            _prev=OrderedSet([self]),
+            requires_grad=self.requires_grad,
+            _prev=(self,),
             _op=Operation.HYPERBOLIC_TANGENT,
         )
-
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += self._backward * (1.0 - out.data**2) * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def relu(self, label: str | None = None) -> "Scalar":
         """ReLU operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(max(0.0, self.data), label=label)
         # Perform the ReLU.
         out = Scalar(
             max(0.0, self.data),
             label=label,
-            requires_grad=True,
-            _prev=OrderedSet([self]),
+            requires_grad=self.requires_grad,
+            _prev=(self,),
             _op=Operation.RELU,
         )
+        return out
 
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += self._backward * (1.0 if self.data > 0.0 else 0.0) * out._grad
+    @staticmethod
+    def _constant(
+        op: Operation,
+        left: Union[int, float, "Scalar"],
+        right: Union[int, float, "Scalar"],
+    ) -> "Scalar":
+        """
+        Node of the binary operation `op` whose operand `left` or `right` is a number.
+        The number is not cast to a Scalar but kept inline on the node as a constant,
+        which is neither visited nor differentiated by the backward pass.
+        """
+        prev, const = (left, right) if isinstance(left, Scalar) else (right, left)
+        # Check that the type of the constant is supported.
+        if not isinstance(const, (int, float)):
+            raise TypeError(f"The following type {type(const)} is not supported.")
+        forward = FORWARD_RULES[op]
+        data = forward(prev.data, const) if prev is left else forward(const, prev.data)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(data)
+        out = Scalar(data, requires_grad=prev.requires_grad, _prev=(prev,), _op=op)
+        out._operands = (left, right)
+        return out
 
-        out._backward_fn = _backward_fn
+    @staticmethod
+    def _node(
+        op: Operation,
+        operands: Sequence[Union[int, float, "Scalar"]],
+        label: str | None = None,
+    ) -> "Scalar":
+        """
+        Node of the n-ary operation `op`, the numbers among the operands being kept
+        inline as constants.
+        """
+        for x in operands:
+            Scalar.supported_type(x)
+        data = FORWARD_RULES[op](
+            *[x.data if isinstance(x, Scalar) else x for x in operands]
+        )
+        prev = tuple(x for x in operands if isinstance(x, Scalar))
+        # Without gradient, or without any Scalar operand, only the data of the output
+        # is computed.
+        if not GradMode.enabled or not prev:
+            return Scalar(data, label=label)
+        out = Scalar(
+            data,
+            label=label,
+            requires_grad=any(x.requires_grad for x in prev),
+            _prev=prev,
+            _op=op,
+        )
+        if len(prev) != len(operands):
+            out._operands = tuple(operands)
         return out
 
-    def backward(self) -> None:
-        """Backward pass."""
-        # Compute the topological sort of the computational graph.
-        topo = topological_sort(self)
+    @staticmethod
+    def sum(
+        items: Iterable[Union[int, float, "Scalar"]], label: str | None = None
+    ) -> "Scalar":
+        """
+        Sum operator: the sum of any number of operands is a single node, instead of a
+        chain of additions.
+        """
+        return Scalar._node(Operation.SUM, tuple(items), label=label)
+
+    @staticmethod
+    def dot(
+        ws: Sequence[Union[int, float, "Scalar"]],
+        xs: Sequence[Union[int, float, "Scalar"]],
+        bias: Union[int, float, "Scalar", None] = None,
+        label: str | None = None,
+    ) -> "Scalar":
+        """
+        Affine operator computing the dot product of `ws` and `xs` plus `bias`. It is a
+        single node whose children are the weights, the inputs and the bias, instead of
+        one node per multiplication and per addition.
+        """
+        if len(ws) != len(xs):
+            raise ValueError(
+                f"The operands have different lengths: {len(ws)} and {len(xs)}."
+            )
+        items = (*ws, *xs) if bias is None else (*ws, *xs, bias)
+        return Scalar._node(Operation.LINEAR, items, label=label)
+
+    def _backward_fn(self) -> None:
+        """
+        Propagate the gradient of the node to its children.
+
+        The local gradients are given by the rule associated to the operation of the
+        node, so that no backward closure has to be created along with the node. The
+        constant operands are skipped, their local gradient is never computed.
+        """
+        if not self._prev:
+            if self._op is not Operation.NONE:
+                raise RuntimeError(
+                    "Trying to backward through a graph that has already been freed, "
+                    "call backward with retain_graph=True to keep it."
+                )
+            return
+        if self._op is Operation.SUM:
+            # The local gradients are all ones, the gradient is fanned out as is.
+            grad = self._grad
+            for prev in self._prev:
+                if prev.requires_grad:
+                    prev._grad += prev._backward * grad
+            return
+        if self._op is Operation.LINEAR:
+            # The local gradient of a weight is its input and conversely, they are all
+            # written in one pass.
+            grad = self._grad
+            operands = self._prev if self._operands is None else self._operands
+            args = [x.data if isinstance(x, Scalar) else x for x in operands]
+            n = len(operands) // 2
+            for w, x in zip(operands[:n], args[n : 2 * n]):
+                if isinstance(w, Scalar) and w.requires_grad:
+                    w._grad += w._backward * x * grad
+            for w, x in zip(args[:n], operands[n : 2 * n]):
+                if isinstance(x, Scalar) and x.requires_grad:
+                    x._grad += x._backward * w * grad
+            b = operands[-1]
+            if len(operands) % 2 and isinstance(b, Scalar) and b.requires_grad:
+                b._grad += b._backward * grad
+            return
+        local_grad = LOCAL_GRADIENTS[self._op]
+        if self._operands is not None:
+            # Apart from the sum and affine nodes, the nodes holding a constant are
+            # binary with a single child: only its local gradient is computed, so that
+            # the rule is never evaluated with respect to the constant.
+            prev = self._prev[0]
+            if prev.requires_grad:
+                left, right = self._operands
+                if left is prev:
+                    i, args = 0, (prev.data, right)
+                else:
+                    i, args = 1, (left, prev.data)
+                prev._grad += (
+                    prev._backward * local_grad(self.data, args, i) * self._grad
+                )
+            return
+        args = tuple(prev.data for prev in self._prev)
+        for i, prev in enumerate(self._prev):
+            # The local gradient of the children that do not require gradient is not
+            # even computed.
+            if prev.requires_grad:
+                prev._grad += (
+                    prev._backward * local_grad(self.data, args, i) * self._grad
+                )
+
+    def backward(self, retain_graph: bool = False) -> None:
+        """
+        Backward pass.
+
+        Only the nodes requiring gradient, i.e. the ones lying on a path from the
+        object to a leaf requiring gradient, are visited.
+
+        By default, the links of the intermediate nodes to their children are released
+        once their gradient has been propagated, so that the graph can be garbage
+        collected while the object is still alive. The intermediate nodes keep their
+        data and gradient, but the graph cannot be differentiated again.
+
+        If `retain_graph` is True, the graph is kept and its topological order is cached
+        on the object so that the next calls skip the traversal of the graph, until the
+        `requires_grad` flag of one of its nodes changes. The nodes released by the
+        backward pass of another graph are not reused, the cached order raises on them
+        as the traversal would.
+        """
+        cache = self._topo
+        version = Scalar._graph_version
+        if cache is not None and (cache[0] == version or Scalar._same_flags(cache)):
+            order, excluded = cache[1], cache[2]
+        else:
+            # Compute the topological sort of the computational graph, from the root
+            # to the leaves.
+            order = tuple(reversed(topological_sort(self, requires_grad_only=True)))
+            excluded = None
+        if retain_graph:
+            # The children left out of the order are kept to check the flags later.
+            if excluded is None:
+                excluded = tuple(
+                    prev for x in order for prev in x._prev if not prev.requires_grad
+                )
+            self._topo = (version, order, excluded)
+        else:
+            self._topo = None
+        # Reset the gradient of the intermediate nodes so that the gradient of a
+        # previous call is not propagated twice.
+        for x in order:
+            if x._prev:
+                x._grad = 0.0
         # Perform the backward pass.
         self._grad = 1.0
-        for x in reversed(topo):
-            x._backward_fn()
+        if retain_graph:
+            for x in order:
+                x._backward_fn()
+        else:
+            if Scalar._shared:
+                for x in order:
+                    x._backward_fn()
+                Scalar._release_graph(order)
+            else:
+                for x in order:
+                    x._backward_fn()
+                    x._prev = ()
+                    x._operands = None
+
+    @staticmethod
+    def _same_flags(cache: tuple) -> bool:
+        """
+        Whether the cached topological order is still the one of its graph: its nodes
+        other than the root still require gradient, and the children it left out still
+        do not.
+        """
+        _, order, excluded = cache
+        return all(x.requires_grad for x in islice(order, 1, None)) and not any(
+            x.requires_grad for x in excluded
+        )
+
+    @staticmethod
+    def _release_graph(order: Iterable["Scalar"]) -> None:
+        """
+        Release the links of the nodes of `order`, sorted from the root to the leaves,
+        to their children. The shared nodes and their subgraphs are kept.
+        """
+        shared = Scalar._shared
+        if not shared:
+            for x in order:
+                x._prev = ()
+                x._operands = None
+            return
+        # The parents of a node come before it, the nodes below a kept node are known
+        # to be kept when they are reached.
+        kept = set(shared)
+        for x in order:
+            if x in kept:
+                kept.update(x._prev)
+            else:
+                x._prev = ()
+                x._operands = None
 
     def __add__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Addition operator."""
-        # Check that the type of the argument is supported and cast it to a Scalar if
-        # necessary.
-        other = Scalar.as_scalar(other)
+        # A number is kept inline as a constant instead of being cast to a Scalar.
+        if not isinstance(other, Scalar):
+            return Scalar._constant(Operation.ADDITION, self, other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(self.data + other.data)
         # Perform the addition.
         out = Scalar(
             self.data + other.data,
-            requires_grad=True,
-            _prev=OrderedSet([self, other]),
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
             _op=Operation.ADDITION,
         )
-
-        # Define the backward function: the gradient of each operand is the gradient of
-        # the output
-        def _backward_fn() -> None:
-            self._grad += self._backward * (1.0) * out._grad
-            other._grad += other._backward * (1.0) * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def __radd__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Right addition operator."""
-        # Addition is commutative, so we can use the __add__ method.
-        return self + other
+        # The operands are swapped, a number being kept inline as a constant.
+        return Scalar._constant(Operation.ADDITION, other, self)
 
     def __neg__(self) -> "Scalar":
         """Negation operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(-self.data)
         # Perform the negation.
         out = Scalar(
             -self.data,
-            requires_grad=True,
-            _prev=OrderedSet([self]),
+            requires_grad=self.requires_grad,
+            _prev=(self,),
             _op=Operation.NEGATION,
         )
-
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += self._backward * (-1.0) * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def __sub__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Subtraction operator."""
-        # Check that the type of the argument is supported and cast it to a Scalar if
-        # necessary.
-        other = Scalar.as_scalar(other)
+        # A number is kept inline as a constant instead of being cast to a Scalar.
+        if not isinstance(other, Scalar):
+            return Scalar._constant(Operation.SUBTRACTION, self, other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(self.data - other.data)
         # Perform the subtraction.
         out = Scalar(
             self.data - other.data,
-            requires_grad=True,
-            _prev=OrderedSet([self, other]),
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
             _op=Operation.SUBTRACTION,
         )
-
-        # Define the backward function: the gradient of each operand is the gradient of
-        # the output
-        def _backward_fn() -> None:
-            self._grad += self._backward * (1.0) * out._grad
-            other._grad += other._backward * (-1.0) * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def __rsub__(self, other: int | float) -> "Scalar":
         """Right subtraction operator."""
-        other = Scalar.as_scalar(other)
-        out = other - self
-        return out
+        # The operands are swapped, a number being kept inline as a constant.
+        return Scalar._constant(Operation.SUBTRACTION, other, self)
 
     def __mul__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Multiplication operator."""
-        # Check that the type of the argument is supported and cast it to a Scalar if
-        # necessary.
-        other = Scalar.as_scalar(other)
+        # A number is kept inline as a constant instead of being cast to a Scalar.
+        if not isinstance(other, Scalar):
+            return Scalar._constant(Operation.MULTIPLICATION, self, other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(self.data * other.data)
         # Perform the multiplication.
         out = Scalar(
             self.data * other.data,
-            requires_grad=True,
-            _prev=OrderedSet([self, other]),
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
             _op=Operation.MULTIPLICATION,
         )
-
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += self._backward * other.data * out._grad
-            other._grad += other._backward * self.data * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def __rmul__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Right multiplication operator."""
-        # Multiplication is commutative, so we can use the __mul__ method.
-        other = Scalar.as_scalar(other)
-        return other * self
+        # The operands are swapped, a number being kept inline as a constant.
+        return Scalar._constant(Operation.MULTIPLICATION, other, self)
 
     def __truediv__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """True division operator."""
-        # Check that the type of the argument is supported and cast it to a Scalar if
-        # necessary.
-        other = Scalar.as_scalar(other)
-        # Perform the division
+        # A number is kept inline as a constant instead of being cast to a Scalar.
+        if not isinstance(other, Scalar):
+            return Scalar._constant(Operation.DIVISION, self, other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(self.data / other.data)
+        # Perform the division.
         out = Scalar(
             self.data / other.data,
-            requires_grad=True,
-            _prev=OrderedSet([self, other]),
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
             _op=Operation.DIVISION,
         )
-
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += self._backward * (1.0 / other.data) * out._grad
-            other._grad += (
-                other._backward * (-self.data / (other.data**2)) * out._grad
-            )
-
-        out._backward_fn = _backward_fn
         return out
 
     def __rtruediv__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Right true division operator."""
-        # Division is a non-commutative operator, we cannot re-use the code of the
-        # __truediv__ method directly.
-        other = Scalar.as_scalar(other)
-        out = other / self
-        return out
+        # The operands are swapped, a number being kept inline as a constant.
+        return Scalar._constant(Operation.DIVISION, other, self)
 
     def __floordiv__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Floor division operator."""
-        # Check that the type of the argument is supported and cast it to a Scalar if
-        # necessary.
-        other = Scalar.as_scalar(other)
-        # Perform the floor division
+        # A number is kept inline as a constant instead of being cast to a Scalar.
+        if not isinstance(other, Scalar):
+            return Scalar._constant(Operation.FLOOR_DIVISION, self, other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(self.data // other.data)
+        # Perform the floor division.
         out = Scalar(
             self.data // other.data,
-            requires_grad=True,
-            _prev=OrderedSet([self, other]),
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
             _op=Operation.FLOOR_DIVISION,
         )
-
-        # Define the backward function
-        # Floor division is somewhat similar to the step function, its gradient
-        # is zero everywhere except at the integer values where it is undefined.
-        # For simplicity, we will assume that the gradient is zero everywhere.
-        def _backward_fn() -> None:
-            self._grad += self._backward * 0.0 * out._grad
-            other._grad += other._backward * 0.0 * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def __rfloordiv__(self, other: int | float) -> "Scalar":
         """Right floor division operator."""
-        # Because gradient is always zero, we can re-use the code of the
-        # __floordiv__ method directly.
-        other = Scalar.as_scalar(other)
-        out = other // self
-        return out
+        # The operands are swapped, a number being kept inline as a constant.
+        return Scalar._constant(Operation.FLOOR_DIVISION, other, self)
 
     def __invert__(self) -> "Scalar":
         """Inverse operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(self.data ** (-1.0))
         # Perform the invertion operation
         out = Scalar(
             self.data ** (-1.0),
-            requires_grad=True,
-            _prev=OrderedSet([self]),
+            requires_grad=self.requires_grad,
+            _prev=(self,),
             _op=Operation.INVERTION,
         )
-
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += self._backward * ((-1.0) / (self.data**2)) * out._grad
-
-        out._backward_fn = _backward_fn
         return out
 
     def __pow__(self, other: Union[int, float, "Scalar"]) -> "Scalar":
         """Exponentiation operator."""
-        # Check that the type of the argument is supported and cast it to a Scalar if
-        # necessary.
-        other = Scalar.as_scalar(other)
-        # Perform the exponentiation
+        # A number is kept inline as a constant instead of being cast to a Scalar.
+        if not isinstance(other, Scalar):
+            return Scalar._constant(Operation.EXPONENTIATION, self, other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Scalar(self.data**other.data)
+        # Perform the exponentiation.
         out = Scalar(
             self.data**other.data,
-            requires_grad=True,
-            _prev=OrderedSet([self, other]),
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
             _op=Operation.EXPONENTIATION,
         )
-
-        # Define the backward function
-        def _backward_fn() -> None:
-            self._grad += (
-                self._backward
-                * (other.data * ((self.data) ** (other.data - 1.0)))
-                * out._grad
-            )
-            other._grad += (
-                other._backward
-                * (log(self.data) * (self.data**other.data))
-                * out._grad
-            )
-
-        out._backward_fn = _backward_fn
         return out
 
     def __rpow__(self, other: int | float) -> "Scalar":
         """Right exponentiation operator."""
-        # Exponentiation is a non-commutative operator, we cannot re-use the code of the
-        # __pow__ method directly.
-        other = Scalar.as_scalar(other)
-        out = other**self
-        return out
+        # The operands are swapped, a number being kept inline as a constant.
+        return Scalar._constant(Operation.EXPONENTIATION, other, self)
 
     def __str__(self) -> str:
         """Provide a string representation of the object."""
@@ -0,0 +1,135 @@
+"""
+Opt-in algebraic simplification of the operations of the Scalar object.
+
+Within a `simplify` context, the operators of the Scalar object fold the trivial
+operations instead of recording them: `x + 0`, `x - 0`, `x * 1`, `x / 1` and `x ** 1`
+return a pass-through node of `x`, whose operation is the identity, so that neither the
+constant nor the rule of the operation is kept. An operation is only folded when its
+output would hold exactly the data of `x`, down to its type and the sign of a zero, e.g.
+`-0.0 + 0` is not folded. The data of the nodes is therefore not changed.
+
+The gradients are the ones of the eager engine, bit for bit. The local gradients of the
+folded operations are exactly one, and the pass-through node takes the place of the
+folded node in the graph: its gradient is accumulated over the same parents, and given
+to `x` at the same point of the backward pass, even when it is the root.
+
+The floor division, whose gradient is zero everywhere, returns a leaf that does not
+require gradient: the backward pass does not visit it, nor the subtrees that only
+depend on it, whose gradient only received zeros from it. Adding a zero only changes
+a gradient of `-0.0`, or gives `nan` from an infinite gradient.
+
+`-(-x)` and `~(~x)` are not folded: the double negation would give its gradient to `x`
+when the outer node is reached instead of the inner one, which may be consumed by other
+nodes as well, and the inverse of the inverse of a float is not always the float.
+"""
+
+from functools import wraps
+from math import copysign
+from typing import Callable
+from .enums import Operation
+from .grad_mode import GradMode
+from .patching import Factory, PatchingContext, Target, named_method
+from .rules import FORWARD_RULES
+from .scalar import Scalar
+
+# Operators folded when their constant operand is the identity element of the
+# operation, with whether the constant is the left operand.
+FOLDED_METHODS: dict[str, tuple[Operation, int, bool]] = {
+    "__add__": (Operation.ADDITION, 0, False),
+    "__radd__": (Operation.ADDITION, 0, True),
+    "__sub__": (Operation.SUBTRACTION, 0, False),
+    "__mul__": (Operation.MULTIPLICATION, 1, False),
+    "__rmul__": (Operation.MULTIPLICATION, 1, True),
+    "__truediv__": (Operation.DIVISION, 1, False),
+    "__pow__": (Operation.EXPONENTIATION, 1, False),
+}
+
+# Named methods and the operators they call.
+NAMED_METHODS = {
+    "add": "__add__",
+    "sub": "__sub__",
+    "mul": "__mul__",
+    "div": "__truediv__",
+    "pow": "__pow__",
+    "floordiv": "__floordiv__",
+}
+
+
+def _same(a: int | float, b: int | float) -> bool:
+    """Whether the numbers `a` and `b` are the same, type and sign of zero included."""
+    if type(a) is not type(b):
+        return False
+    if a != a:
+        return b != b
+    return a == b and copysign(1.0, a) == copysign(1.0, b)
+
+
+class simplify(PatchingContext):
+    """
+    Context manager, also usable as a decorator, folding the trivial operations of the
+    Scalar object. The operations called without gradient, or given a label, are not
+    simplified.
+
+    The statistics count the folded operations (folded) and the floor divisions
+    returned as leaves (pruned).
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        super().__init__()
+        self.stats = {"folded": 0, "pruned": 0}
+
+    def _wrappers(self) -> dict[Target, Factory]:
+        """Simplifying versions of the operators and labelling named methods."""
+        folding = self._folding_wrapper
+        factories: dict[Target, Factory] = {
+            (Scalar, name): lambda method, _, spec=spec: folding(method, *spec)
+            for name, spec in FOLDED_METHODS.items()
+        }
+        for name, left in (("__floordiv__", False), ("__rfloordiv__", True)):
+            factories[(Scalar, name)] = (
+                lambda method, _, left=left: self._floordiv_wrapper(method, left)
+            )
+        for name, operator in NAMED_METHODS.items():
+            factories[(Scalar, name)] = named_method(Scalar, operator)
+        return factories
+
+    def _folding_wrapper(
+        self, method: Callable, op: Operation, identity: int, left: bool
+    ) -> Callable:
+        """Version of the operator `method` folding its identity element."""
+        forward, stats = FORWARD_RULES[op], self.stats
+
+        @wraps(method)
+        def wrapper(x: Scalar, y) -> Scalar:
+            if (
+                GradMode.enabled
+                and type(y) in (int, float)
+                and y == identity
+                and _same(forward(y, x.data) if left else forward(x.data, y), x.data)
+            ):
+                stats["folded"] += 1
+                return Scalar(
+                    x.data,
+                    requires_grad=x.requires_grad,
+                    _prev=(x,),
+                    _op=Operation.IDENTITY,
+                )
+            return method(x, y)
+
+        return wrapper
+
+    def _floordiv_wrapper(self, method: Callable, left: bool) -> Callable:
+        """Version of the floor division `method` returning a leaf."""
+        forward, stats = FORWARD_RULES[Operation.FLOOR_DIVISION], self.stats
+
+        @wraps(method)
+        def wrapper(x: Scalar, y) -> Scalar:
+            if not GradMode.enabled:
+                return method(x, y)
+            Scalar.supported_type(y)
+            y = y.data if isinstance(y, Scalar) else y
+            stats["pruned"] += 1
+            return Scalar(forward(y, x.data) if left else forward(x.data, y))
+
+        return wrapper
@@ -0,0 +1,170 @@
+"""
+Definition of the Tape object: a computational graph recorded once and replayed many
+times.
+
+Tracing a function runs it on Scalar objects, then linearises the resulting graph into
+a flat list of instructions. Each instruction holds the operation, the slots of its
+operands and the slot of its output, a slot being an index in flat lists of values and
+gradients. Replaying the tape does not allocate any node nor sort the graph again.
+"""
+
+from typing import Callable, NamedTuple
+from .cache import COMPILE_CACHE
+from .codegen import CompiledTape
+from .enums import Operation
+from .rules import FORWARD_RULES, LOCAL_GRADIENTS
+from .scalar import Scalar
+from .utils import topological_sort
+
+
+class Instruction(NamedTuple):
+    """Instruction of a tape."""
+
+    op: Operation
+    operands: tuple[int, ...]
+    out: int
+
+
+class Tape:
+    """
+    Flat representation of a computational graph of Scalar objects.
+
+    The values and gradients of the nodes are stored in flat lists indexed by slots.
+    The slots of the inputs are overwritten by each forward replay, while the other
+    leaves keep the value they had when the graph was traced.
+    """
+
+    def __init__(
+        self,
+        values: list[float],
+        backward: list[float],
+        instructions: list[Instruction],
+        inputs: list[int],
+        output: int,
+    ) -> None:
+        """Constructor."""
+        self.values = values
+        self.grads = [0.0] * len(values)
+        self.backward_mask = backward
+        self.instructions = instructions
+        self.inputs = inputs
+        self.output = output
+        self._compiled = None
+        # Resolve the rules once so that replays do not look them up.
+        self._forward_program = [
+            (FORWARD_RULES[ins.op], ins.operands, ins.out) for ins in instructions
+        ]
+        # Only the operands requiring gradient are differentiated, as in the eager
+        # backward pass.
+        self._backward_program = [
+            (
+                LOCAL_GRADIENTS[ins.op],
+                ins.operands,
+                [(k, i) for k, i in enumerate(ins.operands) if backward[i]],
+                ins.out,
+            )
+            for ins in reversed(instructions)
+        ]
+
+    @staticmethod
+    def from_graph(root: Scalar, inputs: list[Scalar]) -> "Tape":
+        """
+        Linearise the graph of `root` whose inputs are the leaves `inputs`. The inputs
+        that are not part of the graph get a slot of their own, after the nodes, whose
+        gradient stays zero.
+        """
+        topo = topological_sort(root)
+        slots = {node: slot for slot, node in enumerate(topo)}
+        values = [node.data for node in topo]
+        backward = [node._backward for node in topo]
+        input_slots = []
+        for node in inputs:
+            if node not in slots:
+                slots[node] = len(values)
+                values.append(node.data)
+                backward.append(node._backward)
+            input_slots.append(slots[node])
+
+        def slot_of(operand: int | float | Scalar) -> int:
+            """Slot of an operand, the constants getting a slot of their own."""
+            if isinstance(operand, Scalar):
+                return slots[operand]
+            values.append(operand)
+            backward.append(0.0)
+            return len(values) - 1
+
+        instructions = [
+            Instruction(
+                node._op,
+                tuple(
+                    slot_of(x)
+                    for x in (node._prev if node._operands is None else node._operands)
+                ),
+                slot,
+            )
+            for slot, node in enumerate(topo)
+            if node._prev
+        ]
+        return Tape(
+            values,
+            backward,
+            instructions,
+            input_slots,
+            slots[root],
+        )
+
+    def forward(self, *inputs: int | float) -> float:
+        """Replay the forward pass with new values of the inputs."""
+        if len(inputs) != len(self.inputs):
+            raise ValueError(
+                f"The tape expects {len(self.inputs)} inputs, got {len(inputs)}."
+            )
+        values = self.values
+        for slot, value in zip(self.inputs, inputs):
+            values[slot] = value
+        for fn, operands, out in self._forward_program:
+            values[out] = fn(*[values[i] for i in operands])
+        return values[self.output]
+
+    def backward(self) -> list[float]:
+        """
+        Replay the backward pass at the values of the last forward replay and return
+        the gradients of the inputs.
+        """
+        values, mask = self.values, self.backward_mask
+        grads = self.grads = [0.0] * len(values)
+        grads[self.output] = 1.0
+        for local_grad, operands, differentiated, out in self._backward_program:
+            if not differentiated:
+                continue
+            out_data, out_grad = values[out], grads[out]
+            args = tuple(values[i] for i in operands)
+            for k, i in differentiated:
+                grads[i] += mask[i] * local_grad(out_data, args, k) * out_grad
+        return [grads[slot] for slot in self.inputs]
+
+    def compile(self) -> CompiledTape:
+        """
+        Generate and compile straight-line functions of the forward and backward passes,
+        once per tape, the leaves that are not inputs keeping their current value. The
+        code is shared by the tapes of the same structure through `COMPILE_CACHE`.
+        """
+        if self._compiled is None:
+            self._compiled = COMPILE_CACHE.compile(self)
+        return self._compiled
+
+    def __len__(self) -> int:
+        """Number of instructions of the tape."""
+        return len(self.instructions)
+
+
+def trace(fn: Callable[..., Scalar], *inputs: int | float) -> Tape:
+    """
+    Record the graph built by `fn` called on Scalar objects requiring gradient and
+    holding the values `inputs`, and return it as a tape.
+    """
+    leaves = [Scalar(value, requires_grad=True) for value in inputs]
+    root = fn(*leaves)
+    if not isinstance(root, Scalar):
+        raise TypeError(f"The traced function must return a Scalar, got {type(root)}.")
+    return Tape.from_graph(root, leaves)
@@ -0,0 +1,601 @@
+"""Definition of the Tensor object."""
+
+from typing import Callable, Union
+import numpy as np
+from .enums import Operation
+from .grad_mode import GradMode
+from .utils import topological_sort
+from collections.abc import Iterable
+
+ArrayLike = Union[int, float, list, np.ndarray]
+
+
+def _unbroadcast(grad: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    """Sum `grad` over the dimensions that were broadcast to reach its shape."""
+    # Leading dimensions added by broadcasting.
+    while grad.ndim > len(shape):
+        grad = grad.sum(axis=0)
+    # Dimensions of size one stretched by broadcasting.
+    for axis, size in enumerate(shape):
+        if size == 1 and grad.shape[axis] != 1:
+            grad = grad.sum(axis=axis, keepdims=True)
+    return grad
+
+
+def _reduced_shape(shape: tuple[int, ...], axis) -> tuple[int, ...]:
+    """Return the shape of a reduction over `axis` with the dimensions kept."""
+    if axis is None:
+        return (1,) * len(shape)
+    axes = {a % len(shape) for a in ((axis,) if isinstance(axis, int) else axis)}
+    return tuple(1 if a in axes else size for a, size in enumerate(shape))
+
+
+def _identity_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the identity."""
+    return out._grad
+
+
+def _add_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the addition."""
+    return out._grad
+
+
+def _neg_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the negation."""
+    return -out._grad
+
+
+def _sub_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the subtraction."""
+    return out._grad if i == 0 else -out._grad
+
+
+def _mul_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the multiplication."""
+    return args[1 - i] * out._grad
+
+
+def _div_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the division."""
+    x, y = args
+    return (1.0 / y if i == 0 else -x / (y**2)) * out._grad
+
+
+def _floordiv_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the floor division, assumed to be zero everywhere."""
+    return np.zeros_like(out._grad)
+
+
+def _inv_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the invertion."""
+    return ((-1.0) / (args[0] ** 2)) * out._grad
+
+
+def _pow_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the exponentiation."""
+    x, y = args
+    if i == 0:
+        return (y * (x ** (y - 1.0))) * out._grad
+    return (np.log(x) * (x**y)) * out._grad
+
+
+def _exp_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the exponential."""
+    return out.data * out._grad
+
+
+def _tanh_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the hyperbolic tangent."""
+    return (1.0 - out.data**2) * out._grad
+
+
+def _relu_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the ReLU."""
+    return np.where(args[0] > 0.0, 1.0, 0.0) * out._grad
+
+
+def _matmul_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """
+    Vector-Jacobian product of the matrix multiplication.
+
+    One-dimensional operands are promoted to matrices the same way `np.matmul` does,
+    and the added dimension is removed from the result.
+    """
+    a, b = args
+    grad = out._grad
+    if b.ndim == 1:
+        grad = grad[..., None]
+    if a.ndim == 1:
+        grad = grad[..., None, :]
+    if i == 0:
+        b = b[:, None] if b.ndim == 1 else b
+        res = grad @ np.swapaxes(b, -1, -2)
+        return res[..., 0, :] if a.ndim == 1 else res
+    a = a[None, :] if a.ndim == 1 else a
+    res = np.swapaxes(a, -1, -2) @ grad
+    return res[..., 0] if args[1].ndim == 1 else res
+
+
+def _sum_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the sum."""
+    shape = args[0].shape
+    return np.broadcast_to(out._grad.reshape(_reduced_shape(shape, out._axis)), shape)
+
+
+def _mean_vjp(out: "Tensor", args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Vector-Jacobian product of the mean."""
+    shape = args[0].shape
+    count = args[0].size // max(out.data.size, 1)
+    grad = out._grad.reshape(_reduced_shape(shape, out._axis)) / count
+    return np.broadcast_to(grad, shape)
+
+
+VECTOR_JACOBIAN_PRODUCTS: dict[
+    Operation, Callable[["Tensor", tuple[np.ndarray, ...], int], np.ndarray]
+] = {
+    Operation.IDENTITY: _identity_vjp,
+    Operation.ADDITION: _add_vjp,
+    Operation.NEGATION: _neg_vjp,
+    Operation.SUBTRACTION: _sub_vjp,
+    Operation.MULTIPLICATION: _mul_vjp,
+    Operation.DIVISION: _div_vjp,
+    Operation.FLOOR_DIVISION: _floordiv_vjp,
+    Operation.INVERTION: _inv_vjp,
+    Operation.EXPONENTIATION: _pow_vjp,
+    Operation.EXPONENTIAL: _exp_vjp,
+    Operation.HYPERBOLIC_TANGENT: _tanh_vjp,
+    Operation.RELU: _relu_vjp,
+    Operation.MATRIX_MULTIPLICATION: _matmul_vjp,
+    Operation.SUM: _sum_vjp,
+    Operation.MEAN: _mean_vjp,
+}
+
+
+class Tensor:
+    """
+    A Tensor object represents a node of the computational graph holding an array of
+    values. It follows the same semantics as the Scalar object, one node standing for a
+    whole array operation instead of one node per element.
+    """
+
+    __slots__ = (
+        "data",
+        "label",
+        "requires_grad",
+        "_grad_array",
+        "_prev",
+        "_op",
+        "_backward",
+        "_axis",
+    )
+
+    def __init__(
+        self,
+        data: ArrayLike,
+        label: str | None = None,
+        requires_grad: bool = False,
+        _prev: Iterable["Tensor"] = (),
+        _op: Operation = Operation.NONE,
+        _axis: int | tuple[int, ...] | None = None,
+    ) -> None:
+        """Constructor."""
+        self.data = np.asarray(data, dtype=np.float64)
+        self.label = label
+        self.requires_grad = requires_grad
+        # The gradient is only allocated when a gradient is accumulated into it, so that
+        # the tensors computed without gradient do not double the memory.
+        self._grad_array = None
+        self._prev = _prev if type(_prev) is tuple else tuple(_prev)
+        self._op = _op
+        self._backward = 1.0 if requires_grad else 0.0
+        # Axis of the reduction, only relevant for the SUM and MEAN operations.
+        self._axis = _axis
+
+    @property
+    def _grad(self) -> np.ndarray:
+        """Gradient of the object, zeros if none has been accumulated."""
+        if self._grad_array is None:
+            return np.zeros_like(self.data)
+        return self._grad_array
+
+    @_grad.setter
+    def _grad(self, value: np.ndarray) -> None:
+        """Set the gradient of the object."""
+        self._grad_array = value
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the data held by the object."""
+        return self.data.shape
+
+    @staticmethod
+    def supported_type(x: Union[ArrayLike, "Tensor"]) -> None:
+        """Check that the type of the argument `x` is supported."""
+        if not isinstance(x, (Tensor, int, float, list, np.ndarray)):
+            raise TypeError(f"The following type {type(x)} is not supported.")
+
+    @staticmethod
+    def as_tensor(
+        x: Union[ArrayLike, "Tensor"],
+        label: str | None = None,
+        requires_grad: bool = False,
+    ) -> "Tensor":
+        """Return the argument `x` as a Tensor if it is possible."""
+        Tensor.supported_type(x)
+        if isinstance(x, Tensor):
+            return x
+        return Tensor(x, label=label, requires_grad=requires_grad)
+
+    def requires_grad_(self, requires_grad: bool) -> None:
+        """Set the `requires_grad` attribute of the object."""
+        self.requires_grad = requires_grad
+        self._backward = 1.0 if requires_grad else 0.0
+
+    def add(
+        self, other: Union[ArrayLike, "Tensor"], label: str | None = None
+    ) -> "Tensor":
+        """Addition operator."""
+        out = self + other
+        out.label = label
+        return out
+
+    def neg(self, label: str | None = None) -> "Tensor":
+        """Negation operator."""
+        out = -self
+        out.label = label
+        return out
+
+    def sub(
+        self, other: Union[ArrayLike, "Tensor"], label: str | None = None
+    ) -> "Tensor":
+        """Subtraction operator."""
+        out = self - other
+        out.label = label
+        return out
+
+    def mul(
+        self, other: Union[ArrayLike, "Tensor"], label: str | None = None
+    ) -> "Tensor":
+        """Multiplication operator."""
+        out = self * other
+        out.label = label
+        return out
+
+    def div(
+        self, other: Union[ArrayLike, "Tensor"], label: str | None = None
+    ) -> "Tensor":
+        """Division operator."""
+        out = self / other
+        out.label = label
+        return out
+
+    def floordiv(
+        self, other: Union[ArrayLike, "Tensor"], label: str | None = None
+    ) -> "Tensor":
+        """Floor division operator."""
+        out = self // other
+        out.label = label
+        return out
+
+    def invert(self, label: str | None = None) -> "Tensor":
+        """Invertion operator."""
+        out = self.__invert__()
+        out.label = label
+        return out
+
+    def pow(
+        self, other: Union[ArrayLike, "Tensor"], label: str | None = None
+    ) -> "Tensor":
+        """Power operator."""
+        out = self**other
+        out.label = label
+        return out
+
+    def matmul(
+        self, other: Union[ArrayLike, "Tensor"], label: str | None = None
+    ) -> "Tensor":
+        """Matrix multiplication operator."""
+        out = self @ other
+        out.label = label
+        return out
+
+    def exp(self, label: str | None = None) -> "Tensor":
+        """Exponential operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(np.exp(self.data), label=label)
+        return Tensor(
+            np.exp(self.data),
+            label=label,
+            requires_grad=self.requires_grad,
+            _prev=(self,),
+            _op=Operation.EXPONENTIAL,
+        )
+
+    def tanh(self, label: str | None = None) -> "Tensor":
+        """Hyperbolic tangent operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(np.tanh(self.data), label=label)
+        return Tensor(
+            np.tanh(self.data),
+            label=label,
+            requires_grad=self.requires_grad,
+            _prev=(self,),
+            _op=Operation.HYPERBOLIC_TANGENT,
+        )
+
+    def relu(self, label: str | None = None) -> "Tensor":
+        """ReLU operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(np.maximum(0.0, self.data), label=label)
+        return Tensor(
+            np.maximum(0.0, self.data),
+            label=label,
+            requires_grad=self.requires_grad,
+            _prev=(self,),
+            _op=Operation.RELU,
+        )
+
+    def sum(
+        self, axis: int | tuple[int, ...] | None = None, label: str | None = None
+    ) -> "Tensor":
+        """Sum of the elements over the given axis, all of them by default."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data.sum(axis=axis), label=label)
+        return Tensor(
+            self.data.sum(axis=axis),
+            label=label,
+            requires_grad=self.requires_grad,
+            _prev=(self,),
+            _op=Operation.SUM,
+            _axis=axis,
+        )
+
+    def mean(
+        self, axis: int | tuple[int, ...] | None = None, label: str | None = None
+    ) -> "Tensor":
+        """Mean of the elements over the given axis, all of them by default."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data.mean(axis=axis), label=label)
+        return Tensor(
+            self.data.mean(axis=axis),
+            label=label,
+            requires_grad=self.requires_grad,
+            _prev=(self,),
+            _op=Operation.MEAN,
+            _axis=axis,
+        )
+
+    def _backward_fn(self) -> None:
+        """
+        Propagate the gradient of the node to its children.
+
+        The gradient flowing to a child broadcast by the operation is summed back to
+        the shape of the child.
+        """
+        if not self._prev:
+            if self._op is not Operation.NONE:
+                raise RuntimeError(
+                    "Trying to backward through a graph that has already been freed, "
+                    "call backward with retain_graph=True to keep it."
+                )
+            return
+        vjp = VECTOR_JACOBIAN_PRODUCTS[self._op]
+        args = tuple(prev.data for prev in self._prev)
+        for i, prev in enumerate(self._prev):
+            if prev.requires_grad:
+                grad = prev._backward * _unbroadcast(vjp(self, args, i), prev.data.shape)
+                if prev._grad_array is None:
+                    prev._grad_array = np.asarray(grad, dtype=np.float64)
+                else:
+                    prev._grad_array += grad
+
+    def backward(self, retain_graph: bool = False) -> None:
+        """
+        Backward pass.
+
+        The gradient of the root is seeded with ones, so that the gradient of a
+        non-scalar root is the one of the sum of its elements. Only the nodes requiring
+        gradient are visited.
+
+        As for the Scalar object, the links of the intermediate nodes to their children
+        are released once their gradient has been propagated, unless `retain_graph` is
+        True.
+        """
+        # Compute the topological sort of the computational graph.
+        topo = topological_sort(self, requires_grad_only=True)
+        # Reset the gradient of the intermediate nodes so that the gradient of a
+        # previous call is not propagated twice.
+        for x in topo:
+            if x._prev:
+                x._grad_array = None
+        # Perform the backward pass.
+        self._grad = np.ones_like(self.data)
+        for x in reversed(topo):
+            x._backward_fn()
+            if not retain_graph:
+                x._prev = ()
+
+    def __add__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Addition operator."""
+        other = Tensor.as_tensor(other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data + other.data)
+        return Tensor(
+            self.data + other.data,
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
+            _op=Operation.ADDITION,
+        )
+
+    def __radd__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Right addition operator."""
+        other = Tensor.as_tensor(other)
+        return other + self
+
+    def __neg__(self) -> "Tensor":
+        """Negation operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(-self.data)
+        return Tensor(
+            -self.data,
+            requires_grad=self.requires_grad,
+            _prev=(self,),
+            _op=Operation.NEGATION,
+        )
+
+    def __sub__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Subtraction operator."""
+        other = Tensor.as_tensor(other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data - other.data)
+        return Tensor(
+            self.data - other.data,
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
+            _op=Operation.SUBTRACTION,
+        )
+
+    def __rsub__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Right subtraction operator."""
+        other = Tensor.as_tensor(other)
+        return other - self
+
+    def __mul__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Multiplication operator."""
+        other = Tensor.as_tensor(other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data * other.data)
+        return Tensor(
+            self.data * other.data,
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
+            _op=Operation.MULTIPLICATION,
+        )
+
+    def __rmul__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Right multiplication operator."""
+        other = Tensor.as_tensor(other)
+        return other * self
+
+    def __truediv__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """True division operator."""
+        other = Tensor.as_tensor(other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data / other.data)
+        return Tensor(
+            self.data / other.data,
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
+            _op=Operation.DIVISION,
+        )
+
+    def __rtruediv__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Right true division operator."""
+        other = Tensor.as_tensor(other)
+        return other / self
+
+    def __floordiv__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Floor division operator."""
+        other = Tensor.as_tensor(other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data // other.data)
+        return Tensor(
+            self.data // other.data,
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
+            _op=Operation.FLOOR_DIVISION,
+        )
+
+    def __rfloordiv__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Right floor division operator."""
+        other = Tensor.as_tensor(other)
+        return other // self
+
+    def __invert__(self) -> "Tensor":
+        """Inverse operator."""
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data ** (-1.0))
+        return Tensor(
+            self.data ** (-1.0),
+            requires_grad=self.requires_grad,
+            _prev=(self,),
+            _op=Operation.INVERTION,
+        )
+
+    def __pow__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Exponentiation operator."""
+        other = Tensor.as_tensor(other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data**other.data)
+        return Tensor(
+            self.data**other.data,
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
+            _op=Operation.EXPONENTIATION,
+        )
+
+    def __rpow__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Right exponentiation operator."""
+        other = Tensor.as_tensor(other)
+        return other**self
+
+    def __matmul__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Matrix multiplication operator."""
+        other = Tensor.as_tensor(other)
+        # Without gradient, only the data of the output is computed.
+        if not GradMode.enabled:
+            return Tensor(self.data @ other.data)
+        return Tensor(
+            self.data @ other.data,
+            requires_grad=self.requires_grad or other.requires_grad,
+            _prev=(self, other),
+            _op=Operation.MATRIX_MULTIPLICATION,
+        )
+
+    def __rmatmul__(self, other: Union[ArrayLike, "Tensor"]) -> "Tensor":
+        """Right matrix multiplication operator."""
+        other = Tensor.as_tensor(other)
+        return other @ self
+
+    def __str__(self) -> str:
+        """Provide a string representation of the object."""
+        label_str = "" if self.label is None else f"label={self.label}, "
+        shape_str = f"shape={self.shape}"
+        req_grad_str = (
+            "" if not self.requires_grad else f", requires_grad={self.requires_grad}"
+        )
+        op_str = "" if self._op is Operation.NONE else f", op={self._op.value}"
+        prev_str = "" if self._op is Operation.NONE else f", prev={len(self._prev)}"
+        return f"Tensor({label_str}{shape_str}{req_grad_str}{op_str}{prev_str})"
+
+    def __repr__(self) -> str:
+        """Provide an information-rich string representation of the object."""
+        start_str = "Tensor\n"
+        label_str = f"{' ':3}label         : {self.label}\n"
+        shape_str = f"{' ':3}shape         : {self.shape}\n"
+        requires_grad_str = f"{' ':3}requires_grad : {self.requires_grad}\n"
+        op_str = f"{' ':3}op            : {self._op.value}\n"
+        children_str = (
+            "".join([f"\n{' ':6}{child}" for child in self._prev])
+            if len(self._prev) > 0
+            else "None"
+        )
+        prev_str = f"{' ':3}prev          : {children_str}"
+
+        return (
+            f"{start_str}{label_str}{shape_str}"
+            f"{requires_grad_str}{op_str}{prev_str}"
+        )
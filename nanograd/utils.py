@@ -1,15 +1,150 @@
 """Module containing utility functions for nanograd."""
 
+from collections import Counter
+from operator import attrgetter
+from sys import getsizeof
+from typing import NamedTuple
 from ordered_set import OrderedSet
+from .enums import Operation
 
-def topological_sort(root) -> OrderedSet:
-        """Topological sort of the computational graph."""
-        topo, visited = OrderedSet(), set()
-        def _topological_sort(node) -> None:
-            if node not in visited:
-                visited.add(node)
-                for prev in node._prev:
-                    _topological_sort(prev)
-                topo.append(node)
-        _topological_sort(root)
+def topological_sort(root, requires_grad_only: bool = False) -> OrderedSet:
+        """Topological sort of the computational graph, see `topological_order`."""
+        return OrderedSet(
+                topological_order(root, requires_grad_only=requires_grad_only)
+        )
+
+
+def topological_order(*roots, requires_grad_only: bool = False) -> list:
+        """
+        Topological order of the computational graph, as a list. Several roots can be
+        given, their graphs being traversed one after the other.
+
+        The graph is traversed depth-first with an explicit stack instead of recursion,
+        so that arbitrarily deep graphs can be sorted without hitting the recursion
+        limit. The order is the same as the one of a recursive post-order traversal.
+
+        If `requires_grad_only` is True, the children that do not require gradient are
+        not visited: since a node requires gradient as soon as one of its children
+        does, the traversal is restricted to the paths leading to the leaves requiring
+        gradient.
+        """
+        topo, visited = [], set()
+        emit, mark = topo.append, visited.add
+        # The stack of nodes goes along with a stack of flags telling whether the node
+        # is entered (its children still have to be explored) or exited (it can be
+        # emitted). Two flat stacks avoid allocating one container per node.
+        nodes, exits = list(reversed(roots)), [False] * len(roots)
+        push_node, pop_node = nodes.append, nodes.pop
+        push_exit, pop_exit = exits.append, exits.pop
+        while nodes:
+            node = pop_node()
+            if pop_exit():
+                emit(node)
+            elif node not in visited:
+                mark(node)
+                push_node(node)
+                push_exit(True)
+                # Children are pushed in reverse order so that they are explored in
+                # the order they appear in `_prev`.
+                for prev in reversed(node._prev):
+                    if prev not in visited and (
+                        prev.requires_grad or not requires_grad_only
+                    ):
+                        push_node(prev)
+                        push_exit(False)
         return topo
+
+
+class GraphStats(NamedTuple):
+        """Statistics of a computational graph, see `graph_stats`."""
+
+        nodes: int
+        leaves: int
+        constants: int
+        ops: dict[Operation, int]
+        depth: int
+        max_fan_in: int
+        max_fan_out: int
+        bytes: int
+
+
+def graph_stats(root) -> GraphStats:
+        """
+        Statistics of the computational graph of `root`: the number of nodes, of leaves,
+        i.e. nodes without children, and of constants kept inline, the number of nodes
+        per operation, the depth, i.e. the number of nodes of the longest path from the
+        root to a leaf, the maximum number of children of a node and of uses of a node
+        by its parents, and an estimate of the bytes held by the nodes, their links,
+        data and labels.
+
+        All the statistics are gathered in a single traversal of the graph, as the one of
+        `topological_order`, and the bytes are estimated from the fixed size of the nodes
+        and the lengths of their tuples, without measuring each object.
+        """
+        # Depth of the nodes, set to zero when they are entered and to their depth when
+        # they are exited, and number of uses of the exited nodes by their parents. The
+        # other statistics are counted when a node is exited, after its children.
+        depths, uses = {}, {}
+        order = []
+        emit = order.append
+        leaves = max_fan_in = inline = links = constants = labels = chars = 0
+        nodes, exits = [root], [False]
+        push_node, pop_node = nodes.append, nodes.pop
+        push_exit, pop_exit = exits.append, exits.pop
+        while nodes:
+                node = pop_node()
+                if pop_exit():
+                        prev = node._prev
+                        depth = 0
+                        if prev:
+                                for child in prev:
+                                        uses[child] += 1
+                                        if depths[child] > depth:
+                                                depth = depths[child]
+                                if len(prev) > max_fan_in:
+                                        max_fan_in = len(prev)
+                                operands = node._operands
+                                if operands is not None:
+                                        inline += 1
+                                        links += len(operands)
+                                        constants += len(operands) - len(prev)
+                        else:
+                                leaves += 1
+                        if node.label is not None:
+                                labels += 1
+                                chars += len(node.label)
+                        depths[node] = depth + 1
+                        uses[node] = 0
+                        emit(node)
+                elif node not in depths:
+                        depths[node] = 0
+                        push_node(node)
+                        push_exit(True)
+                        for child in reversed(node._prev):
+                                if child not in depths:
+                                        push_node(child)
+                                        push_exit(False)
+        # The operations are counted by their value, whose hash is computed in C.
+        values = Counter(map(attrgetter("_op._value_"), order))
+        edges = sum(uses.values())
+        # All the nodes have the same size, their attributes being slots, the data and
+        # the constants are numbers of the size of a float, the empty tuple of the
+        # leaves is shared, and the labels are assumed to be ASCII.
+        size = (
+                len(order) * (getsizeof(root) + getsizeof(0.0))
+                + constants * getsizeof(0.0)
+                + (len(order) - leaves + inline) * getsizeof(())
+                + (edges + links) * (getsizeof((None,)) - getsizeof(()))
+                + labels * getsizeof("")
+                + chars
+        )
+        return GraphStats(
+                nodes=len(order),
+                leaves=leaves,
+                constants=constants,
+                ops={op: values[op.value] for op in Operation if op.value in values},
+                depth=depths[root],
+                max_fan_in=max_fan_in,
+                max_fan_out=max(uses.values()),
+                bytes=size,
+        )
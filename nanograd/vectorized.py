@@ -0,0 +1,184 @@
+"""
+Level-scheduled backward pass of the computational graphs of Scalar objects.
+
+The level of a node is the length of the longest path from it to a leaf, so that the
+parents of a node all lie at higher levels: its gradient is complete once the levels
+above it have been processed. The edges of a level are grouped by operation and by
+operand position, and the local gradients of a group are computed and scattered into
+the children with a few NumPy operations, instead of one Python call per node.
+"""
+
+from itertools import repeat
+from typing import Callable
+import numpy as np
+from .enums import Operation
+from .rules import LOCAL_GRADIENTS
+from .scalar import Scalar
+from .utils import topological_order
+
+OPERATIONS = list(Operation)
+_SUM, _LINEAR = OPERATIONS.index(Operation.SUM), OPERATIONS.index(Operation.LINEAR)
+
+
+def _pow_grad(out: np.ndarray, args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Local gradient of the exponentiation, on arrays."""
+    x, y = args
+    return y * (x ** (y - 1.0)) if i == 0 else np.log(x) * (x**y)
+
+
+def _relu_grad(out: np.ndarray, args: tuple[np.ndarray, ...], i: int) -> np.ndarray:
+    """Local gradient of the ReLU, on arrays."""
+    return np.where(args[0] > 0.0, 1.0, 0.0)
+
+
+# The scalar rules only made of arithmetic operators apply to arrays as they are. The
+# local gradients of the sum and affine nodes are gathered with the edges instead.
+VECTORIZED_LOCAL_GRADIENTS: dict[
+    Operation, Callable[[np.ndarray, tuple[np.ndarray, ...], int], np.ndarray]
+] = {
+    **LOCAL_GRADIENTS,
+    Operation.EXPONENTIATION: _pow_grad,
+    Operation.RELU: _relu_grad,
+}
+
+
+def _column(items: list, dtype) -> np.ndarray:
+    """Array of the list `items`, converted faster than by `np.array`."""
+    return np.fromiter(items, dtype=dtype, count=len(items))
+
+
+def _runs(keys: np.ndarray) -> list[tuple[int, int, int]]:
+    """Value, start and stop of the runs of equal values of the sorted array `keys`."""
+    if not len(keys):
+        return []
+    bounds = [0, *(np.flatnonzero(np.diff(keys)) + 1).tolist(), len(keys)]
+    return [(int(keys[a]), a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def vectorized_backward(root: Scalar, retain_graph: bool = False) -> None:
+    """
+    Backward pass of `root`, computing the same gradients as `Scalar.backward` up to
+    the rounding of the accumulations, which are performed in a different order.
+    """
+    order = topological_order(root, requires_grad_only=True)
+    n = len(order)
+    index = {node: k for k, node in enumerate(order)}
+    get = index.get
+    # The operands that are not differentiated, constants or children that do not
+    # require gradient, point to the extra slot `n` whose gradient is discarded.
+    levels, codes = [0] * (n + 1), [-1] * n
+    # Columns of the unary and binary nodes: the values of their operands and the
+    # indices of their children.
+    args0, args1 = [0.0] * n, [0.0] * n
+    child0, child1 = [n] * n, [n] * n
+    # Columns of the edges of the sum and affine nodes: the node, the child and the
+    # position in `values` of the local gradient, the first value being 1.0.
+    values, parents, children, partners = [1.0], [], [], []
+    for k, node in enumerate(order):
+        prev = node._prev
+        if not prev:
+            if node._op is not Operation.NONE:
+                raise RuntimeError(
+                    "Trying to backward through a graph that has already been freed, "
+                    "call backward with retain_graph=True to keep it."
+                )
+            continue
+        op = node._op
+        codes[k] = OPERATIONS.index(op)
+        operands = node._operands
+        if op is Operation.SUM or op is Operation.LINEAR:
+            if operands is None:
+                operands = prev
+                datas = [x.data for x in prev]
+            else:
+                datas = [x.data if isinstance(x, Scalar) else x for x in operands]
+            size = len(operands)
+            cs = list(map(get, operands, repeat(n, size)))
+            levels[k] = 1 + max(map(levels.__getitem__, cs))
+            parents.extend(repeat(k, size))
+            children.extend(cs)
+            if op is Operation.SUM:
+                partners.extend(repeat(0, size))
+                continue
+            # The local gradient of a weight is its input and conversely, the one of
+            # the bias is 1.0.
+            m, base = size // 2, len(values)
+            values.extend(datas)
+            partners.extend(range(base + m, base + 2 * m))
+            partners.extend(range(base, base + m))
+            if size % 2:
+                partners.append(0)
+            continue
+        if operands is None:
+            x = prev[0]
+            args0[k] = x.data
+            if len(prev) == 2:
+                y = prev[1]
+                args1[k] = y.data
+                c0, c1 = child0[k], child1[k] = get(x, n), get(y, n)
+                level = max(levels[c0], levels[c1])
+            else:
+                c0 = child0[k] = get(x, n)
+                level = levels[c0]
+        else:
+            # The nodes holding a constant are binary with a single child.
+            x, y = operands
+            args0[k] = x.data if isinstance(x, Scalar) else x
+            args1[k] = y.data if isinstance(y, Scalar) else y
+            c0, c1 = child0[k], child1[k] = get(x, n), get(y, n)
+            level = max(levels[c0], levels[c1])
+        levels[k] = level + 1
+    data = np.fromiter((node.data for node in order), dtype=float, count=n)
+    args = (_column(args0, float), _column(args1, float))
+    childs = (_column(child0, np.intp), _column(child1, np.intp))
+    levels_arr = _column(levels, np.intp)[:n]
+    codes_arr = _column(codes, np.intp)
+    parents_arr = _column(parents, np.intp)
+    children_arr = _column(children, np.intp)
+    coefs_arr = _column(values, float)[_column(partners, np.intp)]
+    # The unary and binary nodes are grouped by level and operation, the edges of the
+    # sum and affine nodes by level, and the groups are run from the root to the
+    # leaves.
+    nodes = np.flatnonzero(
+        (codes_arr >= 0) & (codes_arr != _SUM) & (codes_arr != _LINEAR)
+    )
+    node_keys = levels_arr[nodes] * len(OPERATIONS) + codes_arr[nodes]
+    perm = np.argsort(-node_keys, kind="stable")
+    nodes, node_keys = nodes[perm], node_keys[perm]
+    edge_keys = levels_arr[parents_arr]
+    perm = np.argsort(-edge_keys, kind="stable")
+    parents_arr, children_arr = parents_arr[perm], children_arr[perm]
+    coefs_arr, edge_keys = coefs_arr[perm], edge_keys[perm]
+    groups = [
+        (key // len(OPERATIONS), True, start, stop, key % len(OPERATIONS))
+        for key, start, stop in _runs(node_keys)
+    ] + [(key, False, start, stop, -1) for key, start, stop in _runs(edge_keys)]
+    groups.sort(key=lambda group: -group[0])
+    grads = np.zeros(n + 1)
+    grads[index[root]] = 1.0
+    for _, is_node_group, start, stop, code in groups:
+        if not is_node_group:
+            contrib = grads[parents_arr[start:stop]] * coefs_arr[start:stop]
+            np.add.at(grads, children_arr[start:stop], contrib)
+            continue
+        local_grad = VECTORIZED_LOCAL_GRADIENTS[OPERATIONS[code]]
+        ps = nodes[start:stop]
+        for j, child in enumerate(childs):
+            cs = child[ps]
+            mask = cs < n
+            if not mask.any():
+                continue
+            # The local gradients are only computed for the children requiring
+            # gradient, never with respect to a constant.
+            qs = ps if mask.all() else ps[mask]
+            local = local_grad(data[qs], (args[0][qs], args[1][qs]), j)
+            np.add.at(grads, cs[mask], local * grads[qs])
+    # The intermediate nodes get their gradient, the leaves accumulate it.
+    for node, grad in zip(order, grads.tolist()):
+        if node._prev:
+            node._grad = grad
+        else:
+            node._grad += grad
+    root._grad = 1.0
+    if not retain_graph:
+        Scalar._release_graph(reversed(order))
@@ -2,7 +2,7 @@ from setuptools import find_packages, setup
 
 setup(
     name='nanograd',
-    packages=find_packages(include=['nanograd']),
+    packages=find_packages(include=['nanograd', 'nanograd.*']),
     version='0.1.0',
     description="""A tiny scalar-valued autograd engine inspired from the one created by
     Karpathy""",
@@ -0,0 +1,95 @@
+"""Test suite for the Arena object."""
+
+from math import isclose
+import numpy as np
+from nanograd.arena import Arena, ArenaScalar
+from nanograd.enums import Operation
+from nanograd.grad_mode import no_grad
+from nanograd.scalar import Scalar
+from pytest import raises
+
+def model(x, y, z, sum_fn, dot_fn):
+    """Expression using every operation, for Scalar and ArenaScalar objects."""
+    a = (x * y + z).tanh() - (z / x) * (z / 2.0) ** 2.0
+    b = sum_fn([(~y).exp(), z // 2.0, (-x).relu(), x.relu(), x])
+    b = dot_fn([b, x], [y, 2.0], 0.5)
+    return a * b + 3.0 ** (y / 4.0) - 1.0 / z + x**y
+
+
+def test_arena_layout() -> None:
+    """Test that the nodes are stored column-wise, the constants being leaves."""
+    arena = Arena()
+    x = arena.scalar(2.0, requires_grad=True)
+    y = arena.scalar(3.0)
+    z = x * 2 + y
+
+    assert isinstance(z, ArenaScalar)
+    assert z.data == 7.0
+    assert z.requires_grad
+    assert z.op == Operation.ADDITION
+    assert list(arena.data) == [2.0, 3.0, 2.0, 4.0, 7.0]
+    assert list(arena.requires_grad) == [1, 0, 0, 1, 1]
+    assert list(arena.offsets) == [0, 0, 0, 0, 2, 4]
+    assert list(arena.operands) == [0, 2, 3, 1]
+
+
+def test_arena_matches_scalar() -> None:
+    """Test that the gradients are the ones of the Scalar object."""
+    for values in ((0.5, 1.5, 2.5), (1.25, 0.75, 3.0), (2.0, -0.5, 1.25)):
+        arena = Arena()
+        handles = [arena.scalar(v, requires_grad=True) for v in values]
+        out = model(*handles, arena.sum, arena.dot)
+        out.backward()
+        leaves = [Scalar(v, requires_grad=True) for v in values]
+        expected = model(*leaves, Scalar.sum, Scalar.dot)
+        expected.backward()
+
+        assert isclose(out.data, expected.data)
+        for handle, leaf in zip(handles, leaves):
+            assert isclose(handle.grad, leaf._grad, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_arena_backward_accumulates() -> None:
+    """Test that the leaves accumulate their gradient and the bulk reset."""
+    arena = Arena()
+    x = arena.scalar(3.0, requires_grad=True)
+    y = x * x
+    y.backward()
+    y.backward()
+
+    assert x.grad == 12.0
+    arena.zero_grad()
+    assert list(arena.grad) == [0.0, 0.0]
+
+
+def test_arena_export_grad() -> None:
+    """Test that the gradients are exported without copy."""
+    arena = Arena()
+    x = arena.scalar(3.0, requires_grad=True)
+    (x * 2.0).backward()
+    grads = np.frombuffer(arena.grad)
+
+    assert grads[0] == 2.0
+    arena.zero_grad()
+    assert grads[0] == 0.0
+
+
+def test_arena_no_grad() -> None:
+    """Test that no node is recorded without gradient."""
+    arena = Arena()
+    x = arena.scalar(3.0, requires_grad=True)
+    with no_grad():
+        y = x * x
+
+    assert y.data == 9.0
+    assert not y.requires_grad
+    assert y.op == Operation.NONE
+
+
+def test_arena_invalid_operands() -> None:
+    """Test the operands of an unsupported type or from another arena."""
+    x = Arena().scalar(1.0)
+    with raises(TypeError):
+        x + "1"
+    with raises(ValueError):
+        x + Arena().scalar(1.0)
@@ -0,0 +1,104 @@
+"""Test suite for the comparison of benchmark results with a baseline."""
+
+from nanograd.bench import no_grad
+from nanograd.bench.suite import METRICS, compare, run
+from pytest import raises
+
+
+def test_compare_regressions() -> None:
+    """Test that only the metrics worse by more than the threshold are reported."""
+    baseline = {
+        "mlp": [{"batch": 16, "forward_seconds": 1.0, "backward_seconds": 1.0}],
+        "operations": [{"op": "add", "nodes_per_second": 100.0, "node_bytes": 100}],
+    }
+    results = {
+        "mlp": [{"batch": 16, "forward_seconds": 1.05, "backward_seconds": 1.5}],
+        "operations": [{"op": "add", "nodes_per_second": 50.0, "node_bytes": 90}],
+        "arena": [{"engine": "arena", "backward_seconds": 1.0}],
+    }
+    regressions = compare(results, baseline, threshold=0.1)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("mlp[sizes=null, batch=16].backward_seconds")
+    assert regressions[1].startswith('operations[op="add"].nodes_per_second')
+
+
+def test_compare_no_regression() -> None:
+    """Test that identical results have no regression."""
+    results = {"mlp": [{"forward_seconds": 1.0, "peak_bytes": 0, "sizes": [1, 2]}]}
+
+    assert compare(results, results) == []
+
+
+def test_compare_matches_records() -> None:
+    """Test that the records are matched on their identifying fields."""
+    baseline = {
+        "topological_sort": [
+            {"graph": "deep_chain", "size": 1000, "sort_seconds": 1.0},
+            {"graph": "wide_fan_in", "size": 1000, "sort_seconds": 10.0},
+        ],
+    }
+    results = {
+        "topological_sort": [
+            {"graph": "wide_fan_in", "size": 1000, "sort_seconds": 10.0},
+            {"graph": "deep_chain", "size": 1000, "sort_seconds": 1.0},
+            {"graph": "deep_chain", "size": 10000, "sort_seconds": 100.0},
+        ],
+    }
+
+    assert compare(results, baseline) == []
+    results["topological_sort"][1]["sort_seconds"] = 2.0
+    assert compare(results, baseline) == [
+        'topological_sort[graph="deep_chain", size=1000].sort_seconds: 1 -> 2 '
+        "(+100.0% worse)"
+    ]
+
+
+def test_compare_skips_reference_fields() -> None:
+    """Test that the fields of the reference implementations are not compared."""
+    baseline = {
+        "topological_sort": [
+            {"graph": "deep_chain", "size": 1000, "sort_seconds": 1.0,
+             "reference_sort_seconds": 1.0},
+        ],
+        "scalar_memory": [
+            {"node": "leaf", "node_bytes": 64, "reference_node_bytes": 100,
+             "nodes_per_second": 10.0, "reference_nodes_per_second": 10.0},
+        ],
+    }
+    results = {
+        "topological_sort": [
+            {"graph": "deep_chain", "size": 1000, "sort_seconds": 1.0,
+             "reference_sort_seconds": 5.0},
+        ],
+        "scalar_memory": [
+            {"node": "leaf", "node_bytes": 64, "reference_node_bytes": 500,
+             "nodes_per_second": 10.0, "reference_nodes_per_second": 1.0},
+        ],
+    }
+
+    assert compare(results, baseline) == []
+
+
+def test_compare_no_grad_reference() -> None:
+    """Test that the forward pass on floats is a reference, not a mode of nanograd."""
+    records = no_grad.run(sizes=(4, 8, 2))
+    baseline = {"no_grad": [dict(record) for record in records]}
+    for record in records:
+        record["reference_forward_seconds"] *= 10.0
+
+    assert [record["mode"] for record in records] == ["graph", "no_grad"]
+    assert compare({"no_grad": records}, baseline) == []
+
+
+def test_metric_names() -> None:
+    """Test that the metrics are named after their unit."""
+    for metrics in METRICS.values():
+        for metric in metrics:
+            assert metric.endswith(("_seconds", "_bytes", "_per_second"))
+
+
+def test_run_unknown_benchmark() -> None:
+    """Test that an unknown benchmark raises a ValueError."""
+    with raises(ValueError):
+        run(("unknown",))
@@ -0,0 +1,70 @@
+"""Test suite for the structural fingerprint and the cache of compiled tapes."""
+
+from nanograd.cache import CompileCache, fingerprint
+from nanograd.scalar import Scalar
+from nanograd.tape import trace
+from pytest import raises
+
+
+def affine(w: float):
+    """Function of two inputs holding the weight `w` as a leaf."""
+    weight = Scalar(w, requires_grad=True)
+    return lambda x, y: (weight * x + y * 2.0).tanh()
+
+
+def test_fingerprint_ignores_values() -> None:
+    """Test that the fingerprint depends on the structure, not on the values."""
+    a = trace(affine(0.5), 1.0, 2.0)
+    b = trace(affine(-3.0), -1.0, 0.25)
+    c = trace(lambda x, y: (x * x + y * 2.0).tanh(), 1.0, 2.0)
+    d = trace(lambda x, y: (x * y + y * 2.0).tanh(), 1.0, 2.0)
+
+    assert fingerprint(a) == fingerprint(b)
+    assert len({fingerprint(a), fingerprint(c), fingerprint(d)}) == 3
+
+
+def test_cache_reuses_code() -> None:
+    """Test that tapes of the same structure share their code, with their values."""
+    cache = CompileCache()
+    a = cache.compile(trace(affine(0.5), 1.0, 2.0))
+    b = cache.compile(trace(affine(-3.0), 1.0, 2.0))
+
+    assert a.code is b.code
+    assert cache.stats == {"hits": 1, "misses": 1, "loads": 0, "evictions": 0}
+    x, y = Scalar(1.0, requires_grad=True), Scalar(2.0, requires_grad=True)
+    out = affine(-3.0)(x, y)
+    out.backward()
+    assert b.value_and_grad(1.0, 2.0) == (out.data, [x._grad, y._grad])
+    assert a.forward(1.0, 2.0) != b.forward(1.0, 2.0)
+
+
+def test_cache_eviction() -> None:
+    """Test that the least recently used entry is evicted."""
+    cache = CompileCache(maxsize=2)
+    tapes = [trace(lambda x: x * x, 1.0), trace(lambda x: x + x, 1.0)]
+    keys = [fingerprint(tape) for tape in tapes]
+    for tape in tapes:
+        cache.compile(tape)
+    cache.compile(tapes[0])
+    cache.compile(trace(lambda x: x - x, 1.0))
+
+    assert keys[0] in cache and keys[1] not in cache
+    assert len(cache) == 2
+    assert cache.stats["evictions"] == 1
+
+
+def test_cache_directory(tmp_path) -> None:
+    """Test that another cache loads the persisted code instead of compiling it."""
+    tape = trace(affine(0.5), 1.0, 2.0)
+    CompileCache(directory=str(tmp_path)).compile(tape)
+    cache = CompileCache(directory=str(tmp_path))
+    compiled = cache.compile(trace(affine(0.5), 1.0, 2.0))
+
+    assert cache.stats == {"hits": 0, "misses": 1, "loads": 1, "evictions": 0}
+    assert compiled.value_and_grad(1.0, 2.0) == tape.compile().value_and_grad(1.0, 2.0)
+
+
+def test_cache_invalid_size() -> None:
+    """Test that a non-positive maximum size raises a ValueError."""
+    with raises(ValueError):
+        CompileCache(maxsize=0)
@@ -0,0 +1,58 @@
+"""Test suite for the Dual object."""
+
+from math import isclose
+from nanograd.dual import Dual
+from nanograd.enums import Operation
+from nanograd.rules import FORWARD_RULES
+from nanograd.scalar import Scalar
+from pytest import raises
+
+def model(x, y, z, sum_fn, dot_fn):
+    """Expression using every operation, for Scalar and Dual objects."""
+    a = (x * y + z).tanh() - (z / x) * (z / 2.0) ** 2.0
+    b = sum_fn([(~y).exp(), z // 2.0, (-x).relu(), x.relu(), x])
+    b = dot_fn([b, x], [y, 2.0], 0.5)
+    return a * b + 3.0 ** (y / 4.0) - 1.0 / z + x**y
+
+
+def test_dual_matches_backward() -> None:
+    """Test that the tangents along the axes are the gradients of the backward pass."""
+    for values in ((0.5, 1.5, 2.5), (1.25, 0.75, 3.0), (2.0, -0.5, 1.25)):
+        leaves = [Scalar(v, requires_grad=True) for v in values]
+        out = model(*leaves, Scalar.sum, Scalar.dot)
+        out.backward()
+        for i, leaf in enumerate(leaves):
+            duals = [Dual(v, 1.0 if j == i else 0.0) for j, v in enumerate(values)]
+            res = model(*duals, Dual.sum, Dual.dot)
+            assert res.primal == out.data
+            assert isclose(res.tangent, leaf._grad, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_dual_every_operation() -> None:
+    """Test that every operation of the forward rules is supported."""
+    unary = {
+        Operation.IDENTITY,
+        Operation.NEGATION,
+        Operation.INVERTION,
+        Operation.EXPONENTIAL,
+        Operation.HYPERBOLIC_TANGENT,
+        Operation.RELU,
+    }
+    for op in FORWARD_RULES:
+        args = [Dual(2.0, 1.0)] if op in unary else [Dual(2.0, 1.0), Dual(3.0, 1.0)]
+        out = Dual.apply(op, *args)
+        assert out.primal == FORWARD_RULES[op](*[x.primal for x in args])
+
+
+def test_dual_constant_exponent_negative_base() -> None:
+    """Test that a constant exponent does not differentiate with respect to itself."""
+    out = Dual(-3.0, 1.0) ** 2
+
+    assert out.primal == 9.0
+    assert out.tangent == -6.0
+
+
+def test_dual_unsupported_type() -> None:
+    """Test that an operand of an unsupported type raises a TypeError."""
+    with raises(TypeError):
+        Dual(1.0, 1.0) + "1"
@@ -0,0 +1,91 @@
+"""Test suite for the hvp and grad functions."""
+
+from math import isclose, log
+from nanograd.functional import grad, hvp
+from nanograd.scalar import Scalar
+from pytest import raises
+
+
+def fn(x: Scalar, y: Scalar, z: Scalar) -> Scalar:
+    """Function exercising most of the operations of the Scalar object."""
+    u = (x * y).tanh() + (z / (1.0 + x**2)).exp() - 2.0 ** (y * 0.5)
+    v = Scalar.dot([x, y], [z, u], 0.5) + (~z).relu() + y**z
+    return u * v - x // 3.0
+
+
+def polynomial(x: Scalar, y: Scalar, z: Scalar) -> Scalar:
+    """Function whose exponents are constants, so that its gradient is a graph."""
+    u = (x * y).tanh() + (z / (1.0 + x**2)).exp()
+    return u * Scalar.dot([x, y], [z, u], 0.5) + (~z).relu() * y**3 - x // 3.0
+
+
+def gradient(x: list[float]) -> list[float]:
+    """Gradient of `fn` at `x` computed with a backward pass."""
+    leaves = [Scalar(xi, requires_grad=True) for xi in x]
+    fn(*leaves).backward()
+    return [leaf._grad for leaf in leaves]
+
+
+def test_hvp_matches_finite_differences() -> None:
+    """Test the product against central differences of the backward gradients."""
+    x, v, eps = [0.3, 1.2, 0.8], [0.5, -1.0, 2.0], 1e-6
+    plus = gradient([xi + eps * vi for xi, vi in zip(x, v)])
+    minus = gradient([xi - eps * vi for xi, vi in zip(x, v)])
+    res = hvp(fn, x, v)
+
+    for r, p, m in zip(res, plus, minus):
+        assert isclose(r, (p - m) / (2 * eps), rel_tol=1e-5, abs_tol=1e-6)
+
+
+def test_hvp_quadratic() -> None:
+    """Test the product of a quadratic form, whose Hessian is constant."""
+    res = hvp(lambda x, y: x * x * 3.0 + x * y - y**2, [1.5, -2.0], [1.0, 2.0])
+
+    assert res == [8.0, -3.0]
+
+
+def test_hvp_different_lengths() -> None:
+    """Test that inputs and a vector of different lengths raise a ValueError."""
+    with raises(ValueError):
+        hvp(lambda x, y: x * y, [1.0, 2.0], [1.0])
+
+
+def test_grad_create_graph() -> None:
+    """Test that the gradients built as a graph are differentiated again."""
+    x = Scalar(0.3, requires_grad=True)
+    y = Scalar(1.2, requires_grad=True)
+    z = Scalar(0.8, requires_grad=True)
+    out = polynomial(x, y, z)
+    floats = grad(out, [x, y, z])
+    grads = grad(out, [x, y, z], create_graph=True)
+
+    for g, f in zip(grads, floats):
+        assert isclose(g.data, f, rel_tol=1e-12)
+    assert x._grad == y._grad == z._grad == 0.0
+    # The gradient of the first derivative is the first row of the Hessian.
+    grads[0].backward()
+    row = hvp(polynomial, [0.3, 1.2, 0.8], [1.0, 0.0, 0.0])
+    for leaf, r in zip((x, y, z), row):
+        assert isclose(leaf._grad, r, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def test_grad_create_graph_exponent() -> None:
+    """Test the gradients built as a graph through a differentiable exponent."""
+    b = Scalar(2.0)
+    y = Scalar(3.0, requires_grad=True)
+    for base in (b, 2.0):
+        (dy,) = grad(base**y * y, [y], create_graph=True)
+        assert isclose(dy.data, 8.0 * (log(2.0) * 3.0 + 1.0), rel_tol=1e-12)
+        y._grad = 0.0
+        dy.backward()
+        # d2/dy2 of 2**y * y is 2**y * log(2) * (log(2) * y + 2).
+        expected = 8.0 * log(2.0) * (log(2.0) * 3.0 + 2.0)
+        assert isclose(y._grad, expected, rel_tol=1e-12)
+
+
+def test_grad_create_graph_exponent_and_base() -> None:
+    """Test that an exponent and a base both requiring gradient raise a ValueError."""
+    x = Scalar(2.0, requires_grad=True)
+    y = Scalar(3.0, requires_grad=True)
+    with raises(ValueError):
+        grad(x**y, [x, y], create_graph=True)
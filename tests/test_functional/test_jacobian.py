@@ -0,0 +1,40 @@
+"""Test suite for the jacobian function."""
+
+from math import isclose
+from nanograd.functional import jacobian
+from nanograd.nn import MLP
+from nanograd.scalar import Scalar
+from pytest import raises
+
+def test_jacobian_matches_backward() -> None:
+    """Test that each row is the gradient given by a backward pass of its output."""
+    model = MLP(3, [5, 4])
+    xs = [Scalar(v, requires_grad=True) for v in (0.3, -0.7, 1.1)]
+    outs = model(xs)
+    jac = jacobian(outs, xs)
+
+    assert jac.shape == (4, 3)
+    for k, out in enumerate(outs):
+        for x in xs:
+            x._grad = 0.0
+        out.backward(retain_graph=True)
+        for j, x in enumerate(xs):
+            assert isclose(jac[k, j], x._grad, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_jacobian_shared_and_missing_inputs() -> None:
+    """Test the entries of an output that is an input and of a missing input."""
+    x = Scalar(2.0, requires_grad=True)
+    y = Scalar(3.0, requires_grad=True)
+    z = Scalar(1.0, requires_grad=True)
+    jac = jacobian([x * y + 1.0, x, y**2], [x, y, z])
+
+    assert jac.tolist() == [[3.0, 2.0, 0.0], [1.0, 0.0, 0.0], [0.0, 6.0, 0.0]]
+    assert x._grad == y._grad == 0.0
+
+
+def test_jacobian_unsupported_type() -> None:
+    """Test that an output that is not a Scalar raises a TypeError."""
+    x = Scalar(2.0, requires_grad=True)
+    with raises(TypeError):
+        jacobian([1.0], [x])
@@ -0,0 +1,40 @@
+"""Test suite for the jvp function."""
+
+from math import exp, isclose, tanh
+from nanograd.functional import jvp
+from pytest import raises
+
+def test_jvp_single_output() -> None:
+    """Test the product along a direction for a function with one output."""
+    out, tangent = jvp(lambda x, y: (x * y).exp() + y**2, [1.0, 2.0], [0.5, -1.0])
+
+    assert isclose(out, exp(2.0) + 4.0)
+    assert isclose(tangent, exp(2.0) * (2.0 * 0.5 + 1.0 * -1.0) + 4.0 * -1.0)
+
+
+def test_jvp_many_outputs() -> None:
+    """Test a function with one input and many outputs in a single pass."""
+    xs = [0.1 * k for k in range(10)]
+
+    def fn(t):
+        """Points of a family of curves at the parameter `t`, and a constant."""
+        return [(t * x).tanh() * x + 1.0 for x in xs] + [2.0]
+
+    outs, tangents = jvp(fn, [0.3], [1.0])
+    assert len(outs) == len(tangents) == 11
+    for x, tangent in zip(xs, tangents):
+        assert isclose(tangent, (1.0 - tanh(0.3 * x) ** 2) * x * x)
+    assert outs[-1] == 2.0
+    assert tangents[-1] == 0.0
+
+
+def test_jvp_wrong_lengths() -> None:
+    """Test that inputs and tangents of different lengths raise a ValueError."""
+    with raises(ValueError):
+        jvp(lambda x: x, [1.0], [1.0, 0.0])
+
+
+def test_jvp_unsupported_output() -> None:
+    """Test that an output of an unsupported type raises a TypeError."""
+    with raises(TypeError):
+        jvp(lambda x: "x", [1.0], [1.0])
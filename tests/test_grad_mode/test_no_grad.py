@@ -0,0 +1,60 @@
+"""Test suite for the no_grad context manager."""
+
+import numpy as np
+from math import exp, tanh
+from nanograd.enums import Operation
+from nanograd.grad_mode import is_grad_enabled, no_grad
+from nanograd.scalar import Scalar
+from nanograd.tensor import Tensor
+from pytest import raises
+
+def test_no_grad_context_manager() -> None:
+    """Test that no graph is recorded within the context manager."""
+    x = Scalar(0.5, requires_grad=True)
+    with no_grad():
+        assert not is_grad_enabled()
+        y = (2 * x + 1).tanh().exp() ** 2 - x / 3 // 1
+        z = (~x).relu().mul(x, label='z')
+    assert is_grad_enabled()
+
+    for out in (y, z):
+        assert not out.requires_grad
+        assert out._op == Operation.NONE
+        assert out._prev == ()
+    assert z.label == 'z'
+    assert y.data == exp(tanh(2 * 0.5 + 1)) ** 2 - 0.5 / 3 // 1
+
+
+def test_no_grad_decorator() -> None:
+    """Test that no graph is recorded by a decorated function."""
+    @no_grad()
+    def f(x: Scalar, n: int) -> Scalar:
+        return x if n == 0 else f(x * x, n - 1)
+
+    x = Scalar(1.5, requires_grad=True)
+    y = f(x, 3)
+    z = x * x
+
+    assert y.data == 1.5 ** 8
+    assert y._prev == ()
+    assert z._prev == (x, x)
+    assert is_grad_enabled()
+
+
+def test_no_grad_restored_on_error() -> None:
+    """Test that the recording of the graph is restored when an error is raised."""
+    with raises(TypeError):
+        with no_grad():
+            Scalar(1.0) + "1"
+    assert is_grad_enabled()
+
+
+def test_no_grad_tensor() -> None:
+    """Test that no graph is recorded for the Tensor object."""
+    x = Tensor([1.0, -2.0], requires_grad=True)
+    with no_grad():
+        y = (x @ x + x).relu().sum()
+
+    assert y._prev == ()
+    assert not y.requires_grad
+    assert np.isclose(y.data, 9.0)
@@ -0,0 +1,181 @@
+"""Test suite for the hash-consing of the nodes of the Scalar object."""
+
+import gc
+import numpy as np
+from array import array
+from math import isclose
+from nanograd.grad_mode import no_grad
+from nanograd.hash_consing import hash_consing
+from nanograd.scalar import Scalar
+from nanograd.utils import topological_sort
+
+
+def model(x: Scalar, y: Scalar) -> Scalar:
+    """Expression recomputing the same subexpressions several times."""
+    a = (x * y).tanh() + (x * y).tanh() * 2.0
+    b = Scalar.sum([x**2, x**2, y]) - Scalar.dot([x, y], [y, x], 1.0)
+    return a * b + (x * y).tanh() / (x**2 + 1.0)
+
+
+def test_hash_consing_shares_nodes() -> None:
+    """Test that identical subexpressions return the same node."""
+    x = Scalar(0.5, requires_grad=True)
+    y = Scalar(-1.5, requires_grad=True)
+    with hash_consing() as interned:
+        assert (x * y).tanh() is (x * y).tanh()
+        assert x * 2.0 is x * 2.0
+        assert x * 2.0 is not x * 2
+        assert x + 0.0 is not x + (-0.0)
+        assert x * y is not y * x
+        assert Scalar.sum(z for z in (x, y)) is Scalar.sum([x, y])
+    assert interned.stats["hits"] == 4
+
+
+def test_hash_consing_gradients() -> None:
+    """Test that the values and gradients are the ones of the eager engine."""
+    def run() -> tuple[float, float, float, int]:
+        x = Scalar(0.5, requires_grad=True)
+        y = Scalar(-1.5, requires_grad=True)
+        out = model(x, y)
+        size = len(topological_sort(out))
+        out.backward()
+        return out.data, x._grad, y._grad, size
+
+    data, dx, dy, size = run()
+    with hash_consing():
+        shared_data, shared_dx, shared_dy, shared_size = run()
+
+    assert shared_data == data
+    assert isclose(shared_dx, dx, rel_tol=1e-12)
+    assert isclose(shared_dy, dy, rel_tol=1e-12)
+    assert shared_size < size
+
+
+def test_hash_consing_not_shared() -> None:
+    """Test the operations whose output is not shared."""
+    x = Scalar(0.5, requires_grad=True)
+    with hash_consing():
+        assert x.exp(label='a') is not x.exp(label='a')
+        with no_grad():
+            assert x.exp() is not x.exp()
+        y = x.exp()
+        x.data = 1.0
+        assert x.exp() is not y
+        z = x.exp()
+        z.backward()
+        assert x.exp() is not z
+
+
+def test_hash_consing_weak() -> None:
+    """Test that the interned nodes are not kept alive."""
+    x = Scalar(0.5, requires_grad=True)
+    with hash_consing() as interned:
+        y = x.tanh()
+        assert len(interned) == 1
+        del y
+        gc.collect()
+        assert len(interned) == 0
+
+
+def test_hash_consing_restores_methods() -> None:
+    """Test that the operators are restored on exit, the contexts being nested."""
+    methods = dict(Scalar.__dict__)
+    x = Scalar(0.5, requires_grad=True)
+    outer, inner = hash_consing(), hash_consing()
+    with outer:
+        with outer:
+            y = x.exp()
+        assert x.exp() is y
+        with inner:
+            assert x.exp() is y
+    assert dict(Scalar.__dict__) == methods
+    assert outer.stats["hits"] == 2
+    assert inner.stats["misses"] == 1
+
+
+def test_hash_consing_labels() -> None:
+    """Test that a labelled named method creates a node and relabels none."""
+    x = Scalar(0.5, requires_grad=True)
+    y = Scalar(-1.5, requires_grad=True)
+    with hash_consing():
+        z = x + y
+        w = x.add(y, label='w')
+        assert w is not z and w.label == 'w'
+        assert z.label is None
+        assert x.add(y) is z and z.label is None
+        assert x.mul(2.0, 'm') is not x * 2.0
+        assert x.neg('n') is not -x
+        assert (x * 2.0).label is None
+
+
+def test_hash_consing_separate_losses() -> None:
+    """Test that two losses sharing a subexpression can be differentiated in turn."""
+    def run() -> tuple[float, float]:
+        x = Scalar(0.5, requires_grad=True)
+        y = Scalar(-1.5, requires_grad=True)
+        first = (x * y).tanh() * 2.0
+        second = (x * y).tanh() * 3.0
+        first.backward()
+        second.backward()
+        return x._grad, y._grad
+
+    dx, dy = run()
+    with hash_consing() as interned:
+        shared_dx, shared_dy = run()
+    assert interned.stats["hits"] == 2
+    assert (shared_dx, shared_dy) == (dx, dy)
+    # The shared nodes are kept after the exit of the context.
+    x = Scalar(0.5, requires_grad=True)
+    with hash_consing():
+        first, second = x.exp() * 2.0, x.exp() * 3.0
+    first.backward()
+    second.backward()
+    assert x._grad == 5.0 * x.exp().data
+
+
+def test_hash_consing_keywords() -> None:
+    """Test that the operands of the sum and the affine operator can be keywords."""
+    w = Scalar(0.5, requires_grad=True)
+    x = Scalar(-1.5, requires_grad=True)
+    b = Scalar(2.0, requires_grad=True)
+    with hash_consing():
+        out = Scalar.dot([w], [x], bias=b)
+        assert out.data == 1.25
+        assert Scalar.dot([w], [x], b) is out
+        assert Scalar.dot(ws=[w], xs=[x], bias=b) is out
+        assert Scalar.dot([w], [x]) is Scalar.dot([w], [x], None)
+        assert Scalar.dot([w], [x]) is not out
+        assert Scalar.sum(items=[w, x]) is Scalar.sum([w, x])
+        assert Scalar.sum([w, x], label='s') is not Scalar.sum([w, x])
+
+
+def test_hash_consing_sequences() -> None:
+    """Test that the operands of the affine operator can be any sequence."""
+    x = Scalar(0.5, requires_grad=True)
+    with hash_consing():
+        out = Scalar.dot(array('d', [1.0, 2.0]), [x, x])
+        assert Scalar.dot(array('d', [1.0, 2.0]), (x, x)) is out
+        assert Scalar.dot(array('d', [1.0, 3.0]), [x, x]) is not out
+        # The operands that cannot be keyed are not interned.
+        ws = np.array([1.0, 2.0])
+        assert Scalar.dot(ws, [x, x]) is not Scalar.dot(ws, [x, x])
+        assert Scalar.dot(ws, [x, x]).data == out.data
+
+
+def test_hash_consing_data_keys() -> None:
+    """Test that the data of a Scalar is keyed with its type and the sign of a zero."""
+    x = Scalar(0.0, requires_grad=True)
+    with hash_consing():
+        y = x.tanh()
+        x.data = -0.0
+        z = x.tanh()
+        assert z is not y
+        assert str(z.data) == '-0.0'
+        x.data = 1
+        y = x * 2.0
+        x.data = 1.0
+        assert x * 2.0 is not y
+        assert Scalar.sum([x]) is Scalar.sum([x])
+        s = Scalar.sum([x])
+        x.data = 1
+        assert Scalar.sum([x]) is not s
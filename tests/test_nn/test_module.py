@@ -0,0 +1,141 @@
+"""Test suite for the Module object."""
+
+from nanograd.nn import MLP, Module, Parameter
+from pytest import raises
+
+class Affine(Module):
+    """Affine function used for the tests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.a = Parameter(2.0, label='a')
+        self.b = Parameter(1.0, label='b')
+        self.scale = 3.0
+
+    def forward(self, x):
+        return self.a * x + self.b
+
+
+class Stack(Module):
+    """Composition of modules used for the tests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.first = Affine()
+        self.others = [Affine(), Affine()]
+        self.extra = (Parameter(0.0, label='extra'),)
+
+    def forward(self, x):
+        x = self.first(x)
+        for module in self.others:
+            x = module(x)
+        return x + self.extra[0]
+
+
+def test_module_parameters() -> None:
+    """Test that the parameters of the module and its sub-modules are registered."""
+    model = Stack()
+    params = model.parameters()
+
+    assert params[0] is model.extra[0]
+    assert params[1:3] == [model.first.a, model.first.b]
+    assert len(params) == 7
+    assert 'scale' not in model.first._parameters
+
+
+def test_module_reassignment() -> None:
+    """Test that re-assigning an attribute replaces the registered parameter."""
+    model = Affine()
+    c = Parameter(5.0)
+    model.a = c
+    model.b = None
+
+    assert model.parameters() == [c]
+
+
+def test_module_zero_grad_and_step() -> None:
+    """Test one step of gradient descent followed by the reset of the gradients."""
+    model = Affine()
+    loss = model(4.0)
+    loss.backward()
+    model.step(0.1)
+
+    assert model.a.data == 2.0 - 0.1 * 4.0
+    assert model.b.data == 1.0 - 0.1 * 1.0
+    model.zero_grad()
+    assert all(p._grad == 0.0 for p in model.parameters())
+
+
+def test_module_forward_not_implemented() -> None:
+    """Test that the base class does not define any forward pass."""
+    with raises(NotImplementedError):
+        Module()(1.0)
+
+
+def test_mlp_training() -> None:
+    """Test that a few steps of gradient descent decrease the loss of an MLP."""
+    model = MLP(2, [4, 1])
+    xs = [[0.5, -1.0], [1.0, 1.0], [-1.0, 0.5]]
+    ys = [1.0, -1.0, 1.0]
+
+    def loss_fn():
+        return sum(((model(x)[0] - y) ** 2 for x, y in zip(xs, ys)), 0.0)
+
+    assert len(model.parameters()) == 2 * 4 + 4 + 4 + 1
+    first = loss_fn()
+    for _ in range(20):
+        model.zero_grad()
+        loss = loss_fn()
+        loss.backward()
+        model.step(0.05)
+    assert loss_fn().data < first.data
+
+
+class Growing(Module):
+    """Module filling its lists after assigning them, used for the tests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.layers = []
+        self.weights = [Parameter(1.0, label='w0')]
+        self.layers.append(Affine())
+        self.layers.append(Affine())
+        self.weights.append(Parameter(2.0, label='w1'))
+
+
+def test_module_lists_appended() -> None:
+    """Test that the items appended to a registered list are registered."""
+    model = Growing()
+    params = model.parameters()
+
+    assert [p.label for p in params] == ['w0', 'w1', 'a', 'b', 'a', 'b']
+    loss = model.layers[1](model.layers[0](model.weights[1]))
+    loss.backward()
+    model.step(0.1)
+    assert model.layers[0].a.data == 2.0 - 0.1 * 2.0 * 2.0
+    model.zero_grad()
+    assert all(p._grad == 0.0 for p in params)
+
+
+class Tied(Module):
+    """Modules sharing a parameter, used for the tests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.first = Affine()
+        self.second = Affine()
+        self.second.a = self.first.a
+        self.extra = [self.first.b, self.first.b]
+
+
+def test_module_tied_parameters() -> None:
+    """Test that a parameter shared by several modules is listed and updated once."""
+    model = Tied()
+    params = model.parameters()
+
+    assert params == [model.first.b, model.first.a, model.second.b]
+    loss = model.second(model.first(1.0))
+    loss.backward()
+    a_grad = model.first.a._grad
+    model.step(0.1)
+    assert model.first.a.data == 2.0 - 0.1 * a_grad
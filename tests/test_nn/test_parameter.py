@@ -0,0 +1,23 @@
+"""Test suite for the Parameter object."""
+
+from nanograd.nn import Parameter
+from nanograd.scalar import Scalar
+
+def test_parameter_is_leaf_requiring_grad() -> None:
+    """Test that a parameter is a leaf Scalar requiring gradient."""
+    p = Parameter(0.5, label='p')
+    assert isinstance(p, Scalar)
+    assert p.requires_grad
+    assert p._backward == 1.0
+    assert p._prev == ()
+    assert p.label == 'p'
+    assert not hasattr(p, '__dict__')
+
+
+def test_parameter_operations_return_scalar() -> None:
+    """Test that the operations on a parameter build regular Scalar nodes."""
+    p = Parameter(2.0)
+    out = p * 3.0
+    out.backward()
+    assert type(out) is Scalar
+    assert p._grad == 3.0
@@ -0,0 +1,59 @@
+"""Test suite for the installation of the wrappers of the patching contexts."""
+
+from nanograd.patching import PatchingContext
+
+
+class Greeter:
+    """Class patched by the tests."""
+
+    def greet(self) -> str:
+        return "hello"
+
+    @staticmethod
+    def name() -> str:
+        return "greeter"
+
+
+class Suffix(PatchingContext):
+    """Context appending a suffix to the results of the methods of Greeter."""
+
+    def __init__(self, suffix: str) -> None:
+        super().__init__()
+        self.suffix = suffix
+        self.calls = 0
+
+    def _wrappers(self):
+        def factory(method, below):
+            def wrapper(*args):
+                self.calls += 1
+                return method(*args) + self.suffix
+            return wrapper
+        return {(Greeter, "greet"): factory, (Greeter, "name"): factory}
+
+
+def test_patching_any_order() -> None:
+    """Test that the contexts compose and can be exited in any order."""
+    methods = dict(Greeter.__dict__)
+    a, b = Suffix("-a"), Suffix("-b")
+    a.__enter__()
+    b.__enter__()
+    assert Greeter().greet() == "hello-a-b"
+    assert Greeter.name() == "greeter-a-b"
+    a.__exit__(None, None, None)
+    assert Greeter().greet() == "hello-b"
+    b.__exit__(None, None, None)
+    assert Greeter().greet() == "hello"
+    assert dict(Greeter.__dict__) == methods
+
+
+def test_patching_reentrant() -> None:
+    """Test that entering an active context again is a no-op."""
+    suffix = Suffix("!")
+
+    @suffix
+    def countdown(n: int) -> str:
+        return Greeter().greet() if n == 0 else countdown(n - 1)
+
+    assert countdown(3) == "hello!"
+    assert suffix.calls == 1
+    assert Greeter().greet() == "hello"
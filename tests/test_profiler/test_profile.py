@@ -0,0 +1,112 @@
+"""Test suite for the profile context manager."""
+
+import json
+from nanograd.enums import Operation
+from nanograd.grad_mode import no_grad
+from nanograd.profiler import profile
+from nanograd.scalar import Scalar
+
+
+def test_profile_counts() -> None:
+    """Test the number of calls and nodes recorded per operation."""
+    x = Scalar(2.0, requires_grad=True)
+    y = Scalar(3.0, requires_grad=True)
+    with profile() as prof:
+        z = (x * y + 1.0).tanh() - 2.0 * x
+        w = Scalar.sum([z, x.pow(2), 1.0])
+        w.backward()
+
+    stats = prof.stats
+    assert stats[Operation.MULTIPLICATION]["calls"] == 2
+    assert stats[Operation.MULTIPLICATION]["nodes"] == 2
+    assert stats[Operation.ADDITION]["nodes"] == 1
+    assert stats[Operation.EXPONENTIATION]["nodes"] == 1
+    assert stats[Operation.SUM]["nodes"] == 1
+    assert stats[Operation.DIVISION]["calls"] == 0
+    assert stats[Operation.HYPERBOLIC_TANGENT]["backward"] > 0.0
+    assert prof.topological_sort["calls"] == 1
+
+
+def test_profile_gradients() -> None:
+    """Test that the gradients are the same within the profiler."""
+    def run() -> float:
+        x = Scalar(0.5, requires_grad=True)
+        (Scalar.dot([x, 2.0], [x.exp(), x / 3.0]) ** 2).relu().backward()
+        return x._grad
+
+    expected = run()
+    with profile():
+        assert run() == expected
+
+
+def test_profile_no_grad() -> None:
+    """Test that the operators called without gradient create no node."""
+    x = Scalar(2.0, requires_grad=True)
+    with profile() as prof, no_grad():
+        x + x
+
+    assert prof.stats[Operation.ADDITION]["calls"] == 1
+    assert prof.stats[Operation.ADDITION]["nodes"] == 0
+
+
+def test_profile_restores_methods() -> None:
+    """Test that the methods of the Scalar object are restored on exit."""
+    methods = dict(Scalar.__dict__)
+    with profile():
+        assert Scalar.__dict__["__add__"] is not methods["__add__"]
+    assert dict(Scalar.__dict__) == methods
+
+
+def test_profile_memory() -> None:
+    """Test that the bytes held by the created nodes are recorded."""
+    x = Scalar(2.0, requires_grad=True)
+    with profile(memory=True) as prof:
+        nodes = [x * float(i) for i in range(100)]
+
+    assert len(nodes) == 100
+    assert prof.stats[Operation.MULTIPLICATION]["bytes"] > 0
+
+
+def test_profile_report_and_json(tmp_path) -> None:
+    """Test the report and the JSON dump of the statistics."""
+    x = Scalar(2.0, requires_grad=True)
+    with profile() as prof:
+        (x.exp() * x).backward()
+    path = tmp_path / "profile.json"
+    text = prof.to_json(str(path))
+
+    assert json.loads(path.read_text()) == json.loads(text) == prof.to_dict()
+    assert set(prof.to_dict()["operations"]) == {"exp", "mul"}
+    assert prof.report().splitlines()[0].startswith("operation")
+
+
+def test_profile_recursive() -> None:
+    """Test that a profiler decorating a recursive function is entered once."""
+    prof = profile()
+
+    @prof
+    def power(x: Scalar, n: int) -> Scalar:
+        return x if n == 1 else x * power(x, n - 1)
+
+    methods = dict(Scalar.__dict__)
+    power(Scalar(2.0), 4)
+    assert prof.stats[Operation.MULTIPLICATION]["calls"] == 3
+    assert dict(Scalar.__dict__) == methods
+
+
+def test_profile_nested() -> None:
+    """Test that nested profilers both record and can be exited in any order."""
+    methods = dict(Scalar.__dict__)
+    x = Scalar(2.0)
+    outer, inner = profile(), profile()
+    outer.__enter__()
+    inner.__enter__()
+    x.exp()
+    outer.__exit__(None, None, None)
+    x.exp()
+    inner.__exit__(None, None, None)
+    x.exp()
+
+    assert outer.stats[Operation.EXPONENTIAL]["calls"] == 1
+    assert inner.stats[Operation.EXPONENTIAL]["calls"] == 2
+    assert dict(Scalar.__dict__) == methods
@@ -0,0 +1,33 @@
+"""Test suite for the local gradient tangent rules."""
+
+from math import isclose
+from nanograd.enums import Operation
+from nanograd.rules import LOCAL_GRADIENT_TANGENTS, LOCAL_GRADIENTS
+from pytest import mark
+from tests.test_rules.test_local_gradients import FUNCTIONS
+
+
+def test_local_gradient_tangents_cover_operations() -> None:
+    """Test that every local gradient rule has a tangent rule."""
+    assert set(LOCAL_GRADIENT_TANGENTS) == set(LOCAL_GRADIENTS)
+
+
+@mark.parametrize("op", FUNCTIONS)
+def test_local_gradient_tangents_finite_differences(op: Operation) -> None:
+    """
+    Test the tangent rules against central finite differences of the local gradients
+    along a direction.
+    """
+    fn, args = FUNCTIONS[op]
+    dargs = tuple(0.3 - 0.2 * k for k in range(len(args)))
+    out = fn(*args)
+    dout = sum(LOCAL_GRADIENTS[op](out, args, i) * d for i, d in enumerate(dargs))
+    h = 1e-6
+    up = tuple(a + h * d for a, d in zip(args, dargs))
+    down = tuple(a - h * d for a, d in zip(args, dargs))
+    for i in range(len(args)):
+        expected = (
+            LOCAL_GRADIENTS[op](fn(*up), up, i) - LOCAL_GRADIENTS[op](fn(*down), down, i)
+        ) / (2 * h)
+        tangent = LOCAL_GRADIENT_TANGENTS[op](out, args, i, dout, dargs)
+        assert isclose(tangent, expected, rel_tol=1e-5, abs_tol=1e-8)
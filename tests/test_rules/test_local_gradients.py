@@ -0,0 +1,51 @@
+"""Test suite for the local gradient rules."""
+
+from math import exp, isclose, tanh
+from nanograd.enums import Operation
+from nanograd.rules import LOCAL_GRADIENTS
+from pytest import mark
+
+FUNCTIONS = {
+    Operation.IDENTITY: (lambda x: x, (1.3,)),
+    Operation.ADDITION: (lambda x, y: x + y, (1.3, 0.7)),
+    Operation.NEGATION: (lambda x: -x, (1.3,)),
+    Operation.SUBTRACTION: (lambda x, y: x - y, (1.3, 0.7)),
+    Operation.MULTIPLICATION: (lambda x, y: x * y, (1.3, 0.7)),
+    Operation.DIVISION: (lambda x, y: x / y, (1.3, 0.7)),
+    Operation.INVERTION: (lambda x: 1.0 / x, (1.3,)),
+    Operation.EXPONENTIATION: (lambda x, y: x**y, (1.3, 0.7)),
+    Operation.EXPONENTIAL: (exp, (1.3,)),
+    Operation.HYPERBOLIC_TANGENT: (tanh, (0.7,)),
+    Operation.RELU: (lambda x: max(0.0, x), (1.3,)),
+    Operation.SUM: (lambda *args: sum(args), (1.3, 0.7, -0.2)),
+    Operation.LINEAR: (lambda w0, w1, x0, x1, b: w0 * x0 + w1 * x1 + b,
+                       (1.3, 0.7, -0.2, 0.4, 1.1)),
+}
+
+
+def test_local_gradients_cover_operations() -> None:
+    """Test that every operation building a Scalar node has a local gradient rule."""
+    assert Operation.NONE not in LOCAL_GRADIENTS
+    assert set(FUNCTIONS) | {Operation.FLOOR_DIVISION} <= set(LOCAL_GRADIENTS)
+
+
+@mark.parametrize("op", FUNCTIONS)
+def test_local_gradients_finite_differences(op: Operation) -> None:
+    """Test the local gradient rules against central finite differences."""
+    fn, args = FUNCTIONS[op]
+    out = fn(*args)
+    h = 1e-6
+    for i in range(len(args)):
+        up = list(args)
+        down = list(args)
+        up[i] += h
+        down[i] -= h
+        expected = (fn(*up) - fn(*down)) / (2 * h)
+        assert isclose(LOCAL_GRADIENTS[op](out, args, i), expected, rel_tol=1e-6)
+
+
+def test_local_gradients_floordiv() -> None:
+    """Test that the local gradient of the floor division is zero."""
+    rule = LOCAL_GRADIENTS[Operation.FLOOR_DIVISION]
+    assert rule(2.0, (5.0, 2.0), 0) == 0.0
+    assert rule(2.0, (5.0, 2.0), 1) == 0.0
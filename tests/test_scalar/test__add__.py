@@ -9,36 +9,26 @@ def test__add__int() -> None:
     """Test that the addition operator works when the argument is an int."""
     x = Scalar(1.0, requires_grad=True)
     z = x + 1
-    y = (z._prev - {x}).pop()
     # Check that the output is correct.
     assert z.data == 2.0
     assert z.requires_grad
     assert z._op == Operation.ADDITION
     # Check that the children of the output are correct.
-    assert z._prev == OrderedSet([x, y])
-    assert y.data == 1
-    assert not y.requires_grad
-    assert y._op == Operation.NONE
-    assert len(y._prev) == 0
-    assert y.label is None
+    assert z._prev == (x,)
+    assert z._operands == (x, 1)
 
 
 def test__add__float() -> None:
     """Test that the addition operator works when the argument is a float."""
     x = Scalar(1.0, requires_grad=True)
     z = x + 1.0
-    y = (z._prev - {x}).pop()
     # Check that the output is correct.
     assert z.data == 2.0
     assert z.requires_grad
     assert z._op == Operation.ADDITION
     # Check that the children of the output are correct.
-    assert z._prev == OrderedSet([x, y])
-    assert y.data == 1.0
-    assert not y.requires_grad
-    assert y._op == Operation.NONE
-    assert len(y._prev) == 0
-    assert y.label is None
+    assert z._prev == (x,)
+    assert z._operands == (x, 1.0)
 
 
 def test__add__scalar() -> None:
@@ -9,34 +9,30 @@ def test__floordiv__int_int() -> None:
     """Test the floor division operator with an integer."""
     x = Scalar(21, requires_grad=True)
     z = x // 7
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert type(z.data) == int
     assert z.data == 3
     assert z._op == Operation.FLOOR_DIVISION
-    assert z._prev == OrderedSet([x, y])
+    assert z._prev == (x,)
+    assert z._operands == (x, 7)
     assert x._grad == 0.0
-    assert y._grad == 0.0
 
 
 def test__floordiv__int_float() -> None:
     """Test the floor division operator with a float."""
     x = Scalar(21, requires_grad=True)
     z = x // 6.239083
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert type(z.data) == float
     assert z.data == 3.0
     assert z._op == Operation.FLOOR_DIVISION
-    assert z._prev == OrderedSet([x, y])
+    assert z._prev == (x,)
+    assert z._operands == (x, 6.239083)
     assert x._grad == 0.0
-    assert y._grad == 0.0
 
 
 def test__floordiv__int_scalar() -> None:
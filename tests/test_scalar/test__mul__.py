@@ -9,30 +9,28 @@ def test__mul__int() -> None:
     """Test the __mul__ method with an int as argument."""
     x = Scalar(2.0, requires_grad=True)
     z = x * 2
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2
     z._grad = 1.0
     z._backward_fn()
     assert z.data == 4.0
     assert z._op == Operation.MULTIPLICATION
-    assert z._prev == OrderedSet([x, y])
-    assert x._grad == y.data
-    assert y._grad == x.data
+    assert z._prev == (x,)
+    assert z._operands == (x, 2)
+    assert x._grad == y
 
 
 def test__mul__float() -> None:
     """Test the __mul__ method with a float as argument."""
     x = Scalar(2.0, requires_grad=True)
     z = x * 2.0
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2.0
     z._grad = 1.0
     z._backward_fn()
     assert z.data == 4.0
     assert z._op == Operation.MULTIPLICATION
-    assert z._prev == OrderedSet([x, y])
-    assert x._grad == y.data
-    assert y._grad == x.data
+    assert z._prev == (x,)
+    assert z._operands == (x, 2.0)
+    assert x._grad == y
 
 
 def test__mul__scalar() -> None:
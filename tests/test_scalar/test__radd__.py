@@ -2,43 +2,32 @@
 
 from nanograd.scalar import Scalar
 from nanograd.enums import Operation
-from ordered_set import OrderedSet
 from pytest import raises
 
 def test__radd__int() -> None:
     """Test that the right addition operator works when the argument is an int."""
     x = Scalar(1.0, requires_grad=True)
     z = 1 + x
-    y = (z._prev - {x}).pop()
     # Check that the output is correct.
     assert z.data == 2.0
     assert z.requires_grad
     assert z._op == Operation.ADDITION
     # Check that the children of the output are correct.
-    assert z._prev == OrderedSet([x, y])
-    assert y.data == 1
-    assert not y.requires_grad
-    assert y._op == Operation.NONE
-    assert len(y._prev) == 0
-    assert y.label is None
+    assert z._prev == (x,)
+    assert z._operands == (1, x)
 
 
 def test__radd__float() -> None:
     """Test that the right addition operator works when the argument is a float."""
     x = Scalar(1.0, requires_grad=True)
     z = 1.0 + x
-    y = (z._prev - {x}).pop()
     # Check that the output is correct.
     assert z.data == 2.0
     assert z.requires_grad
     assert z._op == Operation.ADDITION
     # Check that the children of the output are correct.
-    assert z._prev == OrderedSet([x, y])
-    assert y.data == 1.0
-    assert not y.requires_grad
-    assert y._op == Operation.NONE
-    assert len(y._prev) == 0
-    assert y.label is None
+    assert z._prev == (x,)
+    assert z._operands == (1.0, x)
 
 
 def test__radd__unsupported_type() -> None:
@@ -55,9 +44,6 @@ def test__radd__backward_fn() -> None:
     """Test that the backward function works for the right addition operator."""
     x = Scalar(1.0, requires_grad=True)
     z = 1 + x
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
     assert x._grad == 1.0
-    assert y._grad == 1.0
@@ -2,39 +2,34 @@
 
 from nanograd.scalar import Scalar
 from nanograd.enums import Operation
-from ordered_set import OrderedSet
 from pytest import raises
 
 def test__rfloordiv__int() -> None:
     """Test the __rfloordiv__ method of the Scalar object with an int."""
     x = Scalar(1.143498, requires_grad=True)
     z = 2 // x
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == 1.0
     assert z._op == Operation.FLOOR_DIVISION
-    assert z._prev == OrderedSet([y, x])
+    assert z._prev == (x,)
+    assert z._operands == (2, x)
     assert x._grad == 0.0
-    assert y._grad == 0.0
 
 
 def test__rfloordiv__float() -> None:
     """Test the __rfloordiv__ method of the Scalar object with a float."""
     x = Scalar(1.143498, requires_grad=True)
     z = 2.0 // x
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == 1.0
     assert z._op == Operation.FLOOR_DIVISION
-    assert z._prev == OrderedSet([y, x])
+    assert z._prev == (x,)
+    assert z._operands == (2.0, x)
     assert x._grad == 0.0
-    assert y._grad == 0.0
 
 
 def test__rfloordiv__unsupported() -> None:
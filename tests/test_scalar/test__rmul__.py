@@ -2,37 +2,34 @@
 
 from nanograd.scalar import Scalar
 from nanograd.enums import Operation
-from ordered_set import OrderedSet
 from pytest import raises
 
 def test__rmul__int() -> None:
     """Test the __rmul__ method with an int as argument."""
     x = Scalar(2.0, requires_grad=True)
     z = 2 * x
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2
     z._grad = 1.0
     z._backward_fn()
     assert z.data == 4.0
     assert z._op == Operation.MULTIPLICATION
-    assert z._prev == OrderedSet([y, x])
-    assert x._grad == y.data
-    assert y._grad == x.data
+    assert z._prev == (x,)
+    assert z._operands == (2, x)
+    assert x._grad == y
 
 
 def test__rmul__float() -> None:
     """Test the __rmul__ method with a float as argument."""
     x = Scalar(2.0, requires_grad=True)
     z = 2.0 * x
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2.0
     z._grad = 1.0
     z._backward_fn()
     assert z.data == 4.0
     assert z._op == Operation.MULTIPLICATION
-    assert z._prev == OrderedSet([y, x])
-    assert x._grad == y.data
-    assert y._grad == x.data
+    assert z._prev == (x,)
+    assert z._operands == (2.0, x)
+    assert x._grad == y
 
 
 def test__rmul__not_supported() -> None:
@@ -3,39 +3,36 @@
 from math import isclose, log
 from nanograd.scalar import Scalar
 from nanograd.enums import Operation
-from ordered_set import OrderedSet
 from pytest import raises
 
 def test__rpow__int() -> None:
     """Test the __rpow__ method of the Scalar object with an int."""
     x = Scalar(2.0, requires_grad=True)
     z = 2 ** x
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == 4.0
     assert z._op == Operation.EXPONENTIATION
-    assert z._prev == OrderedSet([y, x])
-    assert isclose(x._grad, (y.data**x.data) * log(y.data))
-    assert isclose(y._grad, (y.data**(x.data-1))* x.data)
+    assert z._prev == (x,)
+    assert z._operands == (2, x)
+    assert isclose(x._grad, (y**x.data) * log(y))
 
 
 def test__rpow__float() -> None:
     """Test the __rpow__ method of the Scalar object with a float."""
     x = Scalar(2.0, requires_grad=True)
     z = 2.0 ** x
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2.0
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == 4.0
     assert z._op == Operation.EXPONENTIATION
-    assert z._prev == OrderedSet([y, x])
-    assert isclose(x._grad, (y.data**x.data) * log(y.data))
-    assert isclose(y._grad, (y.data**(x.data-1))* x.data)
+    assert z._prev == (x,)
+    assert z._operands == (2.0, x)
+    assert isclose(x._grad, (y**x.data) * log(y))
 
 
 def test__rpow__unsupported() -> None:
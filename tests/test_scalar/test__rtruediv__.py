@@ -3,39 +3,36 @@
 from math import isclose
 from nanograd.scalar import Scalar
 from nanograd.enums import Operation
-from ordered_set import OrderedSet
 from pytest import raises
 
 def test__rtruediv__int() -> None:
     """Test the __rtruediv__ method with an argument of type int."""
     y = Scalar(2.0, requires_grad=True)
     z = 4 / y
-    x = (z._prev - {y}).pop()
-    x.requires_grad_(True)
+    x = 4
     z._grad = 1.0
     z._backward_fn()
     
     assert z.data == 2.0
     assert z._op == Operation.DIVISION
-    assert z._prev == OrderedSet([x, y])
-    assert isclose(x._grad, 1.0 / y.data)
-    assert isclose(y._grad, -x.data / (y.data**2))
+    assert z._prev == (y,)
+    assert z._operands == (4, y)
+    assert isclose(y._grad, -x / (y.data**2))
 
 
 def test__rtruediv__float() -> None:
     """Test the __rtruediv__ method with an argument of type float."""
     y = Scalar(2.0, requires_grad=True)
     z = 4.0 / y
-    x = (z._prev - {y}).pop()
-    x.requires_grad_(True)
+    x = 4.0
     z._grad = 1.0
     z._backward_fn()
     
     assert z.data == 2.0
     assert z._op == Operation.DIVISION
-    assert z._prev == OrderedSet([x, y])
-    assert isclose(x._grad, 1.0 / y.data)
-    assert isclose(y._grad, -x.data / (y.data**2))
+    assert z._prev == (y,)
+    assert z._operands == (4.0, y)
+    assert isclose(y._grad, -x / (y.data**2))
 
 
 def test__rtruediv__not_supported() -> None:
@@ -9,32 +9,28 @@ def test__sub__int() -> None:
     """Test the __sub__ method with an int."""
     x = Scalar(1, requires_grad=True)
     z = x - 2
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == -1
     assert z._op == Operation.SUBTRACTION
-    assert z._prev == OrderedSet([x, y])
+    assert z._prev == (x,)
+    assert z._operands == (x, 2)
     assert x._grad == 1.0
-    assert y._grad == -1.0
 
 
 def test__sub__float() -> None:
     """Test the __sub__ method with a float."""
     x = Scalar(1.0, requires_grad=True)
     z = x - 2.0
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == -1.0
     assert z._op == Operation.SUBTRACTION
-    assert z._prev == OrderedSet([x, y])
+    assert z._prev == (x,)
+    assert z._operands == (x, 2.0)
     assert x._grad == 1.0
-    assert y._grad == -1.0
 
 
 def test__sub__Scalar() -> None:
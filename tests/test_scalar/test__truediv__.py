@@ -10,32 +10,30 @@ def test__truediv__int() -> None:
     """Test the __truediv__ method with an argument of type int."""
     x = Scalar(4.0, requires_grad=True)
     z = x / 2
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2
     z._grad = 1.0
     z._backward_fn()
     
     assert z.data == 2.0
     assert z._op == Operation.DIVISION
-    assert z._prev == OrderedSet([x, y])
-    assert isclose(x._grad, 1 / y.data)
-    assert isclose(y._grad, -x.data / (y.data**2))
+    assert z._prev == (x,)
+    assert z._operands == (x, 2)
+    assert isclose(x._grad, 1 / y)
 
 
 def test__truediv__float() -> None:
     """Test the __truediv__ method with an argument of type float."""
     x = Scalar(4.0, requires_grad=True)
     z = x / 2.0
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2.0
     z._grad = 1.0
     z._backward_fn()
     
     assert z.data == 2.0
     assert z._op == Operation.DIVISION
-    assert z._prev == OrderedSet([x, y])
-    assert isclose(x._grad, 1 / y.data)
-    assert isclose(y._grad, -x.data / (y.data**2))
+    assert z._prev == (x,)
+    assert z._operands == (x, 2.0)
+    assert isclose(x._grad, 1 / y)
 
 
 def test__truediv__scalar() -> None:
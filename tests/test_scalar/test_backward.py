@@ -1,15 +1,19 @@
 """Test suite for the backward method of the Scalar object."""
 
 from math import isclose
+from nanograd import scalar
 from nanograd.scalar import Scalar
+from nanograd.utils import topological_sort
+from ordered_set import OrderedSet
+from pytest import raises
 
 def test_backward() -> None:
     """Test of the backward method of the Scalar object."""
     x1 = Scalar(-3.0)
-    w1 = Scalar(1.0)
+    w1 = Scalar(1.0, requires_grad=True)
     x1w1 = x1 * w1
     x2 = Scalar(1.0)
-    w2 = Scalar(0.5)
+    w2 = Scalar(0.5, requires_grad=True)
     x2w2 = x2 * w2
     x1w1x2w2 = x1w1 + x2w2
     b = Scalar(3.0)
@@ -30,6 +34,173 @@ def test_backward() -> None:
     assert isclose(x1w1._grad, x1w1_expected_grad)
     assert isclose(x2w2._grad, x2w2_expected_grad)
     assert x1._grad == 0.0
-    assert w1._grad == 0.0
+    assert isclose(w1._grad, x1.data * x1w1_expected_grad)
     assert x2._grad == 0.0
-    assert w2._grad == 0.0
+    assert isclose(w2._grad, x2.data * x2w2_expected_grad)
+
+
+def test_backward_constant_graph() -> None:
+    """Test that no gradient flows through a graph that does not require it."""
+    x = Scalar(2.0)
+    y = Scalar(3.0)
+    xy = x * y
+    out = xy.tanh()
+    out.backward()
+
+    assert not xy.requires_grad
+    assert not out.requires_grad
+    assert out._grad == 1.0
+    assert xy._grad == 0.0
+    assert x._grad == 0.0
+    assert y._grad == 0.0
+
+
+def test_backward_pruned_subgraph() -> None:
+    """Test that the subgraph that does not require gradient is not visited."""
+    x = Scalar(2.0, requires_grad=True)
+    c = Scalar(-3.0)
+    constant = (c ** 2).exp()
+    out = x * constant
+
+    assert not constant.requires_grad
+    assert out.requires_grad
+    assert topological_sort(out, requires_grad_only=True) == OrderedSet([x, out])
+    out.backward()
+    assert isclose(x._grad, constant.data)
+    assert constant._grad == 0.0
+
+
+def _count_sorts(monkeypatch) -> list:
+    """Record the roots of the topological sorts performed by the backward pass."""
+    calls = []
+
+    def _topological_sort(root, **kwargs):
+        calls.append(root)
+        return topological_sort(root, **kwargs)
+
+    monkeypatch.setattr(scalar, 'topological_sort', _topological_sort)
+    return calls
+
+
+def test_backward_retain_graph_caches_order(monkeypatch) -> None:
+    """Test that the topological order is only computed once with retain_graph."""
+    calls = _count_sorts(monkeypatch)
+    x = Scalar(2.0, requires_grad=True)
+    y = Scalar(3.0, requires_grad=True)
+    out = (x * y).tanh()
+    out.backward(retain_graph=True)
+    out.backward(retain_graph=True)
+    out.backward()
+
+    assert len(calls) == 1
+    assert out._topo is None
+
+
+def test_backward_repeated_accumulates() -> None:
+    """Test that repeated backward passes accumulate the gradients of the leaves."""
+    x = Scalar(2.0, requires_grad=True)
+    y = Scalar(3.0, requires_grad=True)
+    xy = x * y
+    out = xy * xy
+    out.backward(retain_graph=True)
+    x_grad, y_grad = x._grad, y._grad
+    out.backward(retain_graph=True)
+
+    assert x_grad == 2.0 * 6.0 * 3.0
+    assert x._grad == 2.0 * x_grad
+    assert y._grad == 2.0 * y_grad
+    assert xy._grad == 2.0 * 6.0
+
+
+def test_backward_cache_invalidated(monkeypatch) -> None:
+    """Test that a change of the graph invalidates the cached topological order."""
+    calls = _count_sorts(monkeypatch)
+    x = Scalar(2.0, requires_grad=True)
+    out = x.exp()
+    out.backward(retain_graph=True)
+    x.requires_grad_(False)
+    out.backward(retain_graph=True)
+
+    assert len(calls) == 2
+
+
+def test_backward_frees_graph() -> None:
+    """Test that the links of the intermediate nodes are released by default."""
+    x = Scalar(2.0, requires_grad=True)
+    c = Scalar(3.0)
+    xc = x * c
+    out = xc.tanh()
+    out.backward()
+
+    assert out._prev == ()
+    assert xc._prev == ()
+    assert isclose(xc._grad, 1.0 - out.data**2)
+    assert isclose(x._grad, 3.0 * xc._grad)
+    with raises(RuntimeError):
+        out.backward()
+
+
+def test_backward_freed_shared_node() -> None:
+    """Test that a node freed by the backward pass of another root raises an error."""
+    x = Scalar(2.0, requires_grad=True)
+    shared = x * x
+    first = shared + 1.0
+    second = shared * 2.0
+    first.backward()
+    with raises(RuntimeError):
+        second.backward()
+
+
+def test_backward_retain_graph_keeps_links() -> None:
+    """Test that the graph is kept with retain_graph."""
+    x = Scalar(2.0, requires_grad=True)
+    xx = x * x
+    out = xx.exp()
+    out.backward(retain_graph=True)
+
+    assert out._prev == (xx,)
+    assert xx._prev == (x, x)
+
+
+def test_backward_cache_kept_by_other_graphs(monkeypatch) -> None:
+    """Test that the changes of another graph do not invalidate the cached order."""
+    calls = _count_sorts(monkeypatch)
+    x = Scalar(2.0, requires_grad=True)
+    out = (x * x).tanh()
+    out.backward(retain_graph=True)
+    for _ in range(3):
+        y = Scalar(1.0, requires_grad=True)
+        (y * 3.0).exp().backward()
+        y.requires_grad_(False)
+        out.backward(retain_graph=True)
+
+    assert calls.count(out) == 1
+    assert isclose(x._grad, 4.0 * 4.0 * (1.0 - out.data**2))
+
+
+def test_backward_cache_checks_flags(monkeypatch) -> None:
+    """Test that the cached order is sorted again when a flag of its graph changes."""
+    calls = _count_sorts(monkeypatch)
+    x = Scalar(2.0, requires_grad=True)
+    c = Scalar(3.0)
+    out = x * c
+    out.backward(retain_graph=True)
+    c.requires_grad_(True)
+    out.backward(retain_graph=True)
+    c.requires_grad_(True)
+    out.backward(retain_graph=True)
+
+    assert len(calls) == 2
+    assert c._grad == 2.0 * 2.0
+
+
+def test_backward_cache_freed_by_other_graph() -> None:
+    """Test that the cached order raises on the nodes freed by another graph."""
+    x = Scalar(2.0, requires_grad=True)
+    shared = x * x
+    first = shared + 1.0
+    second = shared * 2.0
+    first.backward(retain_graph=True)
+    second.backward()
+    with raises(RuntimeError):
+        first.backward(retain_graph=True)
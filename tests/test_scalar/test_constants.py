@@ -0,0 +1,70 @@
+"""Test suite for the constant operands of the Scalar object."""
+
+from math import isclose
+from nanograd.scalar import Scalar
+from nanograd.enums import Operation
+from nanograd.utils import topological_sort
+
+
+def test_constants_not_in_graph() -> None:
+    """Test that the number operands do not add any node to the graph."""
+    x = Scalar(2.0, requires_grad=True)
+    z = 3.0 * x**2 - 1.0
+
+    assert len(topological_sort(z)) == 4
+
+
+def test_constant_exponent_negative_base() -> None:
+    """Test that a constant exponent does not differentiate with respect to itself."""
+    x = Scalar(-3.0, requires_grad=True)
+    z = x**2
+    z.backward()
+
+    assert z.data == 9.0
+    assert isclose(x._grad, -6.0)
+
+
+def test_constants_backward() -> None:
+    """Test the backward pass of a polynomial built with constants."""
+    x = Scalar(2.0, requires_grad=True)
+    z = 1.0 - 3.0 * x**3 / 4.0 + 2 / x
+    z.backward()
+
+    assert isclose(z.data, -4.0)
+    assert isclose(x._grad, -9.0 - 0.5)
+
+
+def test_constants_sum() -> None:
+    """Test that the constants of the sum operator are kept inline."""
+    x = Scalar(2.0, requires_grad=True)
+    z = Scalar.sum([x, 1.0, x])
+
+    assert z.data == 5.0
+    assert z._op == Operation.SUM
+    assert z._prev == (x, x)
+    assert z._operands == (x, 1.0, x)
+    z.backward()
+    assert x._grad == 2.0
+
+
+def test_constants_dot() -> None:
+    """Test that the inputs of the affine operator can be constants."""
+    w = [Scalar(2.0, requires_grad=True), Scalar(3.0, requires_grad=True)]
+    b = Scalar(1.0, requires_grad=True)
+    z = Scalar.dot(w, [4.0, 5], b)
+
+    assert z.data == 24.0
+    assert z._prev == (*w, b)
+    assert z._operands == (*w, 4.0, 5, b)
+    z.backward()
+    assert [wi._grad for wi in w] == [4.0, 5.0]
+    assert b._grad == 1.0
+
+
+def test_constants_only() -> None:
+    """Test that an operator applied to numbers only returns a leaf."""
+    z = Scalar.sum([1.0, 2.0])
+
+    assert z.data == 3.0
+    assert z._op == Operation.NONE
+    assert z._operands is None
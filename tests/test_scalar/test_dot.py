@@ -0,0 +1,80 @@
+"""Test suite for the dot method of the Scalar object."""
+
+from array import array
+from math import isclose
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+from pytest import raises
+
+def test_dot_single_node() -> None:
+    """Test that the affine function is a single node."""
+    ws = [Scalar(0.5, requires_grad=True), Scalar(-1.0, requires_grad=True)]
+    xs = [Scalar(2.0), Scalar(3.0)]
+    b = Scalar(0.25, requires_grad=True)
+    out = Scalar.dot(ws, xs, b, label='out')
+
+    assert out.data == 0.5 * 2.0 - 1.0 * 3.0 + 0.25
+    assert out.label == 'out'
+    assert out.requires_grad
+    assert out._op == Operation.LINEAR
+    assert out._prev == (*ws, *xs, b)
+
+
+def test_dot_backward() -> None:
+    """Test the gradients of the weights, the inputs and the bias."""
+    ws = [Scalar(0.5, requires_grad=True), Scalar(-1.0, requires_grad=True)]
+    xs = [Scalar(2.0, requires_grad=True), Scalar(3.0)]
+    b = Scalar(0.25, requires_grad=True)
+    out = Scalar.dot(ws, xs, b).tanh()
+    out.backward()
+    grad = 1.0 - out.data**2
+
+    assert isclose(ws[0]._grad, 2.0 * grad)
+    assert isclose(ws[1]._grad, 3.0 * grad)
+    assert isclose(xs[0]._grad, 0.5 * grad)
+    assert xs[1]._grad == 0.0
+    assert isclose(b._grad, grad)
+
+
+def test_dot_matches_unfused() -> None:
+    """Test that the affine node gives the same gradients as the unfused graph."""
+    ws = [Scalar(0.1 * i - 1.0, requires_grad=True) for i in range(20)]
+    xs = [Scalar(0.3 * i, requires_grad=True) for i in range(20)]
+    b = Scalar(0.5, requires_grad=True)
+    fused = Scalar.dot(ws, xs, b)
+    fused.backward()
+    grads = [s._grad for s in (*ws, *xs, b)]
+    for s in (*ws, *xs, b):
+        s._grad = 0.0
+    unfused = sum((w * x for w, x in zip(ws, xs)), 0) + b
+    unfused.backward()
+
+    assert isclose(fused.data, unfused.data)
+    assert grads == [s._grad for s in (*ws, *xs, b)]
+
+
+def test_dot_shared_operand() -> None:
+    """Test that the gradient of an operand used several times is accumulated."""
+    x = Scalar(3.0, requires_grad=True)
+    out = Scalar.dot([x, x], [x, 2.0])
+    out.backward()
+
+    assert out.data == 3.0 * 3.0 + 3.0 * 2.0
+    assert x._grad == 2.0 * 3.0 + 2.0
+
+
+def test_dot_number_sequences() -> None:
+    """Test that the operands can be sequences of numbers, without bias."""
+    ws = [Scalar(1.5, requires_grad=True), Scalar(2.0, requires_grad=True)]
+    out = Scalar.dot(ws, array('d', [4.0, -1.0]))
+    out.backward()
+
+    assert out.data == 1.5 * 4.0 - 2.0
+    assert ws[0]._grad == 4.0
+    assert ws[1]._grad == -1.0
+
+
+def test_dot_different_lengths() -> None:
+    """Test that operands of different lengths raise a ValueError."""
+    with raises(ValueError):
+        Scalar.dot([Scalar(1.0)], [1.0, 2.0])
@@ -9,32 +9,28 @@ def test_floordiv_int() -> None:
     """Test the floordiv method of the Scalar object with an int."""
     x = Scalar(2.143498, requires_grad=True)
     z = x.floordiv(2)
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == 1.0
     assert z._op == Operation.FLOOR_DIVISION
-    assert z._prev == OrderedSet([x, y])
+    assert z._prev == (x,)
+    assert z._operands == (x, 2)
     assert x._grad == 0.0
-    assert y._grad == 0.0
 
 
 def test_floordiv_float() -> None:
     """Test the floordiv method of the Scalar object with a float."""
     x = Scalar(2.143498, requires_grad=True)
     z = x.floordiv(2.0)
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
     z._grad = 1.0
     z._backward_fn()
 
     assert z.data == 1.0
     assert z._op == Operation.FLOOR_DIVISION
-    assert z._prev == OrderedSet([x, y])
+    assert z._prev == (x,)
+    assert z._operands == (x, 2.0)
     assert x._grad == 0.0
-    assert y._grad == 0.0
 
 
 def test_floordiv_scalar() -> None:
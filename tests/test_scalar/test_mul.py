@@ -9,30 +9,28 @@ def test_mul_int() -> None:
     """Test the mul method with an int as argument."""
     x = Scalar(2.0, requires_grad=True)
     z = x.mul(2)
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2
     z._grad = 1.0
     z._backward_fn()
     assert z.data == 4.0
     assert z._op == Operation.MULTIPLICATION
-    assert z._prev == OrderedSet([x, y])
-    assert x._grad == y.data
-    assert y._grad == x.data
+    assert z._prev == (x,)
+    assert z._operands == (x, 2)
+    assert x._grad == y
 
 
 def test_mul_float() -> None:
     """Test the mul method with a float as argument."""
     x = Scalar(2.0, requires_grad=True)
     z = x.mul(2.0)
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2.0
     z._grad = 1.0
     z._backward_fn()
     assert z.data == 4.0
     assert z._op == Operation.MULTIPLICATION
-    assert z._prev == OrderedSet([x, y])
-    assert x._grad == y.data
-    assert y._grad == x.data
+    assert z._prev == (x,)
+    assert z._operands == (x, 2.0)
+    assert x._grad == y
 
 
 def test_mul_scalar() -> None:
@@ -60,13 +58,12 @@ def test_mul_with_label() -> None:
     """Test the mul method with a label."""
     x = Scalar(2.0, requires_grad=True)
     z = x.mul(2, label="z")
-    y = (z._prev - {x}).pop()
-    y.requires_grad_(True)
+    y = 2
     z._grad = 1.0
     z._backward_fn()
     assert z.data == 4.0
     assert z._op == Operation.MULTIPLICATION
-    assert z._prev == OrderedSet([x, y])
-    assert x._grad == y.data
-    assert y._grad == x.data
+    assert z._prev == (x,)
+    assert z._operands == (x, 2)
+    assert x._grad == y
     assert z.label == "z"
@@ -14,3 +14,14 @@ def test_requires_grad_false() -> None:
     x = Scalar(1.0, requires_grad=False)
     assert not x.requires_grad
     assert x._backward == 0.0
+
+
+def test_requires_grad_propagation() -> None:
+    """Test that an output requires gradient if and only if one of its inputs does."""
+    x = Scalar(1.0, requires_grad=True)
+    c = Scalar(2.0)
+    assert not (c * c).requires_grad
+    assert not (c + 1).tanh().requires_grad
+    assert (x * c).requires_grad
+    assert (c - x).requires_grad
+    assert (-x).exp().requires_grad
@@ -0,0 +1,29 @@
+"""Test suite for the memory layout of the Scalar object."""
+
+from nanograd.scalar import Scalar
+from pytest import raises
+
+def test_slots_no_dict() -> None:
+    """Test that the Scalar object does not carry a per-instance dictionary."""
+    x = Scalar(1.0)
+    assert not hasattr(x, '__dict__')
+    with raises(AttributeError):
+        x.foo = 1.0
+
+
+def test_slots_prev_tuple() -> None:
+    """Test that the children of a node are stored in a tuple."""
+    x = Scalar(1.0, requires_grad=True)
+    y = Scalar(2.0, requires_grad=True)
+    z = x * y
+    assert x._prev == ()
+    assert z._prev == (x, y)
+
+
+def test_slots_no_backward_closure() -> None:
+    """Test that the nodes do not hold their own backward function."""
+    x = Scalar(1.0, requires_grad=True)
+    y = x.tanh()
+    assert '_backward_fn' not in Scalar.__slots__
+    assert x._backward_fn() is None
+    assert y._backward_fn.__func__ is Scalar._backward_fn
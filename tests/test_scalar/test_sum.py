@@ -0,0 +1,66 @@
+"""Test suite for the sum method of the Scalar object."""
+
+from math import isclose
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+from pytest import raises
+
+def test_sum_single_node() -> None:
+    """Test that the sum of several operands is a single node."""
+    xs = [Scalar(float(i), requires_grad=True) for i in range(5)]
+    out = Scalar.sum(xs, label='out')
+
+    assert out.data == 10.0
+    assert out.label == 'out'
+    assert out.requires_grad
+    assert out._op == Operation.SUM
+    assert out._prev == tuple(xs)
+
+
+def test_sum_backward() -> None:
+    """Test that the gradient is fanned out to all the operands."""
+    x = Scalar(2.0, requires_grad=True)
+    y = Scalar(-1.0, requires_grad=True)
+    c = Scalar(4.0)
+    out = Scalar.sum([x * x, y, c, x, 3])
+    out.backward()
+
+    assert out.data == 4.0 - 1.0 + 4.0 + 2.0 + 3.0
+    assert isclose(x._grad, 2.0 * 2.0 + 1.0)
+    assert y._grad == 1.0
+    assert c._grad == 0.0
+
+
+def test_sum_matches_chain() -> None:
+    """Test that the sum node gives the same gradients as a chain of additions."""
+    xs = [Scalar(0.1 * i, requires_grad=True) for i in range(50)]
+    Scalar.sum(x.tanh() for x in xs).backward()
+    fused = [x._grad for x in xs]
+    for x in xs:
+        x._grad = 0.0
+    sum(x.tanh() for x in xs).backward()
+
+    assert fused == [x._grad for x in xs]
+
+
+def test_sum_deep() -> None:
+    """Test that summing many operands does not build a deep graph."""
+    xs = [Scalar(1.0, requires_grad=True) for _ in range(100_000)]
+    out = Scalar.sum(xs)
+    out.backward()
+
+    assert out.data == 100_000.0
+    assert all(x._grad == 1.0 for x in xs)
+
+
+def test_sum_empty() -> None:
+    """Test that the sum of no operand is zero."""
+    out = Scalar.sum([])
+    assert out.data == 0
+    assert out._prev == ()
+
+
+def test_sum_unsupported_type() -> None:
+    """Test that an unsupported operand raises a TypeError."""
+    with raises(TypeError):
+        Scalar.sum([Scalar(1.0), "1"])
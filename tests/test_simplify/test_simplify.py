@@ -0,0 +1,145 @@
+"""Test suite for the algebraic simplification of the operations."""
+
+import random
+from nanograd.enums import Operation
+from nanograd.grad_mode import no_grad
+from nanograd.scalar import Scalar
+from nanograd.simplify import simplify
+from nanograd.utils import topological_sort
+
+
+def model(x: Scalar, y: Scalar) -> Scalar:
+    """Expression made of trivial operations around a few non-trivial ones."""
+    a = (x * 1 + 0) / 1.0 - 0
+    b = -(-(y**1.0)) * (1.0 * a + x // 2.0)
+    c = (0 + b) ** 1 + Scalar.sum([a // y, 3.0 // x, y])
+    return (a * c).tanh() + b * 1.0
+
+
+def run(x0: float, y0: float) -> tuple[float, float, float, int]:
+    """Value, gradients and size of the graph of the model."""
+    x = Scalar(x0, requires_grad=True)
+    y = Scalar(y0, requires_grad=True)
+    out = model(x, y)
+    size = len(topological_sort(out, requires_grad_only=True))
+    out.backward()
+    return out.data, x._grad, y._grad, size
+
+
+def test_simplify_same_results() -> None:
+    """Test that the data and the gradients are the ones of the eager engine."""
+    for values in ((0.5, 1.5), (-1.25, 0.75), (2.0, -0.5)):
+        data, dx, dy, size = run(*values)
+        with simplify() as simplified:
+            simple_data, simple_dx, simple_dy, simple_size = run(*values)
+        assert (simple_data, simple_dx, simple_dy) == (data, dx, dy)
+        assert simple_size < size
+        assert simplified.stats == {"folded": 9, "pruned": 3}
+
+
+def test_simplify_fan_out() -> None:
+    """Test that the gradients through a folded node used twice are exact."""
+    def run(values: list[float]) -> tuple[float, float]:
+        x = Scalar(values[0], requires_grad=True)
+        a, b, c, d = (Scalar(v) for v in values[1:])
+        y = x * 1
+        out = Scalar.sum([y * a, y * b, x * c, x * d])
+        out.backward()
+        return out.data, x._grad
+
+    rng = random.Random(0)
+    for _ in range(500):
+        values = [rng.uniform(-2.0, 2.0) for _ in range(5)]
+        data, dx = run(values)
+        with simplify():
+            assert run(values) == (data, dx)
+
+
+def test_simplify_root() -> None:
+    """Test that a folded root adds its gradient to the one of its operand."""
+    def run() -> float:
+        x = Scalar(0.5, requires_grad=True)
+        x._grad = 5.0
+        (x * 1).backward()
+        return x._grad
+
+    expected = run()
+    with simplify():
+        assert run() == expected == 6.0
+
+
+def test_simplify_folds() -> None:
+    """Test that the trivial operations return a pass-through node of their operand."""
+    x = Scalar(0.5, requires_grad=True)
+    with simplify() as simplified:
+        for y in (x + 0, 0 + x, x - 0, x * 1, 1.0 * x, x / 1, x**1, x.mul(1)):
+            assert y._op == Operation.IDENTITY
+            assert y._prev == (x,) and y._operands is None
+            assert y.data == x.data and y.requires_grad
+        assert -(-x) is not x
+    assert simplified.stats["folded"] == 8
+
+
+def test_simplify_exact_only() -> None:
+    """Test that the operations changing the data are not folded."""
+    z = Scalar(-0.0, requires_grad=True)
+    n = Scalar(2, requires_grad=True)
+    with simplify():
+        assert (n * 1)._op == Operation.IDENTITY
+        assert (n * 1.0)._op == Operation.MULTIPLICATION
+        assert (n / 1)._op == Operation.DIVISION
+        assert (z - 0.0)._op == Operation.IDENTITY
+        assert (z + 0.0)._op == Operation.ADDITION
+
+
+def test_simplify_labels() -> None:
+    """Test that a labelled operation is recorded and does not relabel its operand."""
+    x = Scalar(0.5, label='x', requires_grad=True)
+    with simplify():
+        y = x.mul(1, label='y')
+        z = x.add(0, 'z')
+    assert x.label == 'x'
+    assert y is not x and y.label == 'y' and y._op == Operation.MULTIPLICATION
+    assert z.label == 'z' and z._op == Operation.ADDITION
+
+
+def test_simplify_floordiv() -> None:
+    """Test that a floor division is a leaf the backward pass does not visit."""
+    x = Scalar(7.0, requires_grad=True)
+    with simplify():
+        q = x // 2.0
+        y = q * x + 1.0 // x
+    assert q.data == 3.0
+    assert not q.requires_grad
+    assert q._op == Operation.NONE
+    assert y._prev[0]._prev == (q, x)
+    y.backward()
+    assert x._grad == 3.0
+
+
+def test_simplify_no_grad() -> None:
+    """Test that the operations called without gradient are not simplified."""
+    x = Scalar(0.5, requires_grad=True)
+    with simplify(), no_grad():
+        y = x * 1
+    assert y is not x and not y.requires_grad
+
+
+def test_simplify_restores_methods() -> None:
+    """Test that the operators are restored on exit, the contexts being nested."""
+    methods = dict(Scalar.__dict__)
+    x = Scalar(0.5, requires_grad=True)
+    outer, inner = simplify(), simplify()
+    outer.__enter__()
+    outer.__enter__()
+    inner.__enter__()
+    x * 1
+    outer.__exit__(None, None, None)
+    x * 1
+    outer.__exit__(None, None, None)
+    x * 1
+    inner.__exit__(None, None, None)
+
+    assert dict(Scalar.__dict__) == methods
+    # The operations are folded by the innermost context.
+    assert (outer.stats["folded"], inner.stats["folded"]) == (0, 3)
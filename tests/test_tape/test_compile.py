@@ -0,0 +1,56 @@
+"""Test suite for the compilation of the Tape object into Python functions."""
+
+from math import inf
+from nanograd.codegen import generate_source
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+from nanograd.tape import Instruction, trace
+from pytest import raises
+from tests.test_tape.test_replay import eager, model
+
+
+def test_compile_matches_eager() -> None:
+    """Test that the compiled functions give exactly the values of the eager engine."""
+    compiled = trace(model, 0.5, 1.5, 2.5).compile()
+    for values in ((0.5, 1.5, 2.5), (-1.25, 0.75, 3.0), (2.0, -0.5, 1.25)):
+        expected_out, expected_grads = eager(*values)
+        assert compiled.forward(*values) == expected_out
+        assert compiled.value_and_grad(*values) == (expected_out, expected_grads)
+
+
+def test_compile_is_cached() -> None:
+    """Test that a tape is compiled only once."""
+    tape = trace(lambda x: x * x, 3.0)
+
+    assert tape.compile() is tape.compile()
+    assert "3.0" not in generate_source(tape)
+    assert tape.compile().value_and_grad(4.0) == (16.0, [8.0])
+
+
+def test_compile_constants() -> None:
+    """Test the constants that are negative, non-finite or leaves of the graph."""
+    w, y = Scalar(-2.0), Scalar(2.0)
+    compiled = trace(
+        lambda x: (-3.0) ** y + w * x + Scalar.sum([x, -inf]).relu(), 2.0
+    ).compile()
+
+    assert compiled.value_and_grad(1.0) == (7.0, [-2.0])
+
+
+def test_compile_zero_gradient() -> None:
+    """Test that an input only reached through a floor division has a zero gradient."""
+    compiled = trace(lambda x, y: x.exp() // y + x, 1.0, 2.0).compile()
+
+    assert compiled.value_and_grad(1.0, 2.0) == (2.0, [1.0, 0.0])
+
+
+def test_compile_unsupported_operation() -> None:
+    """Test that an operation without generated code raises a ValueError naming it."""
+    tape = trace(lambda x, y: x * y, 1.0, 2.0)
+    ins = tape.instructions[0]
+    tape.instructions[0] = Instruction(
+        Operation.MATRIX_MULTIPLICATION, ins.operands, ins.out
+    )
+
+    with raises(ValueError, match="matmul"):
+        generate_source(tape)
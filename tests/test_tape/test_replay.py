@@ -0,0 +1,47 @@
+"""Test suite for the forward and backward replays of the Tape object."""
+
+from nanograd.scalar import Scalar
+from nanograd.tape import trace
+from pytest import raises
+
+def model(x: Scalar, y: Scalar, z: Scalar) -> Scalar:
+    """Expression using every operation supported by the Scalar object."""
+    a = (x * y + z).tanh() - (z / x) * (z / 2.0) ** 2.0
+    b = Scalar.sum([(~y).exp(), z // 2.0, (-x).relu(), x.relu()])
+    b = Scalar.dot([b, x], [y, z], 0.5)
+    return a * b + 3.0 ** (y / 4.0) - 1.0 / z
+
+
+def eager(*values: float) -> tuple[float, list[float]]:
+    """Evaluate the model and its gradients with the eager engine."""
+    leaves = [Scalar(value, requires_grad=True) for value in values]
+    out = model(*leaves)
+    out.backward()
+    return out.data, [leaf._grad for leaf in leaves]
+
+
+def test_replay_matches_eager() -> None:
+    """Test that replaying the tape gives exactly the values of the eager engine."""
+    tape = trace(model, 0.5, 1.5, 2.5)
+    for values in ((0.5, 1.5, 2.5), (-1.25, 0.75, 3.0), (2.0, -0.5, 1.25)):
+        out = tape.forward(*values)
+        grads = tape.backward()
+        expected_out, expected_grads = eager(*values)
+        assert out == expected_out
+        assert grads == expected_grads
+
+
+def test_replay_backward_is_not_accumulated() -> None:
+    """Test that the gradients of two backward replays do not add up."""
+    tape = trace(lambda x: x * x, 3.0)
+    tape.forward(3.0)
+    tape.backward()
+    tape.forward(3.0)
+    assert tape.backward() == [6.0]
+
+
+def test_replay_wrong_number_of_inputs() -> None:
+    """Test that replaying with a wrong number of inputs raises a ValueError."""
+    tape = trace(lambda x, y: x + y, 1.0, 2.0)
+    with raises(ValueError):
+        tape.forward(1.0)
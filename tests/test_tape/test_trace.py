@@ -0,0 +1,45 @@
+"""Test suite for the trace function."""
+
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+from nanograd.tape import Instruction, Tape, trace
+from pytest import raises
+
+def test_trace_instructions() -> None:
+    """
+    Test that the graph is linearised in topological order, the constants being stored
+    after the nodes.
+    """
+    tape = trace(lambda x, y: (x * y + 1.0).tanh(), 2.0, 3.0)
+
+    assert len(tape) == 3
+    assert tape.inputs == [0, 1]
+    assert tape.instructions == [
+        Instruction(Operation.MULTIPLICATION, (0, 1), 2),
+        Instruction(Operation.ADDITION, (2, 5), 3),
+        Instruction(Operation.HYPERBOLIC_TANGENT, (3,), 4),
+    ]
+    assert tape.output == 4
+    assert tape.values[5] == 1.0
+    assert tape.backward_mask[5] == 0.0
+
+
+def test_trace_not_a_scalar() -> None:
+    """Test that a function not returning a Scalar cannot be traced."""
+    with raises(TypeError):
+        trace(lambda x: 1.0, 2.0)
+
+
+def test_trace_input_not_in_graph() -> None:
+    """Test that an input absent from the graph gets a slot of zero gradient."""
+    x, y = Scalar(1.0, requires_grad=True), Scalar(2.0, requires_grad=True)
+    tape = Tape.from_graph(x.exp(), [x, y])
+    assert tape.inputs == [0, 2]
+    assert tape.values[2] == 2.0
+
+    tape = trace(lambda x, y: x * 2.0, 1.0, 2.0)
+    assert tape.forward(3.0, 5.0) == 6.0
+    assert tape.backward() == [2.0, 0.0]
+    compiled = tape.compile()
+    assert compiled.forward(3.0, 5.0) == 6.0
+    assert compiled.value_and_grad(3.0, 5.0) == (6.0, [2.0, 0.0])
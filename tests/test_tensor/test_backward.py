@@ -0,0 +1,84 @@
+"""Test suite for the backward method of the Tensor object."""
+
+import numpy as np
+from nanograd.grad_mode import no_grad
+from nanograd.scalar import Scalar
+from nanograd.tensor import Tensor
+from pytest import raises
+
+def test_backward_layer() -> None:
+    """Test the backward pass of a dense layer against the Scalar object."""
+    rng = np.random.default_rng(0)
+    x_values, w_values, b_values = (
+        rng.normal(size=(4, 3)), rng.normal(size=(3, 2)), rng.normal(size=2)
+    )
+    x = Tensor(x_values)
+    w = Tensor(w_values, requires_grad=True)
+    b = Tensor(b_values, requires_grad=True)
+    h = (x @ w + b).tanh()
+    loss = (h * h).mean()
+    loss.backward()
+
+    w_s = [[Scalar(v, requires_grad=True) for v in row] for row in w_values]
+    b_s = [Scalar(v, requires_grad=True) for v in b_values]
+    total = Scalar(0.0)
+    for row in x_values:
+        for j in range(2):
+            pre = b_s[j]
+            for k in range(3):
+                pre = pre + row[k] * w_s[k][j]
+            h_s = pre.tanh()
+            total = total + h_s * h_s
+    loss_s = total / 8.0
+    loss_s.backward()
+
+    assert np.isclose(loss.data, loss_s.data)
+    assert np.allclose(w._grad, [[s._grad for s in row] for row in w_s])
+    assert np.allclose(b._grad, [s._grad for s in b_s])
+    assert np.all(x._grad == 0.0)
+
+
+def test_backward_shared_node() -> None:
+    """Test that the gradient of a node used several times is accumulated."""
+    x = Tensor([1.0, 2.0], requires_grad=True)
+    y = x * x + x
+    y.backward()
+
+    assert np.allclose(x._grad, [3.0, 5.0])
+
+
+def test_backward_unsupported_type() -> None:
+    """Test that an unsupported operand raises a TypeError."""
+    x = Tensor([1.0, 2.0], requires_grad=True)
+    with raises(TypeError):
+        x + "1"
+
+
+def test_backward_retain_graph() -> None:
+    """Test that repeated backward passes need retain_graph and accumulate."""
+    x = Tensor([1.0, 2.0], requires_grad=True)
+    y = (x * x).sum()
+    y.backward(retain_graph=True)
+    y.backward()
+
+    assert np.allclose(x._grad, [4.0, 8.0])
+    assert y._prev == ()
+    with raises(RuntimeError):
+        y.backward()
+
+
+def test_backward_lazy_gradient() -> None:
+    """Test that the gradient is only allocated for the tensors receiving one."""
+    x = Tensor(np.ones((3, 2)))
+    w = Tensor(np.full((2, 2), 0.5), requires_grad=True)
+    with no_grad():
+        y = x @ w
+    assert x._grad_array is None and y._grad_array is None
+    assert np.all(x._grad == 0.0)
+
+    out = (x @ w).sum()
+    out.backward(retain_graph=True)
+    assert x._grad_array is None
+    assert np.all(w._grad == 3.0)
+    out.backward()
+    assert np.all(w._grad == 6.0)
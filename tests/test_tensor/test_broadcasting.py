@@ -0,0 +1,37 @@
+"""Test suite for the gradients of broadcast operands of the Tensor object."""
+
+import numpy as np
+from nanograd.tensor import Tensor
+
+def test_broadcasting_row() -> None:
+    """Test that the gradient of a broadcast row is summed over the rows."""
+    x = Tensor(np.arange(6.0).reshape(2, 3), requires_grad=True)
+    b = Tensor([1.0, 2.0, 3.0], requires_grad=True)
+    out = x * b
+    out.backward()
+
+    assert x._grad.shape == (2, 3)
+    assert b._grad.shape == (3,)
+    assert np.allclose(x._grad, np.broadcast_to(b.data, (2, 3)))
+    assert np.allclose(b._grad, x.data.sum(axis=0))
+
+
+def test_broadcasting_column() -> None:
+    """Test that the gradient of a broadcast column is summed over the columns."""
+    x = Tensor(np.arange(6.0).reshape(2, 3), requires_grad=True)
+    b = Tensor([[1.0], [2.0]], requires_grad=True)
+    out = x - b
+    out.backward()
+
+    assert b._grad.shape == (2, 1)
+    assert np.allclose(b._grad, [[-3.0], [-3.0]])
+
+
+def test_broadcasting_python_number() -> None:
+    """Test that a Python number is broadcast against the Tensor object."""
+    x = Tensor([[1.0, 2.0], [3.0, 4.0]], requires_grad=True)
+    out = 2.0 * x + 1
+    out.backward()
+
+    assert np.allclose(out.data, [[3.0, 5.0], [7.0, 9.0]])
+    assert np.allclose(x._grad, 2.0)
@@ -0,0 +1,97 @@
+"""Test suite for the element-wise operators of the Tensor object, checked against Scalar."""
+
+from math import isclose
+import numpy as np
+from nanograd.scalar import Scalar
+from nanograd.tensor import Tensor
+from pytest import mark
+
+UNARY = {
+    "neg": lambda x: -x,
+    "invert": lambda x: ~x,
+    "exp": lambda x: x.exp(),
+    "tanh": lambda x: x.tanh(),
+    "relu": lambda x: x.relu(),
+}
+
+BINARY = {
+    "add": lambda x, y: x + y,
+    "sub": lambda x, y: x - y,
+    "mul": lambda x, y: x * y,
+    "div": lambda x, y: x / y,
+    "floordiv": lambda x, y: x // y,
+    "pow": lambda x, y: x**y,
+}
+
+X = [0.5, -1.5, 2.0, 0.25]
+Y = [1.5, 0.75, 3.0, 2.5]
+
+
+def _scalar_results(fn, *columns):
+    """Compute the output and gradients with Scalar objects, element by element."""
+    outs, grads = [], [[] for _ in columns]
+    for values in zip(*columns):
+        leaves = [Scalar(v, requires_grad=True) for v in values]
+        out = fn(*leaves)
+        out.backward()
+        outs.append(out.data)
+        for grad, leaf in zip(grads, leaves):
+            grad.append(leaf._grad)
+    return outs, grads
+
+
+@mark.parametrize("name", UNARY)
+def test_elementwise_unary(name: str) -> None:
+    """Test the unary operators of the Tensor object against the Scalar object."""
+    fn = UNARY[name]
+    x = Tensor(X, requires_grad=True)
+    out = fn(x)
+    out.backward()
+    outs, (x_grad,) = _scalar_results(fn, X)
+
+    assert np.allclose(out.data, outs)
+    assert np.allclose(x._grad, x_grad)
+
+
+@mark.parametrize("name", BINARY)
+def test_elementwise_binary(name: str) -> None:
+    """Test the binary operators of the Tensor object against the Scalar object."""
+    fn = BINARY[name]
+    x_values = np.abs(X) if name == "pow" else X
+    x = Tensor(x_values, requires_grad=True)
+    y = Tensor(Y, requires_grad=True)
+    out = fn(x, y)
+    out.backward()
+    outs, (x_grad, y_grad) = _scalar_results(fn, x_values, Y)
+
+    assert np.allclose(out.data, outs)
+    assert np.allclose(x._grad, x_grad)
+    assert np.allclose(y._grad, y_grad)
+
+
+def test_elementwise_composite() -> None:
+    """Test a composite expression of the Tensor object against the Scalar object."""
+    def fn(x, y):
+        return ((x * y + 1.0).tanh() - 2.0 / (y**2)).exp().relu()
+
+    x = Tensor(X, requires_grad=True)
+    y = Tensor(Y, requires_grad=True)
+    out = fn(x, y)
+    out.backward()
+    outs, (x_grad, y_grad) = _scalar_results(fn, X, Y)
+
+    assert np.allclose(out.data, outs)
+    assert np.allclose(x._grad, x_grad)
+    assert np.allclose(y._grad, y_grad)
+
+
+def test_elementwise_constant_operand() -> None:
+    """Test that a constant operand does not accumulate any gradient."""
+    x = Tensor(X, requires_grad=True)
+    c = Tensor(Y)
+    out = x * c
+    out.backward()
+
+    assert np.allclose(x._grad, Y)
+    assert np.all(c._grad == 0.0)
+    assert isclose(out.data[0], X[0] * Y[0])
@@ -0,0 +1,58 @@
+"""Test suite for the matmul method of the Tensor object."""
+
+import numpy as np
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+from nanograd.tensor import Tensor
+from pytest import mark
+
+def test_matmul_matrices() -> None:
+    """Test the matrix multiplication of two matrices against the Scalar object."""
+    rng = np.random.default_rng(0)
+    a_values, b_values = rng.normal(size=(2, 3)), rng.normal(size=(3, 4))
+    a = Tensor(a_values, requires_grad=True)
+    b = Tensor(b_values, requires_grad=True)
+    out = a.matmul(b, label='out')
+    out.backward()
+
+    a_s = [[Scalar(v, requires_grad=True) for v in row] for row in a_values]
+    b_s = [[Scalar(v, requires_grad=True) for v in row] for row in b_values]
+    total = Scalar(0.0)
+    for i in range(2):
+        for j in range(4):
+            total = total + sum((a_s[i][k] * b_s[k][j] for k in range(3)), Scalar(0.0))
+    total.backward()
+
+    assert out.label == 'out'
+    assert out._op == Operation.MATRIX_MULTIPLICATION
+    assert np.allclose(out.data, a_values @ b_values)
+    assert np.allclose(a._grad, [[s._grad for s in row] for row in a_s])
+    assert np.allclose(b._grad, [[s._grad for s in row] for row in b_s])
+
+
+@mark.parametrize("a_shape,b_shape", [
+    ((3,), (3,)),
+    ((2, 3), (3,)),
+    ((3,), (3, 4)),
+    ((5, 2, 3), (3, 4)),
+])
+def test_matmul_shapes(a_shape: tuple, b_shape: tuple) -> None:
+    """Test the gradients of the matrix multiplication against finite differences."""
+    rng = np.random.default_rng(1)
+    a_values, b_values = rng.normal(size=a_shape), rng.normal(size=b_shape)
+    a = Tensor(a_values, requires_grad=True)
+    b = Tensor(b_values, requires_grad=True)
+    (a @ b).sum().backward()
+
+    assert a._grad.shape == a_shape
+    assert b._grad.shape == b_shape
+    h = 1e-6
+    for values, grad, other, left in ((a_values, a._grad, b_values, True),
+                                      (b_values, b._grad, a_values, False)):
+        for index in np.ndindex(values.shape):
+            up, down = values.copy(), values.copy()
+            up[index] += h
+            down[index] -= h
+            f_up = (up @ other if left else other @ up).sum()
+            f_down = (down @ other if left else other @ down).sum()
+            assert np.isclose(grad[index], (f_up - f_down) / (2 * h), atol=1e-6)
@@ -0,0 +1,47 @@
+"""Test suite for the sum and mean methods of the Tensor object."""
+
+import numpy as np
+from nanograd.enums import Operation
+from nanograd.tensor import Tensor
+
+def test_sum_all() -> None:
+    """Test the sum over all the elements."""
+    x = Tensor(np.arange(6.0).reshape(2, 3), requires_grad=True)
+    out = x.sum(label='out')
+    out.backward()
+
+    assert out.label == 'out'
+    assert out._op == Operation.SUM
+    assert out.data == 15.0
+    assert np.all(x._grad == 1.0)
+
+
+def test_sum_axis() -> None:
+    """Test the sum over one axis."""
+    x = Tensor(np.arange(6.0).reshape(2, 3), requires_grad=True)
+    w = Tensor([1.0, 2.0], requires_grad=True)
+    out = (x.sum(axis=1) * w).sum()
+    out.backward()
+
+    assert np.allclose(x._grad, [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]])
+    assert np.allclose(w._grad, [3.0, 12.0])
+
+
+def test_mean_all() -> None:
+    """Test the mean over all the elements."""
+    x = Tensor(np.arange(6.0).reshape(2, 3), requires_grad=True)
+    out = x.mean()
+    out.backward()
+
+    assert out._op == Operation.MEAN
+    assert out.data == 2.5
+    assert np.allclose(x._grad, 1.0 / 6.0)
+
+
+def test_mean_axis() -> None:
+    """Test the mean over one axis."""
+    x = Tensor(np.arange(6.0).reshape(2, 3), requires_grad=True)
+    out = (x.mean(axis=0) ** 2).sum()
+    out.backward()
+
+    assert np.allclose(x._grad, np.broadcast_to(x.data.mean(axis=0), (2, 3)))
@@ -0,0 +1,50 @@
+"""Test suite for the graph statistics function."""
+
+from nanograd.enums import Operation
+from nanograd.scalar import Scalar
+from nanograd.utils import graph_stats
+from sys import getrecursionlimit
+
+
+def test_graph_stats() -> None:
+    """Test the statistics of a small graph."""
+    x = Scalar(1.0, label='x')
+    w = Scalar(-0.5, label='w')
+    b = Scalar(2.0, label='b')
+    xw = x * w
+    out = Scalar.sum([xw, xw * 2.0, b, 1.0]).tanh()
+    stats = graph_stats(out)
+
+    assert stats.nodes == 7
+    assert stats.leaves == 3
+    assert stats.constants == 2
+    assert stats.ops == {
+        Operation.NONE: 3,
+        Operation.MULTIPLICATION: 2,
+        Operation.SUM: 1,
+        Operation.HYPERBOLIC_TANGENT: 1,
+    }
+    assert stats.depth == 5
+    assert stats.max_fan_in == 3
+    assert stats.max_fan_out == 2
+    assert stats.bytes > 7 * 24
+
+
+def test_graph_stats_leaf() -> None:
+    """Test the statistics of a graph made of a single leaf."""
+    stats = graph_stats(Scalar(1.0))
+
+    assert (stats.nodes, stats.leaves, stats.depth) == (1, 1, 1)
+    assert (stats.max_fan_in, stats.max_fan_out, stats.constants) == (0, 0, 0)
+
+
+def test_graph_stats_deep_graph() -> None:
+    """Test that the statistics of a deep graph do not hit the recursion limit."""
+    x = Scalar(0.5)
+    out = x
+    for _ in range(10 * getrecursionlimit()):
+        out = out + x
+
+    stats = graph_stats(out)
+    assert stats.depth == 10 * getrecursionlimit() + 1
+    assert stats.max_fan_out == 10 * getrecursionlimit() + 1
@@ -3,6 +3,7 @@
 from nanograd.scalar import Scalar
 from nanograd.utils import topological_sort
 from ordered_set import OrderedSet
+from sys import getrecursionlimit
 
 def test_topological_sort() -> None:
     """Test of the topological sort function."""
@@ -19,3 +20,27 @@ def test_topological_sort() -> None:
     topo = topological_sort(out)
     
     assert topo == OrderedSet([x1, w1, x1w1, x2, w2, x2w2, x1w1x2w2, b, x1w1x2w2b, out])
+
+
+def test_topological_sort_deep_graph() -> None:
+    """Test that the topological sort does not hit the recursion limit."""
+    x = Scalar(0.5, label='x')
+    out = x
+    for _ in range(10 * getrecursionlimit()):
+        out = out.neg()
+    topo = topological_sort(out)
+
+    assert len(topo) == 10 * getrecursionlimit() + 1
+    assert topo[0] is x
+    assert topo[-1] is out
+
+
+def test_topological_sort_shared_nodes() -> None:
+    """Test that a node reachable through several paths is emitted once."""
+    x = Scalar(2.0, label='x')
+    y = x.mul(x, label='y')
+    z = y.add(x, label='z')
+    out = z.mul(y, label='out')
+    topo = topological_sort(out)
+
+    assert topo == OrderedSet([x, y, z, out])
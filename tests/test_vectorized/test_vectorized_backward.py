@@ -0,0 +1,70 @@
+"""Test suite for the level-scheduled backward pass."""
+
+import random
+from math import isclose
+from nanograd.nn import MLP
+from nanograd.scalar import Scalar
+from nanograd.vectorized import vectorized_backward
+from pytest import raises
+
+def model(x: Scalar, y: Scalar, z: Scalar) -> Scalar:
+    """Expression using every operation supported by the Scalar object."""
+    a = (x * y + z).tanh() - (z / x) * (z / 2.0) ** 2.0
+    b = Scalar.sum([(~y).exp(), z // 2.0, (-x).relu(), x.relu(), x])
+    b = Scalar.dot([b, x], [y, 2.0], 0.5)
+    return a * b + 3.0 ** (y / 4.0) - 1.0 / z + x**y
+
+
+def grads(values: tuple[float, ...], vectorized: bool) -> list[float]:
+    """Gradients of the model with respect to its inputs."""
+    leaves = [Scalar(value, requires_grad=True) for value in values]
+    out = model(*leaves)
+    if vectorized:
+        vectorized_backward(out)
+    else:
+        out.backward()
+    return [leaf._grad for leaf in leaves]
+
+
+def test_vectorized_backward_matches_reference() -> None:
+    """Test that the gradients match the ones of the reference backward pass."""
+    for values in ((0.5, 1.5, 2.5), (1.25, 0.75, 3.0), (2.0, -0.5, 1.25)):
+        for g, expected in zip(grads(values, True), grads(values, False)):
+            assert isclose(g, expected, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_vectorized_backward_mlp() -> None:
+    """Test the gradients of the parameters of an MLP over a batch."""
+    random.seed(0)
+    model, ref = MLP(3, [4, 4, 1]), MLP(3, [4, 4, 1])
+    for p, q in zip(model.parameters(), ref.parameters()):
+        q.data = p.data
+    batch = [[random.uniform(-1.0, 1.0) for _ in range(3)] for _ in range(8)]
+    vectorized_backward(Scalar.sum([model(xs)[0] ** 2 for xs in batch]))
+    Scalar.sum([ref(xs)[0] ** 2 for xs in batch]).backward()
+    for p, q in zip(model.parameters(), ref.parameters()):
+        assert isclose(p._grad, q._grad, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_vectorized_backward_intermediate_grads() -> None:
+    """Test that the intermediate nodes get their gradient and the leaves accumulate."""
+    x = Scalar(3.0, requires_grad=True)
+    y = x * x
+    z = y + x
+    vectorized_backward(z, retain_graph=True)
+    vectorized_backward(z, retain_graph=True)
+
+    assert z._grad == 1.0
+    assert y._grad == 1.0
+    assert x._grad == 14.0
+
+
+def test_vectorized_backward_frees_graph() -> None:
+    """Test that the graph is freed unless it is retained."""
+    x = Scalar(3.0, requires_grad=True)
+    z = x.exp() * 2.0
+    vectorized_backward(z)
+
+    assert z._prev == ()
+    with raises(RuntimeError):
+        vectorized_backward(z)